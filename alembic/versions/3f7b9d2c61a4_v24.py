@@ -0,0 +1,77 @@
+"""v24
+
+Revision ID: 3f7b9d2c61a4
+Revises: 8a41d6c3e2b7
+Create Date: 2026-10-18 15:22:19.836866
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3f7b9d2c61a4'
+down_revision: Union[str, None] = '8a41d6c3e2b7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 연차 원장 (추가만 함)
+    op.create_table('leave_ledger',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('entry_type', sa.Enum('opening', 'grant', 'manual', 'request', 'approve', 'reject', 'cancel', name='leave_ledger_type'), nullable=False),
+    sa.Column('leave_history_id', sa.Integer(), nullable=True),
+    sa.Column('granted_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('used_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('pending_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('memo', sa.String(length=255), nullable=True),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['leave_history_id'], ['leave_histories.id'], ),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index('idx_leave_ledger_user_id_year', 'leave_ledger', ['user_id', 'year'], unique=False)
+
+    # 사용자별 연도별 연차 잔여 (원장 합계의 스냅샷)
+    op.create_table('user_leave_balances',
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('granted_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('used_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('pending_days', sa.Numeric(precision=10, scale=2), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('user_id', 'year')
+    )
+
+    # 기초 잔여: 현재 잔여 연차 수를 올해 부여 일수로, 승인 대기 중인 신청은 신청 연도의 대기 일수로 기록
+    op.execute("""
+        INSERT INTO leave_ledger (user_id, year, entry_type, granted_days, used_days, pending_days, memo, created_at)
+        SELECT id, YEAR(CURDATE()), 'opening', COALESCE(total_leave_days, 0), 0, 0, '기초 잔여', NOW()
+        FROM users
+        WHERE deleted_yn = 'N'
+    """)
+    op.execute("""
+        INSERT INTO leave_ledger (user_id, year, entry_type, leave_history_id, granted_days, used_days, pending_days, memo, created_at)
+        SELECT user_id, YEAR(application_date), 'opening', id, 0, 0, COALESCE(decreased_days, 0), '기초 승인 대기', NOW()
+        FROM leave_histories
+        WHERE status = 'pending' AND deleted_yn = 'N'
+    """)
+    op.execute("""
+        INSERT INTO user_leave_balances (user_id, year, granted_days, used_days, pending_days, created_at, updated_at)
+        SELECT user_id, year, SUM(granted_days), SUM(used_days), SUM(pending_days), NOW(), NOW()
+        FROM leave_ledger
+        GROUP BY user_id, year
+    """)
+
+
+def downgrade() -> None:
+    op.drop_table('user_leave_balances')
+    op.drop_index('idx_leave_ledger_user_id_year', table_name='leave_ledger')
+    op.drop_table('leave_ledger')
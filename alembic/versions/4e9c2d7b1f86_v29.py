@@ -0,0 +1,30 @@
+"""v29
+
+Revision ID: 4e9c2d7b1f86
+Revises: c81f5a3e7d29
+Create Date: 2026-10-18 23:05:12.384610
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4e9c2d7b1f86'
+down_revision: Union[str, None] = 'c81f5a3e7d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 출근 날짜 (STORED 생성 컬럼이라 추가 시 기존 행도 clock_in 기준으로 채워짐)
+    op.add_column('commutes', sa.Column('commute_date', sa.Date(), sa.Computed('date(clock_in)', persisted=True), nullable=True))
+    # 날짜 단위 출퇴근 조회용 인덱스
+    op.create_index('idx_commutes_user_id_commute_date', 'commutes', ['user_id', 'commute_date', 'deleted_yn'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_commutes_user_id_commute_date', table_name='commutes')
+    op.drop_column('commutes', 'commute_date')
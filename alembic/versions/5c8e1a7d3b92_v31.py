@@ -0,0 +1,49 @@
+"""v31
+
+Revision ID: 5c8e1a7d3b92
+Revises: 9b2e6f4c8a17
+Create Date: 2026-10-19 15:21:47.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e1a7d3b92'
+down_revision: Union[str, None] = '9b2e6f4c8a17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 승인 시점의 수당 (반려 시 차감액, 월간 오버타임 재계산 기준)
+    op.add_column('overtimes', sa.Column('approved_money', sa.Integer(), nullable=True))
+
+    # 기존 승인 건은 현재 정책 금액으로 채움 (지점별 첫 정책, 파트가 없거나 삭제되었으면 일반 수당, 정책이 없으면 NULL)
+    op.execute("""
+        UPDATE overtimes
+        JOIN users ON users.id = overtimes.applicant_id
+        LEFT JOIN parts ON parts.id = users.part_id AND parts.deleted_yn = 'N'
+        JOIN (
+            SELECT MIN(overtime_policies.id) AS id
+            FROM overtime_policies
+            JOIN branches ON branches.id = overtime_policies.branch_id AND branches.deleted_yn = 'N'
+            WHERE overtime_policies.deleted_yn = 'N'
+            GROUP BY overtime_policies.branch_id
+        ) first_policy
+        JOIN overtime_policies policy ON policy.id = first_policy.id AND policy.branch_id = users.branch_id
+        SET overtimes.approved_money = COALESCE(CASE overtimes.overtime_hours
+            WHEN '30' THEN IF(parts.is_doctor, policy.doctor_ot_30, policy.common_ot_30)
+            WHEN '60' THEN IF(parts.is_doctor, policy.doctor_ot_60, policy.common_ot_60)
+            WHEN '90' THEN IF(parts.is_doctor, policy.doctor_ot_90, policy.common_ot_90)
+            WHEN '120' THEN IF(parts.is_doctor, policy.doctor_ot_120, policy.common_ot_120)
+        END, 0)
+        WHERE overtimes.status = 'approved'
+    """)
+
+
+def downgrade() -> None:
+    op.drop_column('overtimes', 'approved_money')
@@ -0,0 +1,33 @@
+"""v22
+
+Revision ID: 5e0c2a7b9f14
+Revises: d3bdc1a85bc2
+Create Date: 2026-10-18 10:12:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e0c2a7b9f14'
+down_revision: Union[str, None] = 'd3bdc1a85bc2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 월/연 범위 조회(반열린 구간)용 복합 인덱스
+    op.create_index('idx_commutes_user_id_clock_in', 'commutes', ['user_id', 'clock_in', 'deleted_yn'], unique=False)
+    op.create_index('idx_overtimes_applicant_id_application_date', 'overtimes', ['applicant_id', 'application_date'], unique=False)
+    op.create_index('idx_leave_history_user_id_status_application_date', 'leave_histories', ['user_id', 'status', 'application_date'], unique=False)
+    op.create_index('idx_closed_days_branch_id_closed_day_date', 'closed_days', ['branch_id', 'closed_day_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_closed_days_branch_id_closed_day_date', table_name='closed_days')
+    op.drop_index('idx_leave_history_user_id_status_application_date', table_name='leave_histories')
+    op.drop_index('idx_overtimes_applicant_id_application_date', table_name='overtimes')
+    op.drop_index('idx_commutes_user_id_clock_in', table_name='commutes')
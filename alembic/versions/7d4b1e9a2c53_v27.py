@@ -0,0 +1,58 @@
+"""v27
+
+Revision ID: 7d4b1e9a2c53
+Revises: e9a3c5d18f62
+Create Date: 2026-10-18 20:41:09.318246
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d4b1e9a2c53'
+down_revision: Union[str, None] = 'e9a3c5d18f62'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 중복 휴무일 정리: 같은 (지점, 직원, 날짜) 중 삭제되지 않은 행 우선, 그다음 가장 최근 행만 남김
+    op.execute("""
+        DELETE a FROM closed_days a
+        JOIN closed_days b
+          ON b.branch_id <=> a.branch_id
+         AND COALESCE(b.user_id, 0) = COALESCE(a.user_id, 0)
+         AND b.closed_day_date = a.closed_day_date
+         AND (
+              (b.deleted_yn <=> 'N') > (a.deleted_yn <=> 'N')
+           OR ((b.deleted_yn <=> 'N') = (a.deleted_yn <=> 'N') AND b.id > a.id)
+         )
+    """)
+    # 지점 휴무일(user_id NULL)도 중복으로 판단되도록 NULL을 0으로 바꾼 생성 컬럼으로 유니크 키 구성
+    op.add_column('closed_days', sa.Column('user_key', sa.Integer(), sa.Computed('coalesce(user_id, 0)', persisted=True), nullable=True))
+    op.create_unique_constraint('uq_closed_days_branch_id_user_key_closed_day_date', 'closed_days', ['branch_id', 'user_key', 'closed_day_date'])
+
+    # 중복 조기 출근 정리: 직원별 하루 한 건
+    op.execute("""
+        DELETE a FROM early_clock_in a
+        JOIN early_clock_in b
+          ON b.branch_id <=> a.branch_id
+         AND b.user_id <=> a.user_id
+         AND DATE(b.early_clock_in) = DATE(a.early_clock_in)
+         AND (
+              (b.deleted_yn <=> 'N') > (a.deleted_yn <=> 'N')
+           OR ((b.deleted_yn <=> 'N') = (a.deleted_yn <=> 'N') AND b.id > a.id)
+         )
+    """)
+    op.add_column('early_clock_in', sa.Column('early_clock_in_date', sa.Date(), sa.Computed('date(early_clock_in)', persisted=True), nullable=True))
+    op.create_unique_constraint('uq_early_clock_in_branch_id_user_id_early_clock_in_date', 'early_clock_in', ['branch_id', 'user_id', 'early_clock_in_date'])
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_early_clock_in_branch_id_user_id_early_clock_in_date', 'early_clock_in', type_='unique')
+    op.drop_column('early_clock_in', 'early_clock_in_date')
+    op.drop_constraint('uq_closed_days_branch_id_user_key_closed_day_date', 'closed_days', type_='unique')
+    op.drop_column('closed_days', 'user_key')
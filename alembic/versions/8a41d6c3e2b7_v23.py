@@ -0,0 +1,45 @@
+"""v23
+
+Revision ID: 8a41d6c3e2b7
+Revises: 5e0c2a7b9f14
+Create Date: 2026-10-18 14:05:22.604118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a41d6c3e2b7'
+down_revision: Union[str, None] = '5e0c2a7b9f14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 월간 오버타임 집계 (데이터는 python -m app.service.overtime_summary_service 로 채움)
+    op.create_table('overtime_monthly_summaries',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('ot_30_count', sa.Integer(), nullable=False),
+    sa.Column('ot_60_count', sa.Integer(), nullable=False),
+    sa.Column('ot_90_count', sa.Integer(), nullable=False),
+    sa.Column('ot_120_count', sa.Integer(), nullable=False),
+    sa.Column('ot_30_money', sa.Integer(), nullable=False),
+    sa.Column('ot_60_money', sa.Integer(), nullable=False),
+    sa.Column('ot_90_money', sa.Integer(), nullable=False),
+    sa.Column('ot_120_money', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'year', 'month', name='uq_overtime_monthly_summaries_user_id_year_month')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('overtime_monthly_summaries')
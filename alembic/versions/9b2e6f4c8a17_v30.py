@@ -0,0 +1,79 @@
+"""v30
+
+Revision ID: 9b2e6f4c8a17
+Revises: 4e9c2d7b1f86
+Create Date: 2026-10-19 10:42:08.217935
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b2e6f4c8a17'
+down_revision: Union[str, None] = '4e9c2d7b1f86'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OLD_ENTRY_TYPES = ('opening', 'grant', 'manual', 'request', 'approve', 'reject', 'cancel')
+NEW_ENTRY_TYPES = OLD_ENTRY_TYPES + ('expire',)
+CARRY_MEMO = '승인 대기 이월'
+
+
+def upgrade() -> None:
+    # 연차 원장 유형에 잔여 소멸(초기화 방식의 자동 부여) 추가
+    op.alter_column('leave_ledger', 'entry_type',
+               existing_type=mysql.ENUM(*OLD_ENTRY_TYPES),
+               type_=mysql.ENUM(*NEW_ENTRY_TYPES),
+               existing_nullable=False)
+
+    # v24 기초 원장이 신청 연도에 기록한 승인 대기 일수를 사용자의 최근 잔여 연도로 옮김
+    # (원장 연도는 기록하는 날 기준이므로 대기 중인 신청의 승인/삭제는 최근 연도에서 차감됨)
+    op.execute(f"""
+        INSERT INTO leave_ledger (user_id, year, entry_type, leave_history_id, granted_days, used_days, pending_days, memo, created_at)
+        SELECT moved.user_id, moved.year, 'opening', moved.leave_history_id, 0, 0, moved.pending_days, '{CARRY_MEMO}', NOW()
+        FROM (
+            SELECT ledger.user_id, ledger.year, ledger.leave_history_id, -ledger.pending_days AS pending_days
+            FROM leave_ledger ledger
+            JOIN leave_histories ON leave_histories.id = ledger.leave_history_id
+            JOIN (SELECT user_id, MAX(year) AS year FROM user_leave_balances GROUP BY user_id) latest ON latest.user_id = ledger.user_id
+            WHERE ledger.entry_type = 'opening' AND ledger.year < latest.year
+              AND leave_histories.status = 'pending' AND leave_histories.deleted_yn = 'N'
+            UNION ALL
+            SELECT ledger.user_id, latest.year, ledger.leave_history_id, ledger.pending_days
+            FROM leave_ledger ledger
+            JOIN leave_histories ON leave_histories.id = ledger.leave_history_id
+            JOIN (SELECT user_id, MAX(year) AS year FROM user_leave_balances GROUP BY user_id) latest ON latest.user_id = ledger.user_id
+            WHERE ledger.entry_type = 'opening' AND ledger.year < latest.year
+              AND leave_histories.status = 'pending' AND leave_histories.deleted_yn = 'N'
+        ) moved
+    """)
+    op.execute(f"""
+        INSERT INTO user_leave_balances (user_id, year, granted_days, used_days, pending_days, created_at, updated_at)
+        SELECT user_id, year, 0, 0, SUM(pending_days), NOW(), NOW()
+        FROM leave_ledger
+        WHERE memo = '{CARRY_MEMO}'
+        GROUP BY user_id, year
+        ON DUPLICATE KEY UPDATE pending_days = user_leave_balances.pending_days + VALUES(pending_days), updated_at = NOW()
+    """)
+
+
+def downgrade() -> None:
+    op.execute(f"""
+        UPDATE user_leave_balances balances
+        JOIN (
+            SELECT user_id, year, SUM(pending_days) AS pending_days
+            FROM leave_ledger
+            WHERE memo = '{CARRY_MEMO}'
+            GROUP BY user_id, year
+        ) moved ON moved.user_id = balances.user_id AND moved.year = balances.year
+        SET balances.pending_days = balances.pending_days - moved.pending_days
+    """)
+    op.execute(f"DELETE FROM leave_ledger WHERE memo = '{CARRY_MEMO}'")
+    op.alter_column('leave_ledger', 'entry_type',
+               existing_type=mysql.ENUM(*NEW_ENTRY_TYPES),
+               type_=mysql.ENUM(*OLD_ENTRY_TYPES),
+               existing_nullable=False)
@@ -0,0 +1,36 @@
+"""v25
+
+Revision ID: b52e8f1d7c30
+Revises: 3f7b9d2c61a4
+Create Date: 2026-10-18 16:48:03.271945
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b52e8f1d7c30'
+down_revision: Union[str, None] = '3f7b9d2c61a4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 지점별 자동 연차 부여 실행 기록 (같은 날 재실행 시 중복 부여 방지)
+    op.create_table('annual_leave_grant_runs',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('branch_id', sa.Integer(), nullable=False),
+    sa.Column('grant_date', sa.Date(), nullable=False),
+    sa.Column('granted_count', sa.Integer(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['branch_id'], ['branches.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('branch_id', 'grant_date', name='uq_annual_leave_grant_runs_branch_id_grant_date')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('annual_leave_grant_runs')
@@ -0,0 +1,43 @@
+"""v28
+
+Revision ID: c81f5a3e7d29
+Revises: 7d4b1e9a2c53
+Create Date: 2026-10-18 22:17:43.551902
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f5a3e7d29'
+down_revision: Union[str, None] = '7d4b1e9a2c53'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 사용자별 월간 근태 집계 (데이터는 python -m app.service.attendance_summary_service 로 채움)
+    op.create_table('attendance_monthly_summaries',
+    sa.Column('id', sa.Integer(), autoincrement=True, nullable=False),
+    sa.Column('user_id', sa.Integer(), nullable=False),
+    sa.Column('year', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Integer(), nullable=False),
+    sa.Column('work_days', sa.Integer(), nullable=False),
+    sa.Column('regular_leave_days', sa.Integer(), nullable=False),
+    sa.Column('annual_leave_days', sa.Integer(), nullable=False),
+    sa.Column('unpaid_leave_days', sa.Integer(), nullable=False),
+    sa.Column('holiday_work_days', sa.Integer(), nullable=False),
+    sa.Column('weekend_work_hours', sa.Float(), nullable=False),
+    sa.Column('created_at', sa.DateTime(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(), nullable=True),
+    sa.ForeignKeyConstraint(['user_id'], ['users.id'], ),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('user_id', 'year', 'month', name='uq_attendance_monthly_summaries_user_id_year_month')
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('attendance_monthly_summaries')
@@ -0,0 +1,29 @@
+"""v26
+
+Revision ID: e9a3c5d18f62
+Revises: b52e8f1d7c30
+Create Date: 2026-10-18 18:05:27.604193
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e9a3c5d18f62'
+down_revision: Union[str, None] = 'b52e8f1d7c30'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # 월과 겹치는 기간 조회(start_date < 다음 달 월초 AND end_date >= 월초)용 복합 인덱스
+    op.create_index('idx_leave_history_user_id_start_date_end_date', 'leave_histories', ['user_id', 'start_date', 'end_date'], unique=False)
+    op.create_index('idx_time_offs_user_id_start_date_end_date', 'time_offs', ['user_id', 'start_date', 'end_date'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_time_offs_user_id_start_date_end_date', table_name='time_offs')
+    op.drop_index('idx_leave_history_user_id_start_date_end_date', table_name='leave_histories')
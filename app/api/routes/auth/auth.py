@@ -1,6 +1,5 @@
 from typing import Annotated
 
-import bcrypt
 from fastapi import APIRouter, Depends, Response, HTTPException
 from fastapi.responses import JSONResponse
 from sqlalchemy.future import select
@@ -11,21 +10,21 @@ from app.middleware.jwt.jwtService import JWTDecoder, JWTEncoder, JWTService
 from app.middleware.tokenVerify import validate_token, get_current_user
 from app.models.users.users_model import Users
 from app.enums.users import Role
+from app.service.password_service import password_service
 from sqlalchemy.ext.asyncio import AsyncSession
 
 router = APIRouter()
 # users = async_session()
 
 
-# 패스워드 hash 함수
-def hashPassword(password: str):
-    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt(rounds=12))
+# 패스워드 hash 함수 (bcrypt는 스레드풀에서 실행되어 이벤트 루프를 막지 않음)
+async def hashPassword(password: str) -> str:
+    return await password_service.hash_password(password)
 
 
 # 비밀번호 비교
-def verifyPassword(password: str, hashed_password: str) -> bool:
-    return password == hashed_password
-    # return bcrypt.checkpw(password.encode("utf-8"), hashed_password.encode("utf-8"))
+async def verifyPassword(password: str, hashed_password: str) -> bool:
+    return await password_service.verify_password(password, hashed_password)
 
 
 # 회원가입
@@ -76,11 +75,15 @@ async def login(login: Login, res : Response, users: AsyncSession = Depends(get_
         if findUser is None:
             return JSONResponse(status_code=404, content="유저가 존재하지 않습니다.")
 
-        if not verifyPassword(login.password, findUser.password):
+        if not await verifyPassword(login.password, findUser.password):
             return JSONResponse(
                 status_code=400, content="패스워드가 일치하지 않습니다."
             )
 
+        # 평문으로 저장된 기존 비밀번호는 로그인 성공 시 해시로 교체
+        if not password_service.is_hashed(findUser.password):
+            findUser.password = await hashPassword(login.password)
+
         # 퇴사자/휴직자 체크
         if findUser.role in [Role.RESIGNED.value, Role.ON_LEAVE.value]:
             return JSONResponse(
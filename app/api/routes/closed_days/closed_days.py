@@ -9,11 +9,14 @@ from app.core.database import get_db
 from app.core.permissions.auth_utils import available_higher_than
 from app.enums.users import Role
 from app.middleware.tokenVerify import get_current_user, validate_token
-from app.models.closed_days.closed_days_model import ClosedDays, BranchClosedDay, EarlyClockIn, UserClosedDays, UserEarlyClockIn
+from app.cruds.closed_days import closed_days_crud
+from app.models.closed_days.closed_days_model import ClosedDays, BranchClosedDay, BranchesClosedDay, UserClosedDays, UserEarlyClockIn
 from app.models.branches.work_policies_model import WorkPolicies
 from app.models.users.users_model import Users
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.service.attendance_summary_service import month_keys, refresh_attendance_summaries
+from app.service.closed_day_calendar_cache import closed_day_calendar_cache
 from app.service.closed_day_service import ClosedDayService
 
 router = APIRouter()
@@ -50,33 +53,14 @@ async def create_branch_closed_day(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        for day_item in closed_days.hospital_closed_days:
-            # 기존 삭제된 데이터가 있는지 확인
-            stmt = select(ClosedDays).where(
-                and_(
-                    ClosedDays.branch_id == branch_id,
-                    ClosedDays.closed_day_date == day_item,
-                    ClosedDays.user_id.is_(None),
-                    ClosedDays.deleted_yn == 'Y'
-                )
-            )
-            result = await db.execute(stmt)
-            existing_closed_day = result.scalar_one_or_none()
-
-            if existing_closed_day:
-                # 기존 데이터가 있다면 복구
-                existing_closed_day.deleted_yn = 'N'
-                existing_closed_day.memo = "임시 휴점"
-            else:
-                # 새로운 데이터 생성
-                new_closed_day = ClosedDays(
-                    branch_id=branch_id,
-                    closed_day_date=day_item,
-                    memo = "임시 휴점",
-                )
-                db.add(new_closed_day)
-
+        # 삭제된 휴무일은 복구, 없는 날짜만 새로 생성 (한 번의 upsert)
+        await closed_days_crud.upsert_closed_days(db, [
+            {"branch_id": branch_id, "closed_day_date": day_item, "memo": "임시 휴점"}
+            for day_item in set(closed_days.hospital_closed_days)
+        ])
         await db.commit()
+        await refresh_attendance_summaries(db, month_keys(closed_days.hospital_closed_days), branch_ids=[branch_id])
+        closed_day_calendar_cache.invalidate(branch_id)
         return {"message": "휴무일이 성공적으로 생성되었습니다."}
     
     except Exception as err:
@@ -84,6 +68,42 @@ async def create_branch_closed_day(
         raise HTTPException(status_code=500, detail=str(err))
 
 
+# 여러 지점 휴점일 일괄 생성 (MSO)
+@router.post("/closed-days/bulk", status_code=201)
+@available_higher_than(Role.MSO)
+async def create_branches_closed_day(
+    request: Request,
+    closed_days: BranchesClosedDay,
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        branch_ids = set(closed_days.branch_ids)
+        missing_branch_ids = branch_ids - await closed_days_crud.find_branch_ids(db, list(branch_ids))
+        if missing_branch_ids:
+            raise HTTPException(
+                status_code=404,
+                detail=f"다음 지점을 찾을 수 없습니다: {', '.join(map(str, sorted(missing_branch_ids)))}"
+            )
+
+        # 지점 x 날짜를 한 번의 upsert로 등록
+        await closed_days_crud.upsert_closed_days(db, [
+            {"branch_id": branch_id, "closed_day_date": day_item, "memo": "임시 휴점"}
+            for branch_id in branch_ids
+            for day_item in set(closed_days.hospital_closed_days)
+        ])
+        await db.commit()
+        await refresh_attendance_summaries(db, month_keys(closed_days.hospital_closed_days), branch_ids=branch_ids)
+        closed_day_calendar_cache.invalidate(*branch_ids)
+        return {"message": "휴무일이 성공적으로 생성되었습니다.", "branch_ids": sorted(branch_ids)}
+
+    except HTTPException as http_err:
+        await db.rollback()
+        raise http_err
+    except Exception as err:
+        await db.rollback()
+        raise HTTPException(status_code=500, detail=str(err))
+
+
 # 지점 휴점일 삭제 (관리자)
 @router.delete("/{branch_id}/closed-days")
 @available_higher_than(Role.INTEGRATED_ADMIN)
@@ -128,6 +148,8 @@ async def delete_branch_closed_days(
         )
         await db.execute(update_stmt)
         await db.commit()
+        await refresh_attendance_summaries(db, month_keys(existing_dates), branch_ids=[branch_id])
+        closed_day_calendar_cache.invalidate(branch_id)
 
         return {"message": "휴무일이 성공적으로 삭제되었습니다."}
 
@@ -174,53 +196,28 @@ async def create_employee_closed_day(
                 detail=f"다음 날짜는 지점 휴무일이므로 직원 휴무를 등록할 수 없습니다: {', '.join(formatted_dates)}"
             )
             
-        # 각 유저별로 처리
-        for user_id, days in closed_days.user_closed_days.items():
-            # 해당 직원이 이 지점 소속인지 확인
-            stmt = select(Users).where(
-                and_(
-                    Users.id == user_id,
-                    Users.branch_id == branch_id,
-                    Users.deleted_yn == 'N'
-                )
-            )
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
-            
-            if not user:
+        # 요청한 직원이 모두 이 지점 소속인지 확인
+        branch_user_ids = await closed_days_crud.find_branch_user_ids(db, branch_id, list(closed_days.user_closed_days))
+        for user_id in closed_days.user_closed_days:
+            if user_id not in branch_user_ids:
                 raise HTTPException(
                     status_code=403, 
                     detail=f"사용자 ID {user_id}는 해당 지점의 직원이 아닙니다."
                 )
 
-            for day_item in days:
-                # 기존 삭제된 데이터 확인
-                stmt = select(ClosedDays).where(
-                    and_(
-                        ClosedDays.branch_id == branch_id,
-                        ClosedDays.closed_day_date == day_item,
-                        ClosedDays.user_id == user_id,
-                        ClosedDays.deleted_yn == 'Y'
-                    )
-                )
-                result = await db.execute(stmt)
-                existing_closed_day = result.scalar_one_or_none()
-
-                if existing_closed_day:
-                    # 기존 데이터 복구
-                    existing_closed_day.deleted_yn = 'N'
-                    existing_closed_day.memo = "직원 휴무"
-                else:
-                    # 새로운 데이터 생성
-                    new_closed_day = ClosedDays(
-                        branch_id=branch_id,
-                        user_id=user_id,
-                        closed_day_date=day_item,
-                        memo="직원 휴무",
-                    )
-                    db.add(new_closed_day)
-
+        # 삭제된 휴무일은 복구, 없는 날짜만 새로 생성 (한 번의 upsert)
+        await closed_days_crud.upsert_closed_days(db, [
+            {"branch_id": branch_id, "user_id": user_id, "closed_day_date": day_item, "memo": "직원 휴무"}
+            for user_id, days in closed_days.user_closed_days.items()
+            for day_item in set(days)
+        ])
         await db.commit()
+        await refresh_attendance_summaries(
+            db,
+            month_keys(day_item for days in closed_days.user_closed_days.values() for day_item in days),
+            user_ids=closed_days.user_closed_days
+        )
+        closed_day_calendar_cache.invalidate(branch_id)
         return {"message": "직원 휴무일이 성공적으로 생성되었습니다."}
     
     except HTTPException as http_err:
@@ -240,58 +237,32 @@ async def delete_employee_closed_days(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        for user_id, dates_to_delete in closed_days.user_closed_days.items():
-            # 해당 직원이 이 지점 소속인지 확인
-            stmt = select(Users).where(
-                and_(
-                    Users.id == user_id,
-                    Users.branch_id == branch_id,
-                    Users.deleted_yn == 'N'
-                )
-            )
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
-            
-            if not user:
+        # 요청한 직원이 모두 이 지점 소속인지 확인
+        branch_user_ids = await closed_days_crud.find_branch_user_ids(db, branch_id, list(closed_days.user_closed_days))
+        # 삭제할 레코드 확인
+        existing_closed_days = await closed_days_crud.find_user_closed_days(db, branch_id, closed_days.user_closed_days)
+        existing_user_ids = {user_id for user_id, _ in existing_closed_days}
+
+        for user_id in closed_days.user_closed_days:
+            if user_id not in branch_user_ids:
                 raise HTTPException(
                     status_code=403, 
                     detail=f"사용자 ID {user_id}는 해당 지점의 직원이 아닙니다."
                 )
-
-            # 삭제할 레코드 확인
-            stmt = select(ClosedDays.closed_day_date).where(
-                and_(
-                    ClosedDays.branch_id == branch_id,
-                    ClosedDays.closed_day_date.in_(dates_to_delete),
-                    ClosedDays.user_id == user_id,
-                    ClosedDays.deleted_yn == "N",
-                )
-            )
-            result = await db.execute(stmt)
-            existing_dates = result.scalars().all()
-
-            if not existing_dates:
+            if user_id not in existing_user_ids:
                 raise HTTPException(
                     status_code=404, 
                     detail=f"사용자 ID {user_id}의 삭제할 휴무일을 찾을 수 없습니다."
                 )
 
-            # UPDATE 실행
-            update_stmt = (
-                update(ClosedDays)
-                .where(
-                    and_(
-                        ClosedDays.branch_id == branch_id,
-                        ClosedDays.closed_day_date.in_(dates_to_delete),
-                        ClosedDays.user_id == user_id,
-                        ClosedDays.deleted_yn == "N",
-                    )
-                )
-                .values(deleted_yn="Y")
-            )
-            await db.execute(update_stmt)
-
+        await closed_days_crud.delete_user_closed_days(db, branch_id, existing_closed_days)
         await db.commit()
+        await refresh_attendance_summaries(
+            db,
+            month_keys(closed_day_date for _, closed_day_date in existing_closed_days),
+            user_ids=existing_user_ids
+        )
+        closed_day_calendar_cache.invalidate(branch_id)
         return {"message": "직원 휴무일이 성공적으로 삭제되었습니다."}
 
     except HTTPException as http_err:
@@ -312,66 +283,20 @@ async def create_early_clock_in(
     db: AsyncSession = Depends(get_db),
 ):
     try:
-        today = date.today()
-        
-        for user_id, dates in early_clock_in.early_clock_in_users.items():
-            # 해당 직원이 이 지점 소속인지 확인
-            stmt = select(Users).where(
-                and_(
-                    Users.id == user_id,
-                    Users.branch_id == branch_id,
-                    Users.deleted_yn == 'N'
-                )
-            )
-            result = await db.execute(stmt)
-            user = result.scalar_one_or_none()
-            
-            if not user:
+        # 요청한 직원이 모두 이 지점 소속인지 확인
+        branch_user_ids = await closed_days_crud.find_branch_user_ids(db, branch_id, list(early_clock_in.early_clock_in_users))
+        for user_id in early_clock_in.early_clock_in_users:
+            if user_id not in branch_user_ids:
                 raise HTTPException(
                     status_code=403, 
                     detail=f"사용자 ID {user_id}는 해당 지점의 직원이 아닙니다."
                 )
 
-            # DB에서 해당 유저의 오늘 이후 모든 조기 출근 기록 조회 (deleted_yn 상관없이)
-            stmt = select(EarlyClockIn).where(
-                and_(
-                    EarlyClockIn.user_id == user_id,
-                    EarlyClockIn.branch_id == branch_id,
-                    func.date(EarlyClockIn.early_clock_in) >= today,
-                )
-            )
-            result = await db.execute(stmt)
-            existing_records = {record.early_clock_in.date(): record for record in result.scalars().all()}
-
-            # 요청된 날짜들을 날짜별로 정리
-            requested_dates = {d.date(): d for d in dates}
-
-            # 기존 레코드 처리
-            for date_key, record in existing_records.items():
-                if date_key in requested_dates:
-                    # 날짜는 같고 시간이 다른 경우
-                    if record.early_clock_in != requested_dates[date_key]:
-                        record.early_clock_in = requested_dates[date_key]
-                        record.updated_at = datetime.now()
-                    # 요청에 있는 데이터는 무조건 활성화
-                    record.deleted_yn = 'N'
-                else:
-                    # DB에는 있지만 요청에는 없는 경우
-                    record.deleted_yn = 'Y'
-                    record.updated_at = datetime.now()
-
-            # 완전히 새로운 날짜만 추가
-            for date_key, clock_in_time in requested_dates.items():
-                if date_key not in existing_records:
-                    new_early_clock_in = EarlyClockIn(
-                        user_id=user_id,
-                        branch_id=branch_id,
-                        early_clock_in=clock_in_time,
-                        deleted_yn='N'
-                    )
-                    db.add(new_early_clock_in)
+        # 오늘 이후 조기 출근을 요청한 날짜/시간으로 교체 (upsert 한 번 + 요청에 없는 날짜 삭제 처리 한 번)
+        await closed_days_crud.replace_early_clock_ins(db, branch_id, early_clock_in.early_clock_in_users, date.today())
 
         await db.commit()
+        closed_day_calendar_cache.invalidate(branch_id)
         return {"message": "조기 출근 시간이 성공적으로 처리되었습니다."}
     
     except HTTPException as http_err:
@@ -4,9 +4,12 @@ from datetime import datetime, timedelta
 from typing import List
 from pydantic import BaseModel
 from app.core.database import get_db, async_session
-from fastapi.responses import HTMLResponse
+from fastapi.responses import HTMLResponse, PlainTextResponse
 from sqlalchemy import text, select, delete
 from app.models.db_monitor.connection_logs import ConnectionLogs
+from app.core.query_metrics import route_query_metrics
+from app.middleware.principal_cache import principal_cache
+from app.service.password_service import password_service
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from apscheduler.triggers.cron import CronTrigger
 import os
@@ -94,6 +97,19 @@ async def get_max_connections(db: AsyncSession = Depends(get_db)):
         print(f"Error in get_max_connections: {str(e)}")
         raise
 
+@router.get("/metrics/principal-cache")
+async def get_principal_cache_stats():
+    return principal_cache.stats()
+
+@router.get("/metrics/password-service")
+async def get_password_service_stats():
+    return password_service.stats()
+
+@router.get("/metrics/queries", response_class=PlainTextResponse)
+async def get_query_metrics():
+    # Prometheus text format (라우트별 쿼리 수/DB 시간 히스토그램)
+    return PlainTextResponse(route_query_metrics.render())
+
 @router.get("/monitor", response_class=HTMLResponse)
 async def get_monitor_page():
     html_path = os.path.join(current_dir, "db_connections_monitor.html")
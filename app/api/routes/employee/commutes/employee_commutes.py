@@ -1,4 +1,4 @@
-from datetime import date, datetime, time
+from datetime import date, datetime
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -8,6 +8,7 @@ from app.models.branches.branches_model import Branches
 from app.models.branches.commute_policies_model import CommutePolicies
 from app.models.commutes.commutes_model import Commutes
 from app.models.users.users_model import Users
+from app.service.attendance_summary_service import refresh_attendance_summaries
 
 router = APIRouter()
 
@@ -21,8 +22,6 @@ async def create_employee_clock_in(
     try:
         # 현재 날짜의 시작과 끝 시간 계산
         today = date.today()
-        today_start = datetime.combine(today, datetime.min.time())
-        today_end = datetime.combine(today, datetime.max.time())
 
         # 같은 날짜에 이미 출근 기록이 있는지 확인
         existing_commute = await db.execute(
@@ -30,8 +29,7 @@ async def create_employee_clock_in(
             .join(Branches, current_user.branch_id == Branches.id)
             .where(
                 Commutes.user_id == current_user.id,
-                Commutes.clock_in >= today_start,
-                Commutes.clock_in <= today_end,
+                Commutes.commute_date == today,
             )
         )
         existing_commute = existing_commute.scalar_one_or_none()
@@ -67,7 +65,9 @@ async def create_employee_clock_in(
         )
 
         db.add(new_commute)
+        await db.flush()
         await db.commit()
+        await refresh_attendance_summaries(db, [(today.year, today.month)], user_ids=[current_user.id])
         await db.refresh(new_commute)
 
         return {
@@ -90,14 +90,11 @@ async def create_employee_clock_out(
     try:
         # 현재 날짜의 시작과 끝 시간 계산
         today = date.today()
-        today_start = datetime.combine(today, time.min)
-        today_end = datetime.combine(today, time.max)
 
         # 오늘의 출근 기록 조회
         stmt = select(Commutes).where(
             (Commutes.user_id == current_user.id)
-            & (Commutes.clock_in >= today_start)
-            & (Commutes.clock_in <= today_end)
+            & (Commutes.commute_date == today)
             & (Commutes.deleted_yn == "N")
         ).order_by(Commutes.clock_in.desc())
         result = await db.execute(stmt)
@@ -141,6 +138,7 @@ async def create_employee_clock_out(
         )
         await db.execute(update_stmt)
         await db.commit()
+        await refresh_attendance_summaries(db, [(commute.clock_in.year, commute.clock_in.month)], user_ids=[current_user.id])
 
         return {
             "message": "퇴근 기록이 성공적으로 생성되었습니다.",
@@ -117,6 +117,13 @@ async def get_leave_histories(
     size: Annotated[
         int, Query(description="페이지당 레코드 수를 입력합니다. 기본값은 10입니다.")
     ] = 10,
+    cursor: Annotated[
+        Optional[str],
+        Query(description="이전 응답의 next_cursor를 입력합니다. 입력한 경우 page 대신 커서 이후부터 조회합니다."),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="커서 조회 시 전체 레코드 수 포함 여부입니다. 기본값은 false입니다.")
+    ] = False,
 ):
     """
     사원용 - 연차 신청 목록을 조회합니다.
@@ -133,7 +140,11 @@ async def get_leave_histories(
             search_phone,
             page,
             size,
+            cursor,
+            include_total,
         )
+    except HTTPException as http_err:
+        raise http_err
     except Exception as err:
         print(f"에러가 발생하였습니다: {err}")
         raise HTTPException(status_code=500, detail=str(err))
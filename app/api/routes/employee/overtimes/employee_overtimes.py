@@ -1,13 +1,12 @@
 from datetime import UTC, datetime, date, timedelta
 from typing import Optional
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_, select
+from sqlalchemy import or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core.database import get_db
+from app.cruds.overtimes.overtimes_crud import fetch_overtime_list, overtime_list_query
 from app.enums.users import Status
 from app.middleware.tokenVerify import get_current_user, get_current_user_id
-from app.models.branches.branches_model import Branches
-from app.models.parts.parts_model import Parts
 from app.models.users.overtimes_model import OvertimeCreate, Overtimes
 from app.models.users.users_model import Users
 
@@ -82,61 +81,14 @@ async def get_employee_overtimes(
         date_end_day = date_start_day + timedelta(days=6)
 
         # 본인의 기록만 조회
-        base_query = select(Overtimes).where(
-            Overtimes.deleted_yn == "N",
+        base_query = overtime_list_query(
             Overtimes.applicant_id == current_user.id,
             Overtimes.application_date >= date_start_day,
             Overtimes.application_date <= date_end_day
         )
 
-        # 페이징 처리
-        skip = (page - 1) * size
-        result = await db.execute(
-            base_query.order_by(Overtimes.created_at.desc())
-            .offset(skip)
-            .limit(size)
-        )
-        overtimes = result.scalars().all()
-
-        formatted_data = []
-        for overtime in overtimes:
-            user_query = select(Users, Branches, Parts).join(
-                Branches, Users.branch_id == Branches.id
-            ).join(
-                Parts, Users.part_id == Parts.id
-            ).where(Users.id == overtime.applicant_id)
-            
-            user_result = await db.execute(user_query)
-            user, branch, part = user_result.first()
-            
-            overtime_data = {
-                "id": overtime.id,
-                "applicant_id": user.id,
-                "user_name": user.name,
-                "user_phone_number": user.phone_number,
-                "user_gender": user.gender,
-                "user_hire_date": user.hire_date,
-                "user_resignation_date": user.resignation_date,
-                "branch_id": branch.id,
-                "branch_name": branch.name,
-                "part_id": part.id,
-                "part_name": part.name,
-                "application_date": overtime.application_date,
-                "overtime_hours": overtime.overtime_hours,
-                "application_memo": overtime.application_memo,
-                "manager_memo": overtime.manager_memo,
-                "status": overtime.status,
-                "manager_id": overtime.manager_id,
-                "manager_name": overtime.manager_name,
-                "processed_date": overtime.processed_date,
-                "is_approved": overtime.is_approved
-            }
-            formatted_data.append(overtime_data)
-
-        # 전체 레코드 수 조회
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_count = await db.execute(count_query)
-        total_count = total_count.scalar_one()
+        # 페이징 처리 (목록과 신청자/지점/파트 정보를 한 번에 조회)
+        formatted_data, total_count, _ = await fetch_overtime_list(db, base_query, page, size)
 
         return {
             "message": "초과 근무 기록을 정상적으로 조회하였습니다.",
@@ -9,6 +9,7 @@ from app.models.users.leave_histories_model import (
     LeaveHistoriesCreate,
     LeaveHistoriesSearchDto,
     LeaveHistoriesApprove,
+    LeaveHistoriesBulkApprove,
     LeaveHistoriesUpdate,
 )
 from app.models.branches.user_leaves_days import UserLeavesDaysResponse
@@ -17,6 +18,7 @@ from app.enums.users import Role
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.service.leave_histories_service import (
     approve_leave_service,
+    bulk_approve_leaves_service,
     create_leave_history_service,
     delete_leave_service,
     get_approve_leave_service,
@@ -93,6 +95,13 @@ async def get_leave_histories(
     size: Annotated[
         int, Query(description="페이지당 레코드 수를 입력합니다. 기본값은 10입니다.")
     ] = 10,
+    cursor: Annotated[
+        Optional[str],
+        Query(description="이전 응답의 next_cursor를 입력합니다. 입력한 경우 page 대신 커서 이후부터 조회합니다."),
+    ] = None,
+    include_total: Annotated[
+        bool, Query(description="커서 조회 시 전체 레코드 수 포함 여부입니다. 기본값은 false입니다.")
+    ] = False,
 ):
     """
     연차 신청 목록을 조회합니다.
@@ -109,7 +118,11 @@ async def get_leave_histories(
             search_phone,
             page,
             size,
+            cursor,
+            include_total,
         )
+    except HTTPException as http_err:
+        raise http_err
     except Exception as err:
         print(f"에러가 발생하였습니다: {err}")
         raise HTTPException(status_code=500, detail=str(err))
@@ -214,6 +227,35 @@ async def create_leave_history(
         raise HTTPException(status_code=500, detail=str(err))
 
 
+@router.patch(
+    "/{branch_id}/leave-histories/approve",
+    summary="연차 일괄 승인/반려",
+    description="여러 연차를 한 번에 승인/반려하고 건별 결과를 반환합니다.",
+)
+@available_higher_than(Role.ADMIN)
+async def bulk_approve_leaves(
+    context: Request,
+    leave_bulk_approve: LeaveHistoriesBulkApprove,
+    branch_id: Annotated[
+        int, Path(description="현재 사용자가 포함된 지점 ID를 입력합니다.")
+    ],
+    current_user_id: Annotated[int, Depends(get_current_user_id)],
+    db: Annotated[AsyncSession, Depends(get_db)],
+):
+    """
+    연차를 일괄 승인/반려합니다.
+    """
+    try:
+        return await bulk_approve_leaves_service(
+            leave_bulk_approve, branch_id, current_user_id, db
+        )
+    except HTTPException:
+        raise
+    except Exception as err:
+        print(err)
+        raise HTTPException(status_code=500, detail=str(err))
+
+
 @router.patch(
     "/{branch_id}/leave-histories/{leave_id}/approve",
     summary="연차 승인/반려",
@@ -1,15 +1,16 @@
 from datetime import UTC, datetime
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 
 from sqlalchemy import case, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.database import get_db
+from app.cruds.overtimes.overtimes_crud import fetch_overtime_list, overtime_list_query
 from app.middleware.tokenVerify import get_current_user, get_current_user_id, validate_token
 from app.models.branches.branches_model import Branches
 from app.models.parts.parts_model import Parts
-from app.models.users.overtimes_model import OvertimeSelect, OvertimeCreate, Overtimes, OvertimeUpdate, OverTime_History, ManagerMemoResponseDto
+from app.models.users.overtimes_model import OvertimeBulkSelect, OvertimeSelect, OvertimeCreate, Overtimes, OvertimeUpdate, OverTime_History, ManagerMemoResponseDto
 
 from app.models.branches.overtime_policies_model import OverTimePolicies
 from app.models.users.users_model import Users
@@ -17,6 +18,8 @@ from sqlalchemy.orm import load_only
 from app.enums.users import OverTimeHours
 
 from app.common.dto.response_dto import ResponseDTO
+from app.service.overtime_service import bulk_process_overtimes_service, overtime_history_row
+from app.service.overtime_summary_service import record_overtime_summary
 
 from app.enums.users import OverTimeHours, Status
 from typing import Optional
@@ -175,6 +178,8 @@ async def approve_overtime(
             new_overtime_history.ot_90_money += result_overtime_policies.doctor_ot_90 if result_part[0].is_doctor else result_overtime_policies.common_ot_90
         # 새로운 기록을 데이터베이스에 추가
         db.add(new_overtime_history)
+        # 월간 오버타임 집계 반영
+        await record_overtime_summary(db, [overtime], 1)
         
         await db.commit()
         
@@ -201,7 +206,7 @@ async def reject_overtime(
     db: AsyncSession = Depends(get_db)
     ):
     try:
-        stmt = select(Overtimes).where((Overtimes.id == overtime_id) & (Overtimes.deleted_yn == "N"))
+        stmt = select(Overtimes).where((Overtimes.id == overtime_id) & (Overtimes.deleted_yn == "N")).with_for_update()
         result = await db.execute(stmt)
         overtime = result.scalar_one_or_none()
 
@@ -216,69 +221,21 @@ async def reject_overtime(
 
         if result_user is None:
             raise HTTPException(status_code=404, detail="사용자 정보를 찾을 수 없습니다.")
-        
-        # 기존 오버타임 신청 목록 조회
-        find_overtime_history = await db.execute(select(OverTime_History).where(OverTime_History.user_id == result_user.id, OverTime_History.deleted_at == "N"))
-        result_overtime_history = find_overtime_history.scalar_one_or_none()
-        
-        if(result_overtime_history is None):
-            overtime.status = "rejected"
-            overtime.manager_id = current_user.id
-            overtime.manager_name = current_user.name
-            overtime.processed_date = datetime.now(UTC).date()
-            overtime.is_approved = "N"
-            overtime.manager_memo = overtime_select.manager_memo
-            
-            await db.commit()
-        else:
 
-            overtime.status = "rejected"
-            overtime.manager_id = current_user.id
-            overtime.manager_name = current_user.name
-            overtime.processed_date = datetime.now(UTC).date()
-            overtime.is_approved = "N"
-            overtime.manager_memo = overtime_select.manager_memo
-
-            # 해당 파트에 대한 의사 여부 확인
-            find_part = await db.execute(select(Parts).where(Parts.id == result_user.part_id, Parts.deleted_yn == "N"))
-            result_part = find_part.first()
-
-            if result_part is None:
-                raise HTTPException(status_code=404, detail="사용자 또는 파트 정보를 찾을 수 없습니다.")
-
-            # 정책 조회
-            find_overtime_policies = await db.scalars(select(OverTimePolicies).options(load_only(OverTimePolicies.doctor_ot_30, OverTimePolicies.doctor_ot_60, OverTimePolicies.doctor_ot_90, OverTimePolicies.common_ot_30, OverTimePolicies.common_ot_60, OverTimePolicies.common_ot_90)).where(result_user.branch_id == OverTimePolicies.branch_id, Branches.deleted_yn == "N", OverTimePolicies.deleted_yn == "N"))
-            result_overtime_policies = find_overtime_policies.first()
-            if result_overtime_policies is None:
-                raise HTTPException(status_code=404, detail="오버타임 정책을 찾을 수 없습니다.")
-
-
-            # 각 오버타임 승인 횟수에 대한 카운드 및 수당 카운트 
-            if(overtime.overtime_hours != None and overtime.overtime_hours == OverTimeHours.THIRTY_MINUTES):
-                if(result_overtime_history.ot_30_total >= 1):
-                    result_overtime_history.ot_30_total -= 1
-                if (result_overtime_history.ot_30_money <= (result_overtime_policies.doctor_ot_30 or result_overtime_policies.common_ot_30)):
-                    result_overtime_history.ot_30_money = 0
-                elif(result_overtime_history.ot_30_money >= 1):
-                     result_overtime_history.ot_30_money -= result_overtime_policies.doctor_ot_30 if result_part[0].is_doctor else result_overtime_policies.common_ot_30
-            elif(overtime.overtime_hours != None and overtime.overtime_hours == OverTimeHours.SIXTY_MINUTES):
-                if(result_overtime_history.ot_60_total):
-                    result_overtime_history.ot_60_total -= 1
-                if (result_overtime_history.ot_60_money <= (result_overtime_policies.doctor_ot_60 or result_overtime_policies.common_ot_60)):
-                    result_overtime_history.ot_60_money = 0
-                elif(result_overtime_history.ot_60_money >= 1):
-                    result_overtime_history.ot_60_money -= result_overtime_policies.doctor_ot_60 if result_part[0].is_doctor else result_overtime_policies.common_ot_60
-            elif(overtime.overtime_hours != None and overtime.overtime_hours == OverTimeHours.NINETY_MINUTES):
-                if(result_overtime_history.ot_90_total >= 1):
-                    result_overtime_history.ot_90_total -= 1
-                if (result_overtime_history.ot_90_money <= (result_overtime_policies.doctor_ot_90 or result_overtime_policies.common_ot_90)):
-                    result_overtime_history.ot_90_money = 0
-                elif(result_overtime_history.ot_90_money >= 1):
-                    result_overtime_history.ot_90_money -= result_overtime_policies.doctor_ot_90 if result_part[0].is_doctor else result_overtime_policies.common_ot_90
-                    
-            await db.commit()
-        
-        
+        # 승인된 건을 반려하는 경우 승인 시 더한 수당(approved_money)만큼 이력/월간 집계에서 차감
+        if overtime.status == Status.APPROVED:
+            db.add(OverTime_History(**overtime_history_row(result_user.id, overtime.overtime_hours, overtime.approved_money or 0, -1)))
+            await record_overtime_summary(db, [overtime], -1)
+
+        overtime.status = "rejected"
+        overtime.manager_id = current_user.id
+        overtime.manager_name = current_user.name
+        overtime.processed_date = datetime.now(UTC).date()
+        overtime.is_approved = "N"
+        overtime.manager_memo = overtime_select.manager_memo
+
+        await db.commit()
+
         return {
             "message": "초과 근무 기록이 거절되었습니다.",
         }
@@ -291,6 +248,41 @@ async def reject_overtime(
         print(err)
         raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다. Error {str(err)}")
 
+# 오버타임 초과 근무 일괄 승인
+@router.patch("/approve", summary="오버타임 일괄 승인")
+async def bulk_approve_overtimes(
+    overtime_bulk_select: OvertimeBulkSelect,
+    current_user: Users = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+    ):
+    try:
+        return await bulk_process_overtimes_service(
+            db, overtime_bulk_select.overtime_ids, True, overtime_bulk_select.manager_memo, current_user
+        )
+    except Exception as err:
+        await db.rollback()
+        print("에러가 발생하였습니다.")
+        print(err)
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다. Error {str(err)}")
+
+
+# 오버타임 초과 근무 일괄 거절
+@router.patch("/reject", summary="오버타임 일괄 반려")
+async def bulk_reject_overtimes(
+    overtime_bulk_select: OvertimeBulkSelect,
+    current_user: Users = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db)
+    ):
+    try:
+        return await bulk_process_overtimes_service(
+            db, overtime_bulk_select.overtime_ids, False, overtime_bulk_select.manager_memo, current_user
+        )
+    except Exception as err:
+        await db.rollback()
+        print("에러가 발생하였습니다.")
+        print(err)
+        raise HTTPException(status_code=500, detail=f"서버 오류가 발생했습니다. Error {str(err)}")
+
 # 초과 근무 목록 조회
 @router.get("")
 async def get_overtimes(
@@ -302,6 +294,8 @@ async def get_overtimes(
     status: Optional[str] = None,
     page: int = 1,
     size: int = 10,
+    cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (전달 시 page 대신 커서 이후부터 조회)"),
+    include_total: bool = Query(False, description="커서 조회 시 전체 레코드 수 포함 여부"),
     current_user: Users = Depends(get_current_user),
     db: AsyncSession = Depends(get_db)
     ):
@@ -319,22 +313,15 @@ async def get_overtimes(
             date_start_day = date_obj - timedelta(days=current_weekday)
             date_end_day = date_start_day + timedelta(days=6)
 
-        base_query = select(Overtimes).where(
-            Overtimes.deleted_yn == "N",
+        base_query = overtime_list_query(
             Overtimes.application_date >= date_start_day,
             Overtimes.application_date <= date_end_day
         )
-        
-        stmt = None
 
         # 사원인 경우 자신의 기록만 조회
         if current_user.role == "사원":
             base_query = base_query.where(Overtimes.applicant_id == current_user.id)
 
-        # Users 테이블과 JOIN (검색 조건이 있는 경우)
-        if name or phone_number or branch_id or part_id:
-            base_query = base_query.join(Users, Overtimes.applicant_id == Users.id)
-
         # 이름 검색 조건
         if name:
             base_query = base_query.where(Users.name.like(f"%{name}%"))
@@ -343,65 +330,18 @@ async def get_overtimes(
             base_query = base_query.where(Users.phone_number.like(f"%{phone_number}%"))
         # 지점 검색 조건
         if branch_id:
-            base_query = base_query.join(Branches, Users.branch_id == Branches.id)\
-                .where(Branches.id == branch_id)
+            base_query = base_query.where(Branches.id == branch_id)
         # 파트 검색 조건
         if part_id:
-            base_query = base_query.join(Parts, Users.part_id == Parts.id)\
-                .where(Parts.id == part_id)
+            base_query = base_query.where(Parts.id == part_id)
         # 상태 검색 조건
         if status:
             base_query = base_query.where(Overtimes.status.like(f"%{status}%"))
 
-        # 정렬, 페이징 적용
-        skip = (page - 1) * size
-        stmt = base_query.order_by(Overtimes.created_at.desc())\
-            .offset(skip)\
-            .limit(size)
-            
-        result = await db.execute(stmt)
-        overtimes = result.scalars().all()
-            
-        formatted_data = []
-        for overtime in overtimes:
-            # Users, Branches, Parts 테이블 조인 쿼리
-            user_query = select(Users, Branches, Parts).join(
-                Branches, Users.branch_id == Branches.id
-            ).join(
-                Parts, Users.part_id == Parts.id
-            ).where(Users.id == overtime.applicant_id)
-            
-            user_result = await db.execute(user_query)
-            user, branch, part = user_result.first()
-
-            overtime_data = {
-                "id": overtime.id,
-                "applicant_id": user.id,
-                "user_name": user.name,
-                "user_phone_number": user.phone_number,
-                "user_gender": user.gender,
-                "user_hire_date": user.hire_date,
-                "user_resignation_date": user.resignation_date,
-                "branch_id": branch.id,
-                "branch_name": branch.name,
-                "part_id": part.id,
-                "part_name": part.name,
-                "application_date": overtime.application_date,
-                "overtime_hours": overtime.overtime_hours,
-                "application_memo": overtime.application_memo,
-                "manager_memo": overtime.manager_memo,
-                "status": overtime.status,
-                "manager_id": overtime.manager_id,
-                "manager_name": overtime.manager_name,
-                "processed_date": overtime.processed_date,
-                "is_approved": overtime.is_approved
-            }
-            formatted_data.append(overtime_data)
-
-        # 전체 레코드 수 조회
-        count_query = select(func.count()).select_from(base_query.subquery())
-        total_count = await db.execute(count_query)
-        total_count = total_count.scalar_one()
+        # 정렬, 페이징 적용 (커서가 없으면 기존 page 기준 OFFSET), 커서 조회는 include_total인 경우만 전체 개수 조회
+        formatted_data, total_count, next_cursor = await fetch_overtime_list(
+            db, base_query, page, size, cursor, include_total
+        )
 
         return {
             "message": "초과 근무 기록을 정상적으로 조회하였습니다.",
@@ -409,7 +349,8 @@ async def get_overtimes(
                 "total": total_count,
                 "page": page,
                 "size": size,
-                "total_pages": (total_count + size - 1) // size,
+                "total_pages": (total_count + size - 1) // size if total_count is not None else None,
+                "next_cursor": next_cursor,
             },
             "data": formatted_data,
         }
@@ -11,6 +11,7 @@ from app.core.database import get_db
 from app.cruds.users.users_crud import find_all_by_branch_id_and_role
 from app.dependencies.user_management import get_user_management_service
 from app.enums.users import Role, UserStatus
+from app.middleware.principal_cache import principal_cache
 from app.middleware.tokenVerify import validate_token, get_current_user
 from app.models.users.users_model import Users, UserUpdate, RoleUpdate, UserCreate, CreatedUserDto, AdminUsersDto
 from app.schemas.parts_schemas import PartRequest
@@ -40,6 +41,8 @@ class UserManagement:
         phone: Optional[str] = None,
         branch_id: Optional[int] = None,
         part_id: Optional[int] = None,
+        cursor: Optional[str] = Query(None, description="이전 응답의 next_cursor (전달 시 page 대신 커서 이후부터 조회)"),
+        include_total: bool = Query(False, description="커서 조회 시 전체 레코드 수 포함 여부"),
         current_user: Users = Depends(get_current_user),
         db: AsyncSession = Depends(get_db),
     ): 
@@ -50,7 +53,7 @@ class UserManagement:
             if not current_user:
                 raise HTTPException(status_code=404, detail="현재 사용자 정보를 찾을 수 없습니다.")
 
-            users_data, total_count = await user_query_service.get_users_service(
+            users_data, total_count, next_cursor = await user_query_service.get_users_service(
                 db=db,
                 current_user=current_user,
                 page=page,
@@ -59,14 +62,16 @@ class UserManagement:
                 name=name,
                 phone=phone,
                 branch_id=branch_id,
-                part_id=part_id
+                part_id=part_id,
+                cursor=cursor,
+                include_total=include_total
             )
 
             if not users_data:
                 return UserListResponseDTO(
                     message="조건에 맞는 유저가 없습니다.",
                     data=[],
-                    total=0,
+                    total=0 if total_count is not None else None,
                     count=0,
                     page=page,
                     record_size=record_size
@@ -78,9 +83,12 @@ class UserManagement:
                 total=total_count,
                 count=len(users_data),
                 page=page,
-                record_size=record_size
+                record_size=record_size,
+                next_cursor=next_cursor
             )
 
+        except HTTPException:
+            raise
         except Exception as err:
             raise HTTPException(status_code=500, detail="서버 오류가 발생했습니다.")
 
@@ -205,6 +213,7 @@ class UserManagement:
                 session=db,
                 current_user=current_user
             )
+            principal_cache.invalidate(user_id)
             
             return {"message": "유저 정보가 성공적으로 업데이트되었습니다."}
 
@@ -242,6 +251,7 @@ class UserManagement:
 
             target_user.role = role_update.role
             await db.commit()
+            principal_cache.invalidate(id)
             return {"message": "유저의 역할이 성공적으로 업데이트되었습니다."}
 
         except HTTPException as http_exc:
@@ -284,6 +294,7 @@ class UserManagement:
 
             target_user.parts = new_parts
             await db.commit()
+            principal_cache.invalidate(id)
             
             # 업데이트된 파트 정보 반환
             updated_parts = [{"id": part.id, "name": part.name} for part in target_user.parts]
@@ -328,6 +339,7 @@ class UserManagement:
             target_user.deleted_yn = "Y"
             target_user.updated_at = datetime.now(UTC)
             await db.commit()
+            principal_cache.invalidate(id)
 
             return {"message": "유저가 성공적으로 삭제되었습니다."}
 
@@ -368,6 +380,7 @@ class UserManagement:
             # 사용자 삭제
             await db.delete(target_user)
             await db.commit()
+            principal_cache.invalidate(id)
 
             return {"message": "유저가 성공적으로 완전히 삭제되었습니다."}
 
@@ -410,6 +423,7 @@ class UserManagement:
             target_user.deleted_yn = "N"
             target_user.updated_at = datetime.now(UTC)
             await db.commit()
+            principal_cache.invalidate(id)
 
             return {"message": "유저가 성공적으로 복구되었습니다."}
 
@@ -1,11 +1,10 @@
-from datetime import UTC, datetime
+from datetime import UTC, date, datetime
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from fastapi.responses import JSONResponse
 from sqlalchemy import func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload, load_only
-from app.api.routes.auth.auth import hashPassword
 from app.core.database import get_db
 from app.models.users.users_model import Users, UserUpdate
 from app.models.branches.branches_model import Branches
@@ -16,6 +15,7 @@ from ....schemas.users_schemas import (
     PersonnelRecordHistoryCreateResponse
 )
 from ....service import user_service
+from ....service.attendance_summary_service import refresh_attendance_summaries
 from ....core.permissions.auth_utils import available_higher_than
 from ....enums.users import Role
 from ....common.dto.search_dto import BaseSearchDto
@@ -240,10 +240,17 @@ async def update_user(
             )
 
         # 유저 정보 업데이트
+        branch_changed = update_data.get("branch_id", user.branch_id) != user.branch_id
         update_stmt = update(Users).where(Users.id == id).values(**update_data)
         await db.execute(update_stmt)
+
         await db.commit()
 
+        # 지점을 옮긴 경우 이번 달 근태 집계를 새 지점 기준으로 다시 계산
+        if branch_changed:
+            today = date.today()
+            await refresh_attendance_summaries(db, [(today.year, today.month)], user_ids=[id])
+
         return {
             "message": "유저 정보가 성공적으로 업데이트되었습니다.",
         }
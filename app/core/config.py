@@ -16,7 +16,10 @@ PUBLIC_PATHS = [
     "/monitor",
     "/metrics/connections",
     "/metrics/max-connections",
-    "/metrics/connection-history"
+    "/metrics/connection-history",
+    "/metrics/principal-cache",
+    "/metrics/password-service",
+    "/metrics/queries"
 ]
 
 
@@ -33,6 +36,30 @@ class BaseAppSettings(BaseSettings):
     USERNAME : str
     CHANNEL : str
     API_URL : str 
+
+    # 토큰 미들웨어 사용자 캐시 설정
+    PRINCIPAL_CACHE_TTL: int = 60  # 초
+    PRINCIPAL_CACHE_MAXSIZE: int = 4096
+
+    # 검증된 JWT 캐시 크기
+    JWT_CACHE_MAXSIZE: int = 4096
+
+    # 지점 월간 휴무 캘린더 캐시 설정
+    CLOSED_DAY_CALENDAR_CACHE_TTL: int = 300  # 초
+    CLOSED_DAY_CALENDAR_CACHE_MAXSIZE: int = 1024
+
+    # 메뉴 권한 비트셋 캐시 설정
+    MENU_PERMISSION_CACHE_TTL: int = 300  # 초
+    MENU_PERMISSION_CACHE_MAXSIZE: int = 4096
+
+    # 비밀번호 해시(bcrypt) 스레드풀 설정
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_ROUNDS: int = 12
+
+    # SQL 계측 설정 (MODE가 prod가 아니면 응답 헤더에 쿼리 수/DB 시간을 포함)
+    MODE: str = "dev"
+    SQL_ECHO: bool = False
+    SQL_N_PLUS_ONE_THRESHOLD: int = 5  # 같은 형태의 쿼리가 이 횟수 이상 반복되면 N+1로 표시
     
     
     @property
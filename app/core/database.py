@@ -1,15 +1,18 @@
-from fastapi import HTTPException
-from sqlalchemy import MetaData
+from typing import Optional
+
+from fastapi import HTTPException, Request
+from sqlalchemy import MetaData, event
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
-from sqlalchemy.orm import DeclarativeBase
+from sqlalchemy.orm import DeclarativeBase, Session
 from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.query_metrics import instrument_engine
 from alembic.config import Config
 from alembic import command
 
 meta = MetaData()
 engine = create_async_engine(settings.DATABASE_URL,
-    echo=True, 
+    echo=settings.SQL_ECHO,
     pool_pre_ping=True,
     pool_recycle=1800,
     pool_size=30,
@@ -21,6 +24,33 @@ engine = create_async_engine(settings.DATABASE_URL,
         "connect_timeout": 60
     }
     )
+instrument_engine(engine.sync_engine)
+
+
+class TrackedSession(Session):
+    """쓰기 작업(INSERT/UPDATE/DELETE, flush) 발생 여부를 session.info에 기록하는 세션"""
+
+
+@event.listens_for(TrackedSession, "do_orm_execute")
+def _mark_write_statement(orm_execute_state):
+    if not orm_execute_state.is_select:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(TrackedSession, "after_flush")
+def _mark_flush(session, flush_context):
+    session.info["has_writes"] = True
+
+
+@event.listens_for(TrackedSession, "after_commit")
+@event.listens_for(TrackedSession, "after_rollback")
+def _reset_write_mark(session):
+    session.info.pop("has_writes", None)
+
+
+def has_pending_writes(db: AsyncSession) -> bool:
+    """커밋되지 않은 쓰기 작업이 있는지 확인"""
+    return bool(db.info.get("has_writes") or db.new or db.dirty or db.deleted)
 
 
 async_session = async_sessionmaker(
@@ -28,19 +58,61 @@ async_session = async_sessionmaker(
     autoflush=False, 
     autocommit=False,
     expire_on_commit=False,
-    class_=AsyncSession
+    class_=AsyncSession,
+    sync_session_class=TrackedSession
 )
 
 class Base(DeclarativeBase):
     pass
 
 
-async def get_db():
+class RequestSession:
+    """
+    요청 단위로 공유되는 DB 세션 (Unit of Work)
+
+    - 미들웨어가 생성하여 request.state.db_session에 저장하고, 응답 후 close()를 호출합니다.
+    - 실제 AsyncSession은 처음 사용할 때 생성되므로 DB를 사용하지 않는 요청은 커넥션을 점유하지 않습니다.
+    - 미들웨어와 get_db 의존성이 같은 세션(= 같은 커넥션)을 사용합니다.
+    """
+
+    def __init__(self):
+        self._session: Optional[AsyncSession] = None
+
+    @property
+    def session(self) -> AsyncSession:
+        if self._session is None:
+            self._session = async_session()
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+
+
+async def commit_if_dirty(db: AsyncSession) -> None:
+    """쓰기 작업이 있을 때만 커밋 (조회만 한 요청은 커밋하지 않음)"""
+    if has_pending_writes(db):
+        await db.commit()
+
+
+async def get_db(request: Request):
+    request_session: Optional[RequestSession] = getattr(request.state, "db_session", None)
+
+    # 미들웨어가 만든 요청 단위 세션이 있으면 재사용 (close는 미들웨어에서 처리)
+    if request_session is not None:
+        db = request_session.session
+        try:
+            yield db
+        finally:
+            await commit_if_dirty(db)
+        return
+
     db = async_session()
     try:
         yield db
     finally:
-        await db.commit()
+        await commit_if_dirty(db)
         await db.close()
 
 # Alembic 설정 및 마이그레이션 실행 함수
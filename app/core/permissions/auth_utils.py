@@ -6,6 +6,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from app.enums.users import Role, MenuPermissions
 from sqlalchemy import select, and_
 
+from app.core.permissions.menu_permission_cache import has_menu, menu_permission_cache
 from app.models.parts.parts_model import Parts
 from app.models.users.users_model import Users, user_menus, user_parts
 
@@ -116,17 +117,9 @@ def check_menu_permission(required_menu: MenuPermissions):
                         detail="파트 정보가 없는 관리자는 메뉴에 접근할 수 없습니다."
                     )
 
-                #2. 해당 파트에 속한 메뉴 권한 조히
-                query = select(user_menus).where(
-                    and_(
-                        user_menus.c.request_user_id == current_user.id,
-                        user_menus.c.menu_name == required_menu,
-                        user_menus.c.is_permitted == True,
-                        user_menus.c.part_id == current_user.part_id
-                    )
-                )
-                result = await db.execute(query)
-                permission = result.first()
+                #2. 해당 파트에 속한 메뉴 권한 확인 (캐시된 비트셋으로 검사)
+                bitset = await menu_permission_cache.get_bitset(db, current_user.id, current_user.part_id)
+                permission = has_menu(bitset, required_menu)
 
                 if not permission:
                     raise HTTPException(
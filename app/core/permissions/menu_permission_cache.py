@@ -0,0 +1,74 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.enums.users import MenuPermissions
+from app.models.users.users_model import user_menus
+from app.utils.ttl_cache import TTLCache
+
+# 메뉴별 비트 (MenuPermissions 선언 순서 기준)
+MENU_BITS: dict[MenuPermissions, int] = {menu: 1 << index for index, menu in enumerate(MenuPermissions)}
+
+
+def has_menu(bitset: int, menu: MenuPermissions) -> bool:
+    return bool(bitset & MENU_BITS[menu])
+
+
+class MenuPermissionCache(TTLCache[int, dict[Optional[int], int]]):
+    """
+    사용자별 메뉴 권한을 파트 단위 비트셋으로 컴파일하여 보관하는 TTL + LRU 캐시
+
+    - user_menus 조회는 TTL 동안 사용자당 한 번만 수행하고, 이후 권한 검사는 비트 연산으로 처리합니다.
+    - MenuService에서 권한을 변경하면 invalidate(user_id)로 사용자의 항목을 지우고 version을 올리며,
+      컴파일하는 동안 version이 바뀌었다면 결과를 저장하지 않습니다.
+    - maxsize를 넘으면 가장 오래 사용되지 않은 사용자부터 제거합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 300.0):
+        super().__init__(maxsize, ttl)
+        self._versions: dict[int, int] = {}
+
+    def version(self, user_id: int) -> int:
+        return self._versions.get(user_id, 0)
+
+    def invalidate(self, user_id: int) -> None:
+        self._versions[user_id] = self.version(user_id) + 1
+        self.discard(user_id)
+
+    async def get_part_bitsets(self, db: AsyncSession, user_id: int) -> dict[Optional[int], int]:
+        """{part_id: 메뉴 권한 비트셋}"""
+        part_bitsets = self.lookup(user_id)
+        if part_bitsets is not None:
+            return part_bitsets
+
+        version = self.version(user_id)
+        part_bitsets = await self._compile(db, user_id)
+        # 조회 중에 권한이 변경되었다면 저장하지 않음
+        if version == self.version(user_id):
+            self.store(user_id, part_bitsets)
+        return part_bitsets
+
+    async def get_bitset(self, db: AsyncSession, user_id: int, part_id: Optional[int]) -> int:
+        part_bitsets = await self.get_part_bitsets(db, user_id)
+        return part_bitsets.get(part_id, 0)
+
+    @staticmethod
+    async def _compile(db: AsyncSession, user_id: int) -> dict[Optional[int], int]:
+        result = await db.execute(
+            select(user_menus.c.part_id, user_menus.c.menu_name).where(
+                user_menus.c.user_id == user_id,
+                user_menus.c.is_permitted == True
+            )
+        )
+        part_bitsets: dict[Optional[int], int] = {}
+        for part_id, menu_name in result.all():
+            part_bitsets[part_id] = part_bitsets.get(part_id, 0) | MENU_BITS[MenuPermissions(menu_name)]
+        return part_bitsets
+
+
+menu_permission_cache = MenuPermissionCache(
+    maxsize=settings.MENU_PERMISSION_CACHE_MAXSIZE,
+    ttl=settings.MENU_PERMISSION_CACHE_TTL,
+)
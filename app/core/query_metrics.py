@@ -0,0 +1,130 @@
+import re
+import time
+from bisect import bisect_left
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# 쿼리 형태 정규화: IN (...) 파라미터 개수, 숫자/문자열 리터럴, 공백 차이를 제거
+_IN_LIST_PATTERN = re.compile(r"\bIN\s*\((?:\s*(?:%s|\?|:\w+|__\[POSTCOMPILE_\w+\])\s*,?)+\)", re.IGNORECASE)
+_LITERAL_PATTERN = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+_WHITESPACE_PATTERN = re.compile(r"\s+")
+
+QUERY_COUNT_BUCKETS = (1, 2, 5, 10, 20, 50, 100, 200)
+DB_SECONDS_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+def statement_shape(statement: str) -> str:
+    shape = _IN_LIST_PATTERN.sub("IN (...)", statement)
+    shape = _LITERAL_PATTERN.sub("?", shape)
+    return _WHITESPACE_PATTERN.sub(" ", shape).strip()
+
+
+class RequestQueryStats:
+    """요청 하나에서 실행된 SQL 통계"""
+
+    __slots__ = ("count", "total_seconds", "shapes")
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.shapes: Counter[str] = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.shapes[statement_shape(statement)] += 1
+
+    def repeated_shapes(self, threshold: int) -> list[tuple[str, int]]:
+        """threshold 이상 반복된 쿼리 형태 (N+1 의심)"""
+        return [(shape, count) for shape, count in self.shapes.most_common() if count >= threshold]
+
+
+_current_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar("request_query_stats", default=None)
+
+
+def start_request_stats() -> tuple[RequestQueryStats, object]:
+    stats = RequestQueryStats()
+    return stats, _current_stats.set(stats)
+
+
+def end_request_stats(token) -> None:
+    _current_stats.reset(token)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """엔진에 cursor 실행 이벤트를 등록하여 현재 요청의 통계에 기록"""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        started_at = conn.info["query_started_at"].pop()
+        stats = _current_stats.get()
+        if stats is not None:
+            stats.record(statement, time.perf_counter() - started_at)
+
+
+class _Histogram:
+    __slots__ = ("buckets", "counts", "total", "observations")
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)  # 마지막은 +Inf
+        self.total = 0.0
+        self.observations = 0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.total += value
+        self.observations += 1
+
+
+class RouteQueryMetrics:
+    """라우트별 쿼리 수/DB 시간 히스토그램 (Prometheus text format으로 노출)"""
+
+    def __init__(self):
+        self._query_counts: dict[tuple[str, str], _Histogram] = {}
+        self._db_seconds: dict[tuple[str, str], _Histogram] = {}
+        self._n_plus_one: Counter[tuple[str, str]] = Counter()
+
+    def observe(self, method: str, route: str, stats: RequestQueryStats, n_plus_one: bool) -> None:
+        key = (method, route)
+        if key not in self._query_counts:
+            self._query_counts[key] = _Histogram(QUERY_COUNT_BUCKETS)
+            self._db_seconds[key] = _Histogram(DB_SECONDS_BUCKETS)
+        self._query_counts[key].observe(stats.count)
+        self._db_seconds[key].observe(stats.total_seconds)
+        if n_plus_one:
+            self._n_plus_one[key] += 1
+
+    def render(self) -> str:
+        lines = []
+        lines += self._render_histogram("http_request_db_queries", "SQL statements per request", self._query_counts)
+        lines += self._render_histogram("http_request_db_seconds", "DB time per request", self._db_seconds)
+        lines.append("# HELP http_request_db_n_plus_one_total Requests flagged as N+1")
+        lines.append("# TYPE http_request_db_n_plus_one_total counter")
+        for (method, route), count in sorted(self._n_plus_one.items()):
+            lines.append(f'http_request_db_n_plus_one_total{{method="{method}",route="{route}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+    @staticmethod
+    def _render_histogram(name: str, description: str, histograms: dict) -> list[str]:
+        lines = [f"# HELP {name} {description}", f"# TYPE {name} histogram"]
+        for (method, route), histogram in sorted(histograms.items()):
+            labels = f'method="{method}",route="{route}"'
+            cumulative = 0
+            for bucket, count in zip((*histogram.buckets, "+Inf"), histogram.counts):
+                cumulative += count
+                lines.append(f'{name}_bucket{{{labels},le="{bucket}"}} {cumulative}')
+            lines.append(f"{name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{name}_count{{{labels}}} {histogram.observations}")
+        return lines
+
+
+route_query_metrics = RouteQueryMetrics()
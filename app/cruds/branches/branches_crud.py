@@ -7,8 +7,6 @@ from sqlalchemy.orm import selectinload, joinedload
 from app.models.branches.branches_model import Branches, PersonnelRecordCategory
 from app.common.dto.search_dto import BaseSearchDto
 from app.models.branches.work_policies_model import WorkPolicies
-from app.models.parts.parts_model import Parts
-from app.models.users.users_model import Users
 
 logger = logging.getLogger(__name__)
 
@@ -175,27 +173,6 @@ async def update(*, session: AsyncSession, branch_id: int, request: Branches, ol
     return True
 
 
-async def find_all_with_parts_users_auto_annual_leave_policies(
-    *, session: AsyncSession
-) -> list[Branches]:
-    stmt = (
-       select(Branches)
-       .options(
-           selectinload(
-               Branches.parts.and_(Parts.deleted_yn == "N")
-            ).selectinload(
-               Parts.users.and_(Users.deleted_yn == "N")
-           ),
-           joinedload(Branches.account_based_annual_leave_grant),
-           joinedload(Branches.entry_date_based_annual_leave_grant),
-           joinedload(Branches.condition_based_annual_leave_grant)
-       )
-       .where(Branches.deleted_yn == "N")
-   )
-    result = await session.execute(stmt)
-    return result.unique().scalars().all()
-
-
 async def create_personnel_record_category(
     *, session: AsyncSession, request: PersonnelRecordCategory
 ) -> PersonnelRecordCategory:
@@ -0,0 +1,132 @@
+from datetime import date, datetime
+
+from sqlalchemy import and_, func, not_, select, tuple_, update
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.branches.branches_model import Branches
+from app.models.closed_days.closed_days_model import ClosedDays, EarlyClockIn
+from app.models.users.users_model import Users
+
+
+async def find_branch_user_ids(db: AsyncSession, branch_id: int, user_ids: list[int]) -> set[int]:
+    """user_ids 중 해당 지점 소속 직원 ID (한 번의 IN 조회)"""
+    result = await db.scalars(
+        select(Users.id).where(
+            Users.id.in_(user_ids),
+            Users.branch_id == branch_id,
+            Users.deleted_yn == "N"
+        )
+    )
+    return set(result)
+
+
+async def find_branch_ids(db: AsyncSession, branch_ids: list[int]) -> set[int]:
+    """branch_ids 중 삭제되지 않은 지점 ID"""
+    result = await db.scalars(
+        select(Branches.id).where(Branches.id.in_(branch_ids), Branches.deleted_yn == "N")
+    )
+    return set(result)
+
+
+async def upsert_closed_days(db: AsyncSession, closed_days: list[dict]) -> None:
+    """
+    휴무일 일괄 등록 (한 번의 INSERT ... ON DUPLICATE KEY UPDATE)
+    (branch_id, user_id, closed_day_date)가 같은 휴무일이 있으면 새로 만들지 않고 복구합니다.
+    """
+    if not closed_days:
+        return
+    stmt = mysql_insert(ClosedDays)
+    stmt = stmt.on_duplicate_key_update(
+        deleted_yn="N",
+        memo=stmt.inserted.memo,
+        updated_at=func.now()
+    )
+    await db.execute(stmt, closed_days)
+
+
+async def find_user_closed_days(db: AsyncSession, branch_id: int, user_closed_days: dict[int, list[date]]) -> set[tuple[int, date]]:
+    """요청한 (user_id, 날짜) 중 등록되어 있는 직원 휴무일"""
+    pairs = [(user_id, closed_day_date) for user_id, dates in user_closed_days.items() for closed_day_date in dates]
+    if not pairs:
+        return set()
+    result = await db.execute(
+        select(ClosedDays.user_id, ClosedDays.closed_day_date).where(
+            ClosedDays.branch_id == branch_id,
+            tuple_(ClosedDays.user_id, ClosedDays.closed_day_date).in_(pairs),
+            ClosedDays.deleted_yn == "N"
+        )
+    )
+    return {(user_id, closed_day_date) for user_id, closed_day_date in result.all()}
+
+
+async def delete_user_closed_days(db: AsyncSession, branch_id: int, pairs: set[tuple[int, date]]) -> None:
+    """직원 휴무일 일괄 삭제 처리 (한 번의 UPDATE)"""
+    if not pairs:
+        return
+    await db.execute(
+        update(ClosedDays)
+        .where(
+            ClosedDays.branch_id == branch_id,
+            tuple_(ClosedDays.user_id, ClosedDays.closed_day_date).in_(list(pairs)),
+            ClosedDays.deleted_yn == "N"
+        )
+        .values(deleted_yn="Y", updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def replace_early_clock_ins(db: AsyncSession, branch_id: int, early_clock_ins: dict[int, list[datetime]], since: date) -> None:
+    """
+    직원별 since 이후 조기 출근을 요청한 목록으로 교체
+    요청한 날짜는 한 번의 INSERT ... ON DUPLICATE KEY UPDATE로 등록/시간 변경/복구하고,
+    요청에 없는 날짜는 한 번의 UPDATE로 삭제 처리합니다. (직원별 하루 한 건)
+    """
+    requested = {
+        (user_id, clock_in_time.date()): clock_in_time
+        for user_id, times in early_clock_ins.items()
+        for clock_in_time in times
+    }
+    if requested:
+        stmt = mysql_insert(EarlyClockIn)
+        stmt = stmt.on_duplicate_key_update(
+            early_clock_in=stmt.inserted.early_clock_in,
+            deleted_yn="N",
+            updated_at=func.now()
+        )
+        await db.execute(stmt, [
+            {"user_id": user_id, "branch_id": branch_id, "early_clock_in": clock_in_time, "deleted_yn": "N"}
+            for (user_id, _), clock_in_time in requested.items()
+        ])
+
+    conditions = [
+        EarlyClockIn.user_id.in_(list(early_clock_ins)),
+        EarlyClockIn.branch_id == branch_id,
+        EarlyClockIn.early_clock_in_date >= since,
+        EarlyClockIn.deleted_yn == "N"
+    ]
+    if requested:
+        conditions.append(not_(tuple_(EarlyClockIn.user_id, EarlyClockIn.early_clock_in_date).in_(list(requested))))
+    await db.execute(
+        update(EarlyClockIn)
+        .where(and_(*conditions))
+        .values(deleted_yn="Y", updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def delete_early_clock_ins(db: AsyncSession, branch_id: int, early_clock_ins: dict[int, list[datetime]]) -> None:
+    """요청한 (user_id, 조기 출근 시간) 일괄 삭제 처리 (한 번의 UPDATE)"""
+    pairs = [(user_id, clock_in_time) for user_id, times in early_clock_ins.items() for clock_in_time in times]
+    if not pairs:
+        return
+    await db.execute(
+        update(EarlyClockIn)
+        .where(
+            EarlyClockIn.branch_id == branch_id,
+            tuple_(EarlyClockIn.user_id, EarlyClockIn.early_clock_in).in_(pairs),
+            EarlyClockIn.deleted_yn == "N"
+        )
+        .values(deleted_yn="Y", updated_at=datetime.now())
+        .execution_options(synchronize_session=False)
+    )
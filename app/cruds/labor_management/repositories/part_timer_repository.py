@@ -14,7 +14,7 @@ from app.exceptions.exceptions import BadRequestError
 from app.models.users.users_contract_info_model import ContractInfo
 from app.models.users.users_contract_model import Contract
 from app.models.users.users_model import Users
-from sqlalchemy import Select, Time, and_, case, exists, extract, func, select, tuple_, update
+from sqlalchemy import Select, Time, and_, case, exists, func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.models.users.users_model import Users
@@ -22,6 +22,7 @@ from app.models.branches.branches_model import Branches
 from app.models.parts.parts_model import Parts
 from app.models.commutes.commutes_model import Commutes
 from app.models.users.part_timer.users_part_timer_work_contract_model import PartTimerAdditionalInfo, PartTimerHourlyWage, PartTimerWorkContract
+from app.utils.datetime_utils import DatetimeUtil
 
 class PartTimerRepository(IPartTimerRepository):
     def __init__(self, session: AsyncSession):
@@ -82,8 +83,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .filter(
                     and_(
                         Users.id.in_(select(user_id_subquery.columns.id)),
-                        extract('year', Commutes.clock_in) == year,
-                        extract('month', Commutes.clock_in) == month
+                        DatetimeUtil.in_month(Commutes.commute_date, year, month)
                     )
                 )
             .join(PartTimerAdditionalInfo, PartTimerAdditionalInfo.commute_id == Commutes.id)
@@ -158,8 +158,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .filter(
                     and_(
                         Commutes.user_id == user_id,
-                        extract('year', Commutes.clock_in) == year,
-                        extract('month', Commutes.clock_in) == month
+                        DatetimeUtil.in_month(Commutes.commute_date, year, month)
                     )
                 )
             .join(PartTimerAdditionalInfo, PartTimerAdditionalInfo.commute_id == Commutes.id)
@@ -287,8 +286,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .filter(
                     and_(
                         Users.id == user_id,
-                        extract('year', Commutes.clock_in) == year,
-                        extract('month', Commutes.clock_in) == month
+                        DatetimeUtil.in_month(Commutes.commute_date, year, month)
                     )
                 )
             .join(PartTimerAdditionalInfo, PartTimerAdditionalInfo.commute_id == Commutes.id)
@@ -413,8 +411,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .join(Commutes, Commutes.user_id == Users.id)
                     .filter(
                         and_(
-                            func.extract('year', Commutes.clock_in) == year,
-                            func.extract('month', Commutes.clock_in) == month
+                            DatetimeUtil.in_month(Commutes.commute_date, year, month)
                         )
                     )
         )
@@ -449,8 +446,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .join(Commutes, Commutes.user_id == Users.id)
                     .filter(
                         and_(
-                            func.extract('year', Commutes.clock_in) == year,
-                            func.extract('month', Commutes.clock_in) == month
+                            DatetimeUtil.in_month(Commutes.commute_date, year, month)
                         )
                     )
         )
@@ -487,8 +483,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .join(Commutes, Commutes.user_id == Users.id)
                     .filter(
                         and_(
-                            func.extract('year', Commutes.clock_in) == year,
-                            func.extract('month', Commutes.clock_in) == month
+                            DatetimeUtil.in_month(Commutes.commute_date, year, month)
                         )
                     )
         )
@@ -568,8 +563,7 @@ class PartTimerRepository(IPartTimerRepository):
             .filter(Users.employment_status == EmploymentStatus.TEMPORARY) \
             .join(Parts, Parts.id == Users.part_id) \
             .join(Commutes, Commutes.user_id == Users.id) \
-            .filter(func.extract('year', Commutes.clock_in) == year) \
-            .filter(func.extract('month', Commutes.clock_in) == month) \
+            .filter(DatetimeUtil.in_month(Commutes.commute_date, year, month)) \
             .group_by(Users.id, Users.name, Branches.name, Parts.name)
         
         result = await self.session.execute(part_timer_summary_query)
@@ -596,8 +590,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .filter(Users.employment_status == EmploymentStatus.TEMPORARY) \
             .join(Parts, Parts.id == Users.part_id) \
             .join(Commutes, Commutes.user_id == Users.id) \
-            .filter(func.extract('year', Commutes.clock_in) == year) \
-            .filter(func.extract('month', Commutes.clock_in) == month) \
+            .filter(DatetimeUtil.in_month(Commutes.commute_date, year, month)) \
             .group_by(Users.id, Users.name, Branches.name, Parts.name)
         
         result = await self.session.execute(part_timer_summary_query)
@@ -626,8 +619,7 @@ class PartTimerRepository(IPartTimerRepository):
             .join(Parts, Parts.id == Users.part_id) \
                 .filter(Parts.id == part_id) \
             .join(Commutes, Commutes.user_id == Users.id) \
-                .filter(func.extract('year', Commutes.clock_in) == year) \
-                .filter(func.extract('month', Commutes.clock_in) == month) \
+                .filter(DatetimeUtil.in_month(Commutes.commute_date, year, month)) \
             .group_by(Users.id, Users.name, Branches.name, Parts.name)
         
         result = await self.session.execute(part_timer_summary_query)
@@ -654,8 +646,7 @@ class PartTimerRepository(IPartTimerRepository):
                 .filter(Users.employment_status == EmploymentStatus.TEMPORARY) \
             .join(Parts, Parts.id == Users.part_id) \
             .join(Commutes, Commutes.user_id == Users.id) \
-                .filter(func.extract('year', Commutes.clock_in) == year) \
-                .filter(func.extract('month', Commutes.clock_in) == month) \
+                .filter(DatetimeUtil.in_month(Commutes.commute_date, year, month)) \
         
         result = await self.session.execute(part_timer_summary_query)
         return result.all()
@@ -1,4 +1,5 @@
-from sqlalchemy import func, select, update
+from decimal import Decimal
+from sqlalchemy import case, func, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.enums.users import Status
 from app.models.branches.branches_model import Branches
@@ -11,32 +12,11 @@ from app.models.users.leave_histories_model import (
     LeaveHistoriesUpdate,
 )
 from app.models.users.users_model import Users
+from app.utils.keyset_pagination import Keyset
 from datetime import date, datetime
 
-
-async def get_leave_info(
-    branch_id: int, year: int, current_user_id: int, db: AsyncSession
-):
-    """
-    현재 사용자의 연차 일수 정보를 조회합니다.
-    올해 1월 1일부터 12월 31까지 1년동안의 연차 일수를 조회합니다.
-    """
-    start_date = date(year, 1, 1)
-    end_date = date(year, 12, 31)
-
-    leave_query = (
-        select(UserLeavesDays)
-        .where(
-            UserLeavesDays.user_id == current_user_id,
-            UserLeavesDays.branch_id == branch_id,
-            UserLeavesDays.deleted_yn == "N",
-            UserLeavesDays.created_at >= start_date,
-            UserLeavesDays.created_at <= end_date,
-        )
-        .order_by(UserLeavesDays.created_at.desc())
-    )
-    result = await db.execute(leave_query)
-    return result.scalar_one_or_none()
+# 연차 신청 목록 정렬 (최근 신청순, 같은 시각이면 id 역순)
+LEAVE_HISTORY_KEYSET = Keyset(LeaveHistories.created_at, LeaveHistories.id)
 
 
 async def get_user_info(current_user_id: int, db: AsyncSession):
@@ -60,9 +40,12 @@ async def fetch_leave_histories(
     search_phone,
     page,
     size,
+    cursor=None,
+    include_total=False,
 ):
     """
     연차 신청 목록을 조회합니다.
+    cursor가 있으면 page 대신 커서 이후부터 조회하고, 전체 개수는 include_total인 경우만 계산합니다. (없으면 None)
     """
     base_query = select(LeaveHistories).where(
         LeaveHistories.deleted_yn == "N",
@@ -81,12 +64,13 @@ async def fetch_leave_histories(
         base_query = base_query.join(Parts, LeaveHistories.part_id == Parts.id).where(
             Parts.id == part_id
         )
+    if search_name or search_phone:
+        # 지점 조인 뒤에도 신청자 기준으로 조인되도록 조인 조건을 명시
+        base_query = base_query.join(Users, LeaveHistories.user_id == Users.id)
     if search_name:
-        base_query = base_query.join(Users).where(Users.name.ilike(f"%{search_name}%"))
+        base_query = base_query.where(Users.name.ilike(f"%{search_name}%"))
     if search_phone:
-        base_query = base_query.join(Users).where(
-            Users.phone_number.ilike(f"%{search_phone}%")
-        )
+        base_query = base_query.where(Users.phone_number.ilike(f"%{search_phone}%"))
     if search.kind:
         base_query = base_query.join(LeaveHistories.leave_category).where(
             LeaveCategory.name.ilike(f"%{search.kind}%")
@@ -94,40 +78,56 @@ async def fetch_leave_histories(
     if search.status:
         base_query = base_query.where(LeaveHistories.status.ilike(f"%{search.status}%"))
 
-    skip = (page - 1) * size
-    stmt = (
-        base_query.order_by(LeaveHistories.created_at.desc()).offset(skip).limit(size)
-    )
+    stmt = LEAVE_HISTORY_KEYSET.paginate(base_query, cursor, size)
+    if not cursor:
+        stmt = stmt.offset((page - 1) * size)
 
     result = await db.execute(stmt)
-    leave_histories = result.scalars().all()
+    leave_histories, next_cursor = LEAVE_HISTORY_KEYSET.split(
+        result.scalars().all(), size, lambda leave_history: (leave_history.created_at, leave_history.id)
+    )
 
-    count_query = base_query.with_only_columns(func.count())
-    count_result = await db.execute(count_query)
-    total_count = count_result.scalar_one()
+    total_count = None
+    if not cursor or include_total:
+        count_query = base_query.with_only_columns(func.count())
+        count_result = await db.execute(count_query)
+        total_count = count_result.scalar_one()
 
-    return leave_histories, total_count
+    return leave_histories, total_count, next_cursor
 
 
-async def fetch_user_details(db: AsyncSession, leave_history):
+async def fetch_user_details(db: AsyncSession, leave_histories):
     """
     연차 신청 목록에서 회원의 상세 정보를 조회합니다.
+    페이지의 회원(지점/파트 포함)과 연차 종류를 IN 조건으로 응답에 필요한 컬럼만 한 번씩 조회합니다.
+    (user_id -> 회원/지점/파트 row, leave_category_id -> 연차 종류 이름)
     """
+    user_ids = {leave_history.user_id for leave_history in leave_histories}
+    category_ids = {leave_history.leave_category_id for leave_history in leave_histories}
+    if not user_ids:
+        return {}, {}
+
     user_result = await db.execute(
-        select(Users, Branches, Parts)
+        select(
+            Users.id.label("user_id"),
+            Users.name.label("user_name"),
+            Branches.id.label("branch_id"),
+            Branches.name.label("branch_name"),
+            Parts.id.label("part_id"),
+            Parts.name.label("part_name"),
+        )
         .join(Branches, Users.branch_id == Branches.id)
         .join(Parts, Users.part_id == Parts.id)
-        .where(Users.id == leave_history.user_id)
+        .where(Users.id.in_(user_ids))
     )
-    user, branch, part = user_result.first()
+    user_details = {row.user_id: row for row in user_result.all()}
 
-    category_query = select(LeaveCategory).where(
-        LeaveCategory.id == leave_history.leave_category_id
+    category_result = await db.execute(
+        select(LeaveCategory.id, LeaveCategory.name).where(LeaveCategory.id.in_(category_ids))
     )
-    category_result = await db.execute(category_query)
-    leave_category = category_result.scalar_one_or_none()
+    leave_category_names = dict(category_result.all())
 
-    return user, branch, part, leave_category
+    return user_details, leave_category_names
 
 
 async def fetch_approved_leave_data(
@@ -139,102 +139,112 @@ async def fetch_approved_leave_data(
     part_id,
     search_name,
     search_phone,
+    page: int,
+    size: int,
 ):
     """
     연차 전체 승인 목록을 조회합니다.
+    사원별 유급/무급/증가 일수는 조건부 합계 한 번으로, 총 연차 일수는 사원별 최신 UserLeavesDays로 구하며
+    페이지네이션과 개수도 DB에서 처리합니다. (페이지 크기와 관계없이 목록 1회 + 개수 1회)
     """
-    base_query = (
-        select(Users, Branches, Parts)
-        .join(Branches, Users.branch_id == Branches.id)
-        .join(Parts, Users.part_id == Parts.id)
-        .where(Users.deleted_yn == "N")
-    )
-
+    user_conditions = [Users.deleted_yn == "N"]
     if branch_id:
-        base_query = base_query.where(Branches.id == branch_id)
+        user_conditions.append(Branches.id == branch_id)
     if part_id:
-        base_query = base_query.where(Parts.id == part_id)
+        user_conditions.append(Parts.id == part_id)
     if search_name:
-        base_query = base_query.where(Users.name.ilike(f"%{search_name}%"))
+        user_conditions.append(Users.name.ilike(f"%{search_name}%"))
     if search_phone:
-        base_query = base_query.where(Users.phone_number.ilike(f"%{search_phone}%"))
-
-    users_result = await db.execute(base_query)
-    users = users_result.all()
-
-    formatted_data = []
-    current_year = datetime.now().year
-    year_start = datetime(current_year, 1, 1).date()
-
-    for user, branch, part in users:
-        unpaid_days_result = await db.execute(
-            select(func.sum(LeaveHistories.decreased_days).label("total_unpaid_days"))
-            .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
-            .where(
-                LeaveHistories.user_id == user.id,
-                LeaveCategory.is_paid == False,
-                LeaveHistories.status == "approved",
-                LeaveHistories.deleted_yn == "N",
-                LeaveHistories.application_date >= year_start,
-                LeaveHistories.application_date <= date_end_day,
-            )
+        user_conditions.append(Users.phone_number.ilike(f"%{search_phone}%"))
+
+    year_start = date(datetime.now().year, 1, 1)
+
+    # 올해 1월 1일부터 조회 주의 마지막 날까지의 사원별 합계
+    is_approved = LeaveHistories.status == "approved"
+    leave_sums = (
+        select(
+            LeaveHistories.user_id,
+            func.sum(
+                case((is_approved & (LeaveCategory.is_paid == True), LeaveHistories.decreased_days), else_=0)
+            ).label("paid_days"),
+            func.sum(
+                case((is_approved & (LeaveCategory.is_paid == False), LeaveHistories.decreased_days), else_=0)
+            ).label("unpaid_days"),
+            func.sum(LeaveHistories.increased_days).label("increased_days"),
         )
-        total_unpaid_days = unpaid_days_result.scalar() or 0
-
-        paid_days_result = await db.execute(
-            select(func.sum(LeaveHistories.decreased_days).label("total_paid_days"))
-            .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
-            .where(
-                LeaveHistories.user_id == user.id,
-                LeaveCategory.is_paid == True,
-                LeaveHistories.status == "approved",
-                LeaveHistories.deleted_yn == "N",
-                LeaveHistories.application_date >= year_start,
-                LeaveHistories.application_date <= date_end_day,
-            )
+        .outerjoin(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
+        .where(
+            LeaveHistories.deleted_yn == "N",
+            LeaveHistories.application_date >= year_start,
+            LeaveHistories.application_date <= date_end_day,
         )
-        total_paid_days = paid_days_result.scalar() or 0
-
-        increased_days_result = await db.execute(
-            select(
-                func.sum(LeaveHistories.increased_days).label("total_increased_days")
-            ).where(
-                LeaveHistories.user_id == user.id,
-                LeaveHistories.deleted_yn == "N",
-                LeaveHistories.application_date >= year_start,
-                LeaveHistories.application_date <= date_end_day,
-            )
+        .group_by(LeaveHistories.user_id)
+        .subquery()
+    )
+
+    # 사원별 가장 최근의 UserLeavesDays
+    latest_leaves_days = (
+        select(
+            UserLeavesDays.user_id,
+            UserLeavesDays.increased_days,
+            func.row_number().over(
+                partition_by=UserLeavesDays.user_id,
+                order_by=(UserLeavesDays.created_at.desc(), UserLeavesDays.id.desc()),
+            ).label("row_number"),
         )
-        total_increased_days = increased_days_result.scalar() or 0
+        .where(UserLeavesDays.deleted_yn == "N")
+        .subquery()
+    )
+
+    paid_days = func.coalesce(leave_sums.c.paid_days, 0)
+    total_leave_days = func.coalesce(latest_leaves_days.c.increased_days, 0)
 
-        total_leave_days_result = await db.execute(
-            select(UserLeavesDays.increased_days)
-            .where(UserLeavesDays.user_id == user.id, UserLeavesDays.deleted_yn == "N")
-            .order_by(UserLeavesDays.created_at.desc())
-            .limit(1)
+    base_query = (
+        select(
+            Users.id.label("user_id"),
+            Users.name.label("user_name"),
+            Users.phone_number.label("user_phone"),
+            Users.gender.label("user_gender"),
+            Users.hire_date.label("user_hire_date"),
+            Users.resignation_date.label("user_resignation_date"),
+            Branches.id.label("branch_id"),
+            Branches.name.label("branch_name"),
+            Parts.id.label("part_id"),
+            Parts.name.label("part_name"),
+            paid_days.label("decreased_days"),
+            func.coalesce(leave_sums.c.unpaid_days, 0).label("unpaid"),
+            func.coalesce(leave_sums.c.increased_days, 0).label("increased_days"),
+            total_leave_days.label("total_leave_days"),
+            (total_leave_days - paid_days).label("can_use_days"),
+        )
+        .join(Branches, Users.branch_id == Branches.id)
+        .join(Parts, Users.part_id == Parts.id)
+        .outerjoin(leave_sums, leave_sums.c.user_id == Users.id)
+        .outerjoin(
+            latest_leaves_days,
+            (latest_leaves_days.c.user_id == Users.id) & (latest_leaves_days.c.row_number == 1),
         )
-        yearly_total_leave_days = total_leave_days_result.scalar() or 0
-
-        leave_history_data = {
-            "user_id": user.id,
-            "user_name": user.name,
-            "user_phone": user.phone_number,
-            "user_gender": user.gender,
-            "user_hire_date": user.hire_date,
-            "user_resignation_date": user.resignation_date,
-            "branch_id": branch.id,
-            "branch_name": branch.name,
-            "part_id": part.id,
-            "part_name": part.name,
-            "decreased_days": float(total_paid_days),
-            "unpaid": float(total_unpaid_days),
-            "increased_days": float(total_increased_days),
-            "total_leave_days": float(yearly_total_leave_days),
-            "can_use_days": float(yearly_total_leave_days - total_paid_days),
-        }
+        .where(*user_conditions)
+    )
+
+    # 개수는 집계 없이 조건에 맞는 사원만 셉니다.
+    total_count = await db.scalar(
+        select(func.count(Users.id))
+        .join(Branches, Users.branch_id == Branches.id)
+        .join(Parts, Users.part_id == Parts.id)
+        .where(*user_conditions)
+    )
+
+    result = await db.execute(
+        base_query.order_by(Users.id).offset((page - 1) * size).limit(size)
+    )
+    formatted_data = []
+    for row in result.mappings():
+        leave_history_data = dict(row)
+        for key in ("decreased_days", "unpaid", "increased_days", "total_leave_days", "can_use_days"):
+            leave_history_data[key] = float(leave_history_data[key])
         formatted_data.append(leave_history_data)
 
-    total_count = len(formatted_data)
     return formatted_data, total_count
 
 
@@ -275,7 +285,7 @@ async def create_leave_history_record(
     db.add(create)
     await db.flush()
     await db.refresh(create)
-    return create.id
+    return create
 
 async def get_user_leaves_days_record(user_id: int, db: AsyncSession):
     """
@@ -356,6 +366,95 @@ async def update_leave_history_status(
     leave_history.approve_date = datetime.now()
     leave_history.updated_at = datetime.now()
 
+
+async def find_leave_histories_for_update(db: AsyncSession, leave_ids: list[int], branch_id: int) -> dict:
+    """일괄 승인/반려할 연차 (id -> row). 같은 건을 동시에 처리하지 않도록 행 잠금"""
+    result = await db.execute(
+        select(
+            LeaveHistories.id,
+            LeaveHistories.user_id,
+            LeaveHistories.status,
+            LeaveHistories.decreased_days,
+            LeaveHistories.application_date,
+            LeaveHistories.start_date,
+            LeaveHistories.end_date,
+        )
+        .where(
+            LeaveHistories.id.in_(leave_ids),
+            LeaveHistories.branch_id == branch_id,
+            LeaveHistories.deleted_yn == "N",
+        )
+        .with_for_update()
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def find_user_leaves_days_for_update(db: AsyncSession, user_ids: set[int]) -> dict:
+    """사용자별 가장 최근의 연차 일수 정보 (user_id -> row). 사용자들의 연차 일수 행을 한 번에 잠급니다."""
+    result = await db.execute(
+        select(UserLeavesDays.id, UserLeavesDays.user_id, UserLeavesDays.total_leave_days)
+        .where(UserLeavesDays.user_id.in_(user_ids), UserLeavesDays.deleted_yn == "N")
+        .order_by(UserLeavesDays.user_id, UserLeavesDays.created_at.desc(), UserLeavesDays.id.desc())
+        .with_for_update()
+    )
+    records = {}
+    for row in result.all():
+        records.setdefault(row.user_id, row)
+    return records
+
+
+async def update_leave_histories_status(
+    db: AsyncSession, leave_ids: list[int], status: str, admin_description, current_user
+) -> None:
+    """연차 일괄 승인/반려 (한 번의 UPDATE)"""
+    now = datetime.now()
+    await db.execute(
+        update(LeaveHistories)
+        .where(LeaveHistories.id.in_(leave_ids))
+        .values(
+            status=status,
+            admin_description=admin_description,
+            manager_id=current_user.id,
+            manager_name=current_user.name,
+            approve_date=now,
+            updated_at=now,
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def decrease_user_leaves_days(db: AsyncSession, decreased_days: dict[int, Decimal]) -> None:
+    """연차 일수 정보 일괄 차감 (UserLeavesDays.id -> 차감 일수, 음수면 복원. 한 번의 UPDATE)"""
+    if not decreased_days:
+        return
+    days = case(decreased_days, value=UserLeavesDays.id)
+    await db.execute(
+        update(UserLeavesDays)
+        .where(UserLeavesDays.id.in_(decreased_days))
+        .values(
+            decreased_days=UserLeavesDays.decreased_days + days,
+            total_leave_days=UserLeavesDays.total_leave_days - days,
+            updated_at=datetime.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def decrease_users_total_leave_days(db: AsyncSession, decreased_days: dict[int, Decimal]) -> None:
+    """잔여 연차 수 일괄 차감 (user_id -> 차감 일수, 음수면 복원. 한 번의 UPDATE)"""
+    if not decreased_days:
+        return
+    await db.execute(
+        update(Users)
+        .where(Users.id.in_(decreased_days))
+        .values(
+            total_leave_days=Users.total_leave_days - case(decreased_days, value=Users.id),
+            updated_at=datetime.now(),
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
 async def get_leave_history_by_id_and_branch(
     leave_id: int, branch_id: int, db: AsyncSession
 ):
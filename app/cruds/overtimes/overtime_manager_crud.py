@@ -0,0 +1,182 @@
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from typing import NamedTuple, Optional
+
+from sqlalchemy import Integer, Select, bindparam, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.branches.branches_model import Branches
+from app.models.parts.parts_model import Parts
+from app.models.users.overtimes_model import Overtimes
+from app.models.users.users_model import Users
+from app.utils.keyset_pagination import Keyset
+
+
+class OvertimeManagerFilter(NamedTuple):
+    """
+    오버타임 관리 조회 조건
+        - 범위: 전체 / 지점(branch_id) / 파트(branch_id + part_id)
+        - 기간: 전체 / start_date ~ end_date (월간, 주간)
+        - 검색: 이름, 전화번호, 지점명, 파트명, 상태 (부분 일치)
+    """
+    branch_id: Optional[int] = None
+    part_id: Optional[int] = None
+    start_date: Optional[date] = None
+    end_date: Optional[date] = None
+    name: Optional[str] = None
+    phone_number: Optional[str] = None
+    branch_name: Optional[str] = None
+    part_name: Optional[str] = None
+    status: Optional[str] = None
+
+    def shape(self) -> tuple[bool, ...]:
+        """값이 있는 조건의 조합 (같은 조합이면 같은 statement를 재사용)"""
+        return tuple(value is not None and value != "" for value in self)
+
+    def params(self) -> dict:
+        params = {}
+        for key, value in self._asdict().items():
+            if value is None or value == "":
+                continue
+            params[key] = f"%{value}%" if key in LIKE_FIELDS else value
+        return params
+
+
+LIKE_FIELDS = frozenset({"name", "phone_number", "branch_name", "part_name", "status"})
+
+# 조회 컬럼 (ORM 엔티티 대신 필요한 컬럼만 튜플로 조회)
+OVERTIME_MANAGER_COLUMNS = (
+    Users.id,
+    Users.name,
+    Parts.id,
+    Parts.name,
+    Branches.id,
+    Branches.name,
+    Overtimes.id,
+    Overtimes.overtime_hours,
+    Overtimes.status,
+    Overtimes.application_date,
+    Overtimes.application_memo,
+    Overtimes.manager_id,
+    Overtimes.manager_name,
+    Overtimes.manager_memo,
+)
+
+# 정렬 (신청일 최신순, 같은 날이면 id 역순). 커서 조회 시 마지막 행의 (신청일, id) 이후부터 조회합니다.
+OVERTIME_MANAGER_KEYSET = Keyset(Overtimes.application_date, Overtimes.id)
+CURSOR_PARAMS = ("cursor_application_date", "cursor_id")
+
+# (조건 조합(shape), 커서 사용 여부)별 statement. 값은 bindparam으로 전달하므로 SQL 컴파일 캐시도 그대로 재사용됩니다.
+_statement_cache: dict[tuple[tuple[bool, ...], bool], Select] = {}
+
+
+def get_overtime_manager_statement(shape: tuple[bool, ...], use_cursor: bool = False) -> Select:
+    stmt = _statement_cache.get((shape, use_cursor))
+    if stmt is None:
+        stmt = _statement_cache[(shape, use_cursor)] = _build_statement(OvertimeManagerFilter(*shape), use_cursor)
+    return stmt
+
+
+def _build_statement(shape: OvertimeManagerFilter, use_cursor: bool) -> Select:
+    stmt = (
+        select(*OVERTIME_MANAGER_COLUMNS)
+        .join(Branches, Branches.id == Users.branch_id)
+        .join(Parts, Parts.id == Users.part_id)
+        .join(Overtimes, Overtimes.applicant_id == Users.id)
+        .where(
+            Branches.deleted_yn == "N",
+            Parts.deleted_yn == "N",
+            Users.deleted_yn == "N",
+            Overtimes.deleted_yn == "N"
+        )
+    )
+
+    if shape.branch_id:
+        stmt = stmt.where(Branches.id == bindparam("branch_id"))
+    if shape.part_id:
+        stmt = stmt.where(Parts.id == bindparam("part_id"))
+    if shape.start_date:
+        stmt = stmt.where(Overtimes.application_date >= bindparam("start_date"))
+    if shape.end_date:
+        stmt = stmt.where(Overtimes.application_date <= bindparam("end_date"))
+    if shape.name:
+        stmt = stmt.where(Users.name.like(bindparam("name")))
+    if shape.phone_number:
+        stmt = stmt.where(Users.phone_number.like(bindparam("phone_number")))
+    if shape.branch_name:
+        stmt = stmt.where(Branches.name.like(bindparam("branch_name")))
+    if shape.part_name:
+        stmt = stmt.where(Parts.name.like(bindparam("part_name")))
+    if shape.status:
+        stmt = stmt.where(Overtimes.status.like(bindparam("status")))
+
+    stmt = stmt.order_by(*OVERTIME_MANAGER_KEYSET.order_by())
+    if use_cursor:
+        stmt = stmt.where(OVERTIME_MANAGER_KEYSET.after([bindparam(name) for name in CURSOR_PARAMS]))
+    else:
+        stmt = stmt.offset(bindparam("skip", type_=Integer))
+
+    return stmt.limit(bindparam("limit", type_=Integer))
+
+
+async def fetch_overtime_manager(
+    db: AsyncSession,
+    overtime_filter: OvertimeManagerFilter,
+    skip: int,
+    limit: int,
+    cursor: Optional[str] = None
+) -> tuple[list[dict], Optional[str]]:
+    """
+    오버타임 관리 목록과 다음 페이지 커서 (마지막 페이지면 None)
+    cursor가 있으면 skip 대신 커서 이후부터 조회합니다.
+    """
+    stmt = get_overtime_manager_statement(overtime_filter.shape(), bool(cursor))
+    params = overtime_filter.params()
+    if cursor:
+        params.update(zip(CURSOR_PARAMS, OVERTIME_MANAGER_KEYSET.decode(cursor)))
+    else:
+        params["skip"] = skip
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회
+    params["limit"] = limit + 1
+
+    result = await db.execute(stmt, params)
+    rows, next_cursor = OVERTIME_MANAGER_KEYSET.split(result.tuples(), limit, lambda row: (row[9], row[6]))
+    return [
+        {
+            "user" : { "user_id" : user_id, "user_name" : user_name },
+            "part" : { "part_id" : part_id, "part_name" : part_name },
+            "branch" : { "branch_id" : branch_id, "branch_name" : branch_name },
+            "overtime" : { "overtime_id" : overtime_id, "overtime_overtime_hours" : overtime_hours, "overtime_status" : status, "overtime_application_date" : application_date, "overtime_application_memo" : application_memo },
+            "overtime_manager" : { "overtime_manager_id" : manager_id, "overtime_manager_name" : manager_name, "overtime_manager_memo" : manager_memo }
+        }
+        for (
+            user_id, user_name, part_id, part_name, branch_id, branch_name,
+            overtime_id, overtime_hours, status, application_date, application_memo,
+            manager_id, manager_name, manager_memo
+        ) in rows
+    ], next_cursor
+
+
+def month_period(date_str: str) -> tuple[date, date]:
+    """date가 속한 달의 1일 ~ 말일"""
+    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+    _, last_day = monthrange(date_obj.year, date_obj.month)
+    return date_obj.replace(day=1), date_obj.replace(day=last_day)
+
+
+def week_period(date_str: str) -> tuple[date, date]:
+    """date가 속한 주의 일요일 ~ 토요일 (주의 시작일이 이전 달이면 해당 월 1일부터)"""
+    date_obj = datetime.strptime(date_str, "%Y-%m-%d").date()
+
+    # 해당 주의 일요일 찾기 (주의 시작일)
+    start_of_week = date_obj - timedelta(days=date_obj.weekday() + 1)
+    if start_of_week.month != date_obj.month:
+        start_of_week = date_obj.replace(day=1)
+
+    # 해당 주의 토요일 찾기 (주의 마지막 날)
+    end_of_week = start_of_week + timedelta(days=6)
+    _, last_day = monthrange(date_obj.year, date_obj.month)
+    if end_of_week.day > last_day:
+        end_of_week = date_obj.replace(day=last_day)
+
+    return start_of_week, end_of_week
@@ -0,0 +1,161 @@
+from datetime import date
+from typing import Optional
+
+from sqlalchemy import Select, func, insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.branches.branches_model import Branches
+from app.models.branches.overtime_policies_model import OverTimePolicies
+from app.models.parts.parts_model import Parts
+from app.models.users.overtimes_model import OverTime_History, Overtimes
+from app.models.users.users_model import Users
+from app.utils.keyset_pagination import Keyset
+
+# 초과 근무 목록 정렬 (최근 신청순, 같은 시각이면 id 역순)
+OVERTIME_KEYSET = Keyset(Overtimes.created_at, Overtimes.id)
+
+# 초과 근무 목록 응답 필드와 컬럼 (신청자/지점/파트는 조인으로 함께 조회)
+OVERTIME_LIST_FIELDS = {
+    "id": Overtimes.id,
+    "applicant_id": Users.id,
+    "user_name": Users.name,
+    "user_phone_number": Users.phone_number,
+    "user_gender": Users.gender,
+    "user_hire_date": Users.hire_date,
+    "user_resignation_date": Users.resignation_date,
+    "branch_id": Branches.id,
+    "branch_name": Branches.name,
+    "part_id": Parts.id,
+    "part_name": Parts.name,
+    "application_date": Overtimes.application_date,
+    "overtime_hours": Overtimes.overtime_hours,
+    "application_memo": Overtimes.application_memo,
+    "manager_memo": Overtimes.manager_memo,
+    "status": Overtimes.status,
+    "manager_id": Overtimes.manager_id,
+    "manager_name": Overtimes.manager_name,
+    "processed_date": Overtimes.processed_date,
+    "is_approved": Overtimes.is_approved,
+}
+
+
+async def find_overtimes_for_update(db: AsyncSession, overtime_ids: list[int]) -> dict:
+    """처리할 초과 근무 (id -> row). 같은 건을 동시에 처리하지 않도록 행 잠금"""
+    result = await db.execute(
+        select(
+            Overtimes.id, Overtimes.applicant_id, Overtimes.overtime_hours, Overtimes.status,
+            Overtimes.application_date, Overtimes.approved_money
+        )
+        .where(Overtimes.id.in_(overtime_ids), Overtimes.deleted_yn == "N")
+        .with_for_update()
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def find_applicants(db: AsyncSession, user_ids: set[int]) -> dict:
+    """
+    신청자 (user_id -> row)
+    is_doctor는 파트가 없거나 삭제된 경우 None
+    """
+    result = await db.execute(
+        select(Users.id, Users.branch_id, Parts.is_doctor)
+        .outerjoin(Parts, (Parts.id == Users.part_id) & (Parts.deleted_yn == "N"))
+        .where(Users.id.in_(user_ids), Users.deleted_yn == "N")
+    )
+    return {row.id: row for row in result.all()}
+
+
+async def find_overtime_policies(db: AsyncSession, branch_ids: set[int]) -> dict:
+    """지점별 오버타임 정책 (branch_id -> OverTimePolicies). 삭제된 지점/정책 제외"""
+    result = await db.scalars(
+        select(OverTimePolicies)
+        .join(Branches, Branches.id == OverTimePolicies.branch_id)
+        .where(
+            OverTimePolicies.branch_id.in_(branch_ids),
+            OverTimePolicies.deleted_yn == "N",
+            Branches.deleted_yn == "N"
+        )
+        .order_by(OverTimePolicies.id)
+    )
+    policies = {}
+    for policy in result:
+        policies.setdefault(policy.branch_id, policy)
+    return policies
+
+
+async def update_overtimes_status(
+    db: AsyncSession,
+    overtime_ids: list[int],
+    status: str,
+    is_approved: str,
+    manager: Users,
+    manager_memo: Optional[str],
+    processed_date: date
+) -> None:
+    """초과 근무 상태 일괄 변경 (한 번의 UPDATE)"""
+    await db.execute(
+        update(Overtimes)
+        .where(Overtimes.id.in_(overtime_ids))
+        .values(
+            status=status,
+            is_approved=is_approved,
+            manager_id=manager.id,
+            manager_name=manager.name,
+            manager_memo=manager_memo,
+            processed_date=processed_date
+        )
+        .execution_options(synchronize_session=False)
+    )
+
+
+async def update_overtimes_approved_money(db: AsyncSession, approved_money: dict[int, int]) -> None:
+    """승인 시점 수당 기록 (overtime_id -> 금액, 기본 키 기준 일괄 UPDATE)"""
+    if approved_money:
+        await db.execute(
+            update(Overtimes),
+            [{"id": overtime_id, "approved_money": money} for overtime_id, money in approved_money.items()]
+        )
+
+
+async def add_overtime_histories(db: AsyncSession, histories: list[dict]) -> None:
+    """오버타임 이력 일괄 추가 (한 번의 INSERT)"""
+    if histories:
+        await db.execute(insert(OverTime_History), histories)
+
+
+def overtime_list_query(*conditions) -> Select:
+    """초과 근무 목록 조회 (응답 컬럼만 조회하며, 신청자/지점/파트를 한 번에 조인)"""
+    return (
+        select(*OVERTIME_LIST_FIELDS.values(), Overtimes.created_at)
+        .join(Users, Overtimes.applicant_id == Users.id)
+        .join(Branches, Users.branch_id == Branches.id)
+        .join(Parts, Users.part_id == Parts.id)
+        .where(Overtimes.deleted_yn == "N", *conditions)
+    )
+
+
+async def fetch_overtime_list(
+    db: AsyncSession,
+    query: Select,
+    page: int,
+    size: int,
+    cursor: Optional[str] = None,
+    include_total: bool = False
+) -> tuple[list[dict], Optional[int], Optional[str]]:
+    """
+    초과 근무 목록 한 페이지 (목록, 전체 개수, 다음 페이지 커서)
+    페이지 크기와 관계없이 목록 1회 + 개수 1회만 조회합니다. (커서 조회는 include_total인 경우만 개수 조회)
+    """
+    stmt = OVERTIME_KEYSET.paginate(query, cursor, size)
+    if not cursor:
+        stmt = stmt.offset((page - 1) * size)
+
+    result = await db.execute(stmt)
+    rows, next_cursor = OVERTIME_KEYSET.split(result.all(), size, lambda row: (row.created_at, row.id))
+    data = [dict(zip(OVERTIME_LIST_FIELDS, row)) for row in rows]
+
+    total_count = None
+    if not cursor or include_total:
+        total_count = await db.scalar(select(func.count()).select_from(query.subquery()))
+
+    return data, total_count, next_cursor
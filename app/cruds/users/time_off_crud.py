@@ -128,7 +128,7 @@ async def time_off_delete(
         *,
         session: AsyncSession,
         id: int
-) -> bool:
+) -> Optional[TimeOff]:
     try:
         # 존재하는지 먼저 확인
         stmt = select(TimeOff).where(
@@ -143,9 +143,8 @@ async def time_off_delete(
             existing_time_off.deleted_yn = 'Y'
 
             await session.commit()
-            return True
-        
-        return False
+
+        return existing_time_off
     
     except Exception as error:
         await session.rollback()
@@ -70,6 +70,21 @@ class Status(str, Enum):
     REJECTED = "rejected"
 
 
+class LeaveLedgerType(str, Enum):
+    """
+    연차 원장 기록 유형
+    """
+
+    OPENING = "opening"  # 기초 잔여 (원장 도입 시점 또는 해가 바뀐 뒤 첫 기록 시점의 이월 잔여)
+    GRANT = "grant"  # 자동 부여 (스케줄러)
+    EXPIRE = "expire"  # 잔여 소멸 (초기화 방식의 자동 부여)
+    MANUAL = "manual"  # 수동 증감
+    REQUEST = "request"  # 연차 신청
+    APPROVE = "approve"  # 승인
+    REJECT = "reject"  # 반려
+    CANCEL = "cancel"  # 신청 삭제
+
+
 # TODO : 영문 Status, 국문 Status 중 택 1하여, 하나로 통합 관리
 class StatusKor(str, Enum):
     """
@@ -8,10 +8,11 @@ from app.api import main
 from app.api.routes.auth import auth
 from contextlib import asynccontextmanager
 from app.core.log_config import get_logger
-from app.middleware.token_middleware import TokenMiddleware
-from app.middleware.role_branch_middleware import RoleBranchMiddleware
+from app.middleware.auth_middleware import AuthMiddleware
+from app.middleware.query_metrics_middleware import QueryMetricsMiddleware
 from app.core.config import settings
 from app.schedulers.schedulers import scheduler
+from app.service.password_service import password_service
 from app.utils.slack_utils import SlackAPI
 
 
@@ -22,6 +23,7 @@ async def lifespan(app: FastAPI):
     yield
 
     scheduler.shutdown()
+    password_service.shutdown()
 
 
 # FastAPI 앱 생성 시 Swagger UI 기본 설정 추가
@@ -100,9 +102,9 @@ origins = [
 ]
 
 
-app.add_middleware(RoleBranchMiddleware)  #type: ignore #RoleBranchMiddleware가 user 정보를 사용
+app.add_middleware(AuthMiddleware)  #type: ignore #인증(JWT) + 역할/지점 권한 검사를 한 번에 처리
 
-app.add_middleware(TokenMiddleware)     #type: ignore #TokenMiddleware가 먼저 실행되어 user 정보를 설정
+app.add_middleware(QueryMetricsMiddleware)  #type: ignore #요청별 SQL 수/DB 시간 계측 (인증 단계 쿼리 포함)
 
 app.add_middleware(
     CORSMiddleware,  # type: ignore
@@ -0,0 +1,189 @@
+"""
+인증 미들웨어 요청당 오버헤드 마이크로 벤치마크
+
+    python -m app.middleware.auth_benchmark --requests 5000
+
+app/api/main.py에 등록된 라우트 경로로 요청을 만들어 같은 더미 엔드포인트 앞에서 비교합니다.
+    - before: 통합 전 TokenMiddleware + RoleBranchMiddleware 구조 (BaseHTTPMiddleware 2단, 이 모듈에만 남겨둔 비교 기준)
+    - after : AuthMiddleware (pure ASGI, 단일 패스)
+DB 조회를 배제하기 위해 Principal은 캐시에 미리 넣어두고, JWT 검증은 양쪽 모두 수행합니다.
+"""
+import argparse
+import asyncio
+import re
+import time
+from collections import Counter
+
+from fastapi import Request
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.responses import JSONResponse
+
+from app.api.main import app as api_router
+from app.core.config import settings
+from app.core.database import RequestSession
+from app.core.permissions.auth_utils import RoleAuthority
+from app.enums.users import Role
+from app.middleware.auth_middleware import ROUTE_CONFIG, AuthMiddleware
+from app.middleware.jwt.jwtService import JWTDecoder, JWTEncoder, JWTService
+from app.middleware.principal_cache import Principal, principal_cache
+
+PATH_PARAM_PATTERN = re.compile(r"\{(\w+)(?::\w+)?\}")
+BENCH_USER_ID = 1
+BENCH_BRANCH_ID = 1
+BRANCH_PATTERN = re.compile(r"^/(?P<prefix>\w+)/branches/(?P<branch_id>\d+)(?:/.*)?$")
+
+
+class _LegacyTokenMiddleware(BaseHTTPMiddleware):
+    """통합 전 토큰 검증 단계 (요청 세션 생성 + 헤더 파싱 + JWT 검증 + Principal 캐시 조회)"""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        request_session = RequestSession()
+        request.state.db_session = request_session
+        try:
+            if any(request.url.path.startswith(p) for p in settings.PUBLIC_PATHS):
+                return await call_next(request)
+
+            auth_header = request.headers.get("Authorization")
+            if not auth_header:
+                return JSONResponse(status_code=401, content={"detail": "로그인을 진행해주세요."})
+            token = auth_header[7:] if auth_header.lower().startswith("bearer ") else auth_header
+
+            payload = JWTService(None, JWTDecoder()).check_token_expired(token)
+            if payload is None:
+                return JSONResponse(status_code=401, content={"detail": "토큰이 만료되었습니다."})
+
+            # 벤치마크는 캐시 적중 경로만 측정 (Principal은 main에서 미리 캐시)
+            user_id = int(payload.get("id"))
+            principal = principal_cache.get(user_id, payload.get("iat", payload.get("exp")))
+            if principal is None or not principal.is_active:
+                return JSONResponse(status_code=401, content={"detail": "접근 권한이 없습니다."})
+
+            request.state.user_id = user_id
+            request.state.principal = principal
+            request.state.user = principal
+            return await call_next(request)
+        finally:
+            await request_session.close()
+
+
+class _LegacyRoleBranchMiddleware(BaseHTTPMiddleware):
+    """통합 전 역할/지점 검사 단계"""
+
+    async def dispatch(self, request: Request, call_next):
+        if request.method == "OPTIONS":
+            return await call_next(request)
+
+        path = request.url.path
+        prefix = path.split("/")[1] if len(path.split("/")) > 1 else None
+        if not prefix or prefix not in ROUTE_CONFIG:
+            return await call_next(request)
+
+        user = getattr(request.state, "user", None)
+        if user is None:
+            return JSONResponse(status_code=401, content={"detail": "인증이 필요합니다."})
+
+        config = ROUTE_CONFIG[prefix]
+        if not RoleAuthority.check_role_level(user.role, config.required_role):
+            return JSONResponse(status_code=401, content={"detail": f"{config.required_role.value} 이상의 권한이 필요합니다."})
+        if config.check_branch:
+            match = BRANCH_PATTERN.match(path)
+            if match and match.group("prefix") == prefix and user.role != Role.MSO and user.branch_id != int(match.group("branch_id")):
+                return JSONResponse(status_code=401, content={"detail": "본인 소속 지점의 데이터만 접근할 수 있습니다."})
+
+        return await call_next(request)
+
+
+async def dummy_endpoint(scope, receive, send):
+    await send({"type": "http.response.start", "status": 200, "headers": [(b"content-length", b"0")]})
+    await send({"type": "http.response.body", "body": b""})
+
+
+def collect_requests() -> list[tuple[str, str]]:
+    """라우터에 등록된 (method, path) 목록. path 파라미터는 고정값으로 치환"""
+    requests = []
+    for route in api_router.routes:
+        methods = getattr(route, "methods", None)
+        if not methods:
+            continue
+        path = PATH_PARAM_PATTERN.sub(
+            lambda m: str(BENCH_BRANCH_ID) if m.group(1) == "branch_id" else "1",
+            route.path
+        )
+        requests.append((sorted(methods)[0], path))
+    return requests
+
+
+def build_scope(method: str, path: str, token: str) -> dict:
+    return {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": method,
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "query_string": b"",
+        "root_path": "",
+        "headers": [(b"authorization", f"Bearer {token}".encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("127.0.0.1", 8000),
+    }
+
+
+async def run_pipeline(asgi_app, requests: list[tuple[str, str]], token: str, total: int) -> tuple[float, Counter]:
+    statuses = Counter()
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses[message["status"]] += 1
+
+    started = time.perf_counter()
+    for index in range(total):
+        method, path = requests[index % len(requests)]
+        await asgi_app(build_scope(method, path, token), receive, send)
+    elapsed = time.perf_counter() - started
+
+    return elapsed / total * 1_000_000, statuses
+
+
+async def main(total: int) -> None:
+    jwt_service = JWTService(JWTEncoder(), JWTDecoder())
+    token = jwt_service._create_token(data={"id": BENCH_USER_ID})
+    payload = jwt_service.check_token_expired(token)
+    principal_cache.set(
+        BENCH_USER_ID,
+        payload["iat"],
+        Principal.from_row(BENCH_USER_ID, Role.MSO.value, BENCH_BRANCH_ID, None, "N"),
+    )
+
+    requests = collect_requests()
+    pipelines = {
+        "bare endpoint": dummy_endpoint,
+        "before (Token + RoleBranch)": _LegacyTokenMiddleware(_LegacyRoleBranchMiddleware(dummy_endpoint)),
+        "after (AuthMiddleware)": AuthMiddleware(dummy_endpoint),
+    }
+
+    # warm-up
+    for asgi_app in pipelines.values():
+        await run_pipeline(asgi_app, requests, token, len(requests))
+
+    print(f"routes: {len(requests)}, requests per pipeline: {total}")
+    baseline = None
+    for name, asgi_app in pipelines.items():
+        per_request_us, statuses = await run_pipeline(asgi_app, requests, token, total)
+        if baseline is None:
+            baseline = per_request_us
+        print(f"{name:<30} {per_request_us:8.1f} us/req  overhead {per_request_us - baseline:8.1f} us  status {dict(statuses)}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=5000)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests))
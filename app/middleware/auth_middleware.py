@@ -0,0 +1,247 @@
+from typing import Optional, NamedTuple
+
+from sqlalchemy import select
+from starlette.responses import JSONResponse
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.database import RequestSession
+from app.core.permissions.auth_utils import RoleAuthority
+from app.enums.users import Role
+from app.middleware.jwt.jwtService import JWTDecoder, JWTService
+from app.middleware.principal_cache import Principal, principal_cache
+from app.models.users.users_model import Users
+
+
+class RouteConfig(NamedTuple):
+    """라우트 설정을 위한 데이터 클래스"""
+    required_role: Role #해당 라우트에 접근하기 위해 필요한 최소 권한
+    check_branch: bool = False #지점 접근 권한 검사 여부
+
+
+# 라우트 설정
+# - admin: 관리자 권한(파트/통합/최고/mso) 필요, 지점 체크 필요
+# - employee: 사원 권한 필요, 지점 체크 필요
+# - mso: MSO 권한 필요, 지점 체크 불필요 (모든 지점 접근 가능)
+ROUTE_CONFIG = {
+    "admin": RouteConfig(Role.ADMIN, check_branch=True),
+    "employee": RouteConfig(Role.EMPLOYEE, check_branch=True),
+    "mso": RouteConfig(Role.MSO, check_branch=False)
+}
+
+
+class RouteMatch(NamedTuple):
+    """경로 매칭 결과"""
+    is_public: bool
+    config: Optional[RouteConfig] = None
+    branch_id: Optional[int] = None #/{prefix}/branches/{branch_id}/... 형태인 경우의 branch_id
+
+
+class _TrieNode:
+    __slots__ = ("children", "is_public", "config", "branch_scope")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.is_public = False
+        self.config: Optional[RouteConfig] = None
+        self.branch_scope = False #다음 세그먼트가 branch_id인 노드 (/{prefix}/branches)
+
+
+class RouteTrie:
+    """
+    URL 세그먼트 단위 prefix 트리
+        - 앱 시작 시 public 경로와 prefix별 라우트 설정을 미리 트리로 구성합니다.
+        - 요청마다 경로를 한 번만 분리하여 public 여부, 권한 설정, branch_id를 한 번에 찾습니다.
+        - public 경로는 세그먼트 단위로 매칭합니다. (/docs -> /docs, /docs/oauth2-redirect)
+    """
+
+    def __init__(self, public_paths: list[str], route_config: dict[str, RouteConfig]):
+        self.root = _TrieNode()
+
+        for public_path in public_paths:
+            self._insert(public_path).is_public = True
+
+        for prefix, config in route_config.items():
+            self._insert(f"/{prefix}").config = config
+            if config.check_branch:
+                self._insert(f"/{prefix}/branches").branch_scope = True
+
+    def _insert(self, path: str) -> _TrieNode:
+        node = self.root
+        for segment in path.strip("/").split("/"):
+            node = node.children.setdefault(segment, _TrieNode())
+        return node
+
+    def match(self, path: str) -> RouteMatch:
+        node = self.root
+        config = None
+        segments = path.split("/")
+
+        for index in range(1, len(segments)):
+            node = node.children.get(segments[index])
+            if node is None:
+                break
+            if node.is_public:
+                return RouteMatch(is_public=True)
+            if node.config is not None:
+                config = node.config
+            if node.branch_scope:
+                branch_segment = segments[index + 1] if index + 1 < len(segments) else ""
+                branch_id = int(branch_segment) if branch_segment.isdecimal() else None
+                return RouteMatch(is_public=False, config=config, branch_id=branch_id)
+
+        return RouteMatch(is_public=False, config=config)
+
+
+class AuthMiddleware:
+    """
+    인증/인가를 한 번에 처리하는 ASGI 미들웨어 (TokenMiddleware + RoleBranchMiddleware 통합)
+        1. public 경로 확인
+        2. JWT 검증
+        3. 사용자(Principal) 조회 - 캐시 우선
+        4. URL prefix에 따른 역할 기반 접근 제어 및 지점 접근 권한 검사
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.route_trie = RouteTrie(settings.PUBLIC_PATHS, ROUTE_CONFIG)
+        self.jwt_service = JWTService(None, JWTDecoder())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        # http 요청이 아니거나 CORS preflight 요청은 그대로 통과
+        if scope["type"] != "http" or scope["method"] == "OPTIONS":
+            await self.app(scope, receive, send)
+            return
+
+        # 요청 단위 세션 생성 (get_db 의존성과 공유, 실제 커넥션은 처음 사용할 때 획득)
+        request_session = RequestSession()
+        state = scope.setdefault("state", {})
+        state["db_session"] = request_session
+        try:
+            error_response = await self._authenticate(scope, state, request_session)
+            if error_response is not None:
+                await error_response(scope, receive, send)
+                return
+
+            await self.app(scope, receive, send)
+        finally:
+            await request_session.close()
+
+    async def _authenticate(self, scope: Scope, state: dict, request_session: RequestSession) -> Optional[JSONResponse]:
+        path = scope["path"]
+        route = self.route_trie.match(path)
+
+        # public paths 체크
+        if route.is_public:
+            return None
+
+        # 헤더 체크
+        auth_header = self._get_authorization_header(scope)
+
+        if not auth_header:
+            return JSONResponse(
+                status_code=401,
+                content={"detail": "로그인을 진행해주세요."}
+            )
+
+        # Bearer 접두사가 이미 있는지 확인
+        if auth_header.lower().startswith('bearer '):
+            token = auth_header[7:]  # "Bearer " 이후의 문자열
+        else:
+            token = auth_header  # Bearer 없으면 전체를 토큰으로 사용
+
+        if not token:
+            return JSONResponse(
+                status_code=400,
+                content={"detail": "잘못된 인증 헤더 형식입니다."}
+            )
+
+        # JWT 검증
+        jwtVerify = self.jwt_service.check_token_expired(token)
+
+        # 401 Unauthorized - 토큰 만료
+        if jwtVerify is None:
+            return JSONResponse(
+                status_code=401,
+                content={"detail": "토큰이 만료되었습니다."}
+            )
+
+        # 사용자 조회 (캐시 우선, 없으면 DB 조회 후 캐시에 저장)
+        user_id = int(jwtVerify.get("id"))
+        issued_at = jwtVerify.get("iat", jwtVerify.get("exp"))
+        principal = principal_cache.get(user_id, issued_at)
+
+        if principal is None:
+            generation = principal_cache.generation(user_id)
+            principal = await self._load_principal(request_session, user_id)
+            if principal is not None:
+                principal_cache.set(user_id, issued_at, principal, generation)
+
+        # 401 Unauthorized - 사용자 없음/권한 없음
+        if principal is None or not principal.is_active:  # 퇴사자, 휴직자, 임시회원 접근 제한
+            return JSONResponse(
+                status_code=401,
+                content={"detail": "접근 권한이 없습니다. (퇴사자/휴직자이거나 존재하지 않는 사용자입니다)"}
+            )
+
+        # 역할/지점 권한 검사 (admin, employee, mso prefix만)
+        if route.config is not None:
+            auth_result = self._check_authorization(route, principal)
+            if auth_result is not None:
+                return auth_result
+
+        # 요청 객체에 사용자 정보 추가
+        # request.state.user는 get_current_user 의존성에서 필요할 때 Users 엔티티로 교체됨
+        state["user_id"] = user_id
+        state["principal"] = principal
+        state["user"] = principal
+        return None
+
+    @staticmethod
+    def _check_authorization(route: RouteMatch, principal: Principal) -> Optional[JSONResponse]:
+        config = route.config
+
+        # 사용자의 역할이 요구되는 최소 권한 레벨을 만족하는지 검사
+        if not RoleAuthority.check_role_level(principal.role, config.required_role):
+            return JSONResponse(
+                status_code=401,
+                content={
+                    "detail": f"{config.required_role.value} 이상의 권한이 필요합니다. (현재: {principal.role})"
+                }
+            )
+
+        # 지점 접근 권한 검사
+        # - MSO 역할은 모든 지점에 접근 가능
+        # - 그 외 역할은 자신이 속한 지점만 접근 가능
+        if config.check_branch and route.branch_id is not None:
+            if principal.role != Role.MSO and principal.branch_id != route.branch_id:
+                return JSONResponse(
+                    status_code=401,
+                    content={
+                        "detail": f"본인 소속 지점의 데이터만 접근할 수 있습니다. (현재 역할: {principal.role}, 속한 지점: {principal.branch_id})"
+                    }
+                )
+
+        return None
+
+    @staticmethod
+    def _get_authorization_header(scope: Scope) -> Optional[str]:
+        for key, value in scope["headers"]:
+            if key == b"authorization":
+                return value.decode("latin-1")
+        return None
+
+    @staticmethod
+    async def _load_principal(request_session: RequestSession, user_id: int) -> Optional[Principal]:
+        stmt = select(
+            Users.id,
+            Users.role,
+            Users.branch_id,
+            Users.part_id,
+            Users.deleted_yn,
+        ).where(Users.id == user_id)
+        result = await request_session.session.execute(stmt)
+        row = result.one_or_none()
+        if row is None:
+            return None
+        return Principal.from_row(*row)
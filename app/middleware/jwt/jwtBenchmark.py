@@ -0,0 +1,42 @@
+"""
+JWT 검증 cold/warm 처리량 벤치마크
+
+    python -m app.middleware.jwt.jwtBenchmark --iterations 20000
+
+    - cold: 매 호출마다 캐시를 비워 python-jose 서명 검증을 수행
+    - warm: 같은 토큰을 반복 검증하여 캐시에서 payload를 반환
+"""
+import argparse
+import time
+
+from app.middleware.jwt.jwtService import JWTDecoder, JWTEncoder, JWTService, jwt_verification_cache
+
+
+def measure(jwt_service: JWTService, token: str, iterations: int, cold: bool) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        if cold:
+            jwt_verification_cache.clear()
+        assert jwt_service.check_token_expired(token) is not None
+    elapsed = time.perf_counter() - started
+    return iterations / elapsed
+
+
+def main(iterations: int) -> None:
+    jwt_service = JWTService(JWTEncoder(), JWTDecoder())
+    token = jwt_service._create_token(data={"id": 1})
+
+    cold = measure(jwt_service, token, iterations, cold=True)
+    warm = measure(jwt_service, token, iterations, cold=False)
+
+    print(f"iterations: {iterations}")
+    print(f"cold decode: {cold:12,.0f} ops/s  ({1_000_000 / cold:7.2f} us/op)")
+    print(f"warm decode: {warm:12,.0f} ops/s  ({1_000_000 / warm:7.2f} us/op)")
+    print(f"speedup    : {warm / cold:12.1f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=20000)
+    args = parser.parse_args()
+    main(args.iterations)
@@ -0,0 +1,37 @@
+import hashlib
+import threading
+import time
+from typing import Optional
+
+from app.utils.ttl_cache import TTLCache
+
+
+class JWTVerificationCache(TTLCache[bytes, dict]):
+    """
+    서명 검증이 끝난 토큰의 payload를 보관하는 캐시
+
+    - key는 토큰 원문의 sha256 digest이므로 서명이 다른 토큰은 항상 새로 검증됩니다.
+    - 항목은 토큰의 exp(epoch 초) 시점에 만료되며, maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 이벤트 루프와 스레드풀(동기 의존성)에서 동시에 호출될 수 있으므로 lock으로 보호합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096):
+        super().__init__(maxsize, clock=time.time)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def digest(token: str) -> bytes:
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token_digest: bytes, now: float) -> Optional[dict]:
+        with self._lock:
+            payload = self.lookup(token_digest, now)
+        return None if payload is None else dict(payload)
+
+    def set(self, token_digest: bytes, payload: dict, expires_at: float) -> None:
+        with self._lock:
+            self.store(token_digest, dict(payload), expires_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            super().clear()
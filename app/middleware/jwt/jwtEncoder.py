@@ -14,6 +14,7 @@ class AbstractJWTEncoder(ABC):
 class JWTEncoder(AbstractJWTEncoder):
     def encode(self, data: dict, secret_key: str, algorithm: str) -> str:
         to_encode = data.copy()
-        expire = datetime.now(ZoneInfo("Asia/Seoul")) + timedelta(minutes=120)
-        to_encode.update({"exp": expire})
+        issued_at = datetime.now(ZoneInfo("Asia/Seoul"))
+        expire = issued_at + timedelta(minutes=120)
+        to_encode.update({"iat": issued_at, "exp": expire})
         return jwt.encode(to_encode, secret_key, algorithm=algorithm)
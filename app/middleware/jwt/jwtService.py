@@ -1,10 +1,13 @@
-from datetime import datetime
-from zoneinfo import ZoneInfo
+import time
 
 from app.core.config import settings
+from app.middleware.jwt.jwtCache import JWTVerificationCache
 from app.middleware.jwt.jwtDecoder import JWTDecoder
 from app.middleware.jwt.jwtEncoder import JWTEncoder
 
+# 서명 검증이 끝난 토큰 캐시 (프로세스 단위로 공유)
+jwt_verification_cache = JWTVerificationCache(maxsize=settings.JWT_CACHE_MAXSIZE)
+
 
 class JWTService:
     """
@@ -29,10 +32,21 @@ class JWTService:
         return self.encoder.encode(data, self.secret_key, self.algorithm)
 
     def check_token_expired(self, token: str) -> dict | None:
+        # exp는 UTC epoch 기준이므로 타임존 변환 없이 현재 epoch 시간과 비교
+        now = time.time()
+
+        # 이미 검증된 토큰이면 서명 검증 생략
+        token_digest = jwt_verification_cache.digest(token)
+        payload = jwt_verification_cache.get(token_digest, now)
+        if payload is not None:
+            return payload
+
         payload = self.decoder.decode(token, self.secret_key, self.algorithm)
 
-        now = datetime.timestamp(datetime.now(ZoneInfo("Asia/Seoul")))
         if payload and payload["exp"] < now:
             return None
 
+        if payload:
+            jwt_verification_cache.set(token_digest, payload, payload["exp"])
+
         return payload
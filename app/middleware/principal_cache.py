@@ -0,0 +1,98 @@
+from dataclasses import dataclass
+from typing import Optional
+
+from app.core.config import settings
+from app.enums.users import Role
+from app.utils.ttl_cache import TTLCache
+
+
+# 토큰 미들웨어에서 접근을 차단하는 역할 (퇴사자, 휴직자, 임시회원)
+BLOCKED_ROLES = (Role.RESIGNED, Role.ON_LEAVE, Role.TEMPORARY)
+
+
+@dataclass(frozen=True, slots=True)
+class Principal:
+    """인증/인가 미들웨어가 사용하는 사용자 정보 스냅샷 (불변)"""
+    id: int
+    role: str
+    branch_id: int
+    part_id: Optional[int]
+    part_ids: tuple[int, ...]
+    deleted_yn: str
+
+    @property
+    def is_active(self) -> bool:
+        """삭제되지 않았고 접근 제한 역할이 아닌 경우만 활성 사용자로 판단"""
+        return self.deleted_yn == "N" and self.role not in BLOCKED_ROLES
+
+    @classmethod
+    def from_row(cls, id: int, role: str, branch_id: int, part_id: Optional[int], deleted_yn: str) -> "Principal":
+        return cls(
+            id=id,
+            role=role,
+            branch_id=branch_id,
+            part_id=part_id,
+            part_ids=(part_id,) if part_id else (),
+            deleted_yn=deleted_yn,
+        )
+
+
+class PrincipalCache(TTLCache[tuple[int, int], Principal]):
+    """
+    (user_id, 토큰 iat) 단위로 Principal을 보관하는 TTL + LRU 캐시
+
+    - 단일 이벤트 루프 안에서만 사용되며, 각 메서드는 await 없이 동작하므로 별도 lock이 필요 없습니다.
+    - 사용자 정보(역할/파트/삭제 여부 등)가 변경되면 invalidate(user_id)를 호출해야 합니다.
+    - DB 조회 중에 invalidate가 일어난 경우를 막기 위해 사용자별 generation을 비교한 뒤 저장합니다.
+    """
+
+    def __init__(self, maxsize: int = 4096, ttl: float = 60.0):
+        super().__init__(maxsize, ttl)
+        self._keys_by_user: dict[int, set[tuple[int, int]]] = {}
+        self._generations: dict[int, int] = {}
+        self.invalidations = 0
+
+    def get(self, user_id: int, issued_at: int) -> Optional[Principal]:
+        return self.lookup((user_id, issued_at))
+
+    def generation(self, user_id: int) -> int:
+        return self._generations.get(user_id, 0)
+
+    def set(self, user_id: int, issued_at: int, principal: Principal, generation: Optional[int] = None) -> None:
+        # 조회하는 동안 사용자 정보가 변경되었다면 오래된 스냅샷을 저장하지 않음
+        if generation is not None and generation != self.generation(user_id):
+            return
+
+        key = (user_id, issued_at)
+        self._keys_by_user.setdefault(user_id, set()).add(key)
+        self.store(key, principal)
+
+    def invalidate(self, user_id: int) -> None:
+        """사용자의 모든 토큰에 대한 캐시 항목 제거"""
+        self._generations[user_id] = self.generation(user_id) + 1
+        for key in self._keys_by_user.pop(user_id, set()):
+            self.discard(key)
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """항목과 사용자별 generation 초기화"""
+        super().clear()
+        self._keys_by_user.clear()
+        self._generations.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "invalidations": self.invalidations}
+
+    def _drop(self, key: tuple[int, int]) -> None:
+        super()._drop(key)
+        user_keys = self._keys_by_user.get(key[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if not user_keys:
+                del self._keys_by_user[key[0]]
+
+
+principal_cache = PrincipalCache(
+    maxsize=settings.PRINCIPAL_CACHE_MAXSIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL,
+)
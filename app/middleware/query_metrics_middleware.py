@@ -0,0 +1,52 @@
+import logging
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.query_metrics import end_request_stats, route_query_metrics, start_request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryMetricsMiddleware:
+    """
+    요청 단위 SQL 계측 ASGI 미들웨어
+        - 요청 동안 실행된 SQL 수, DB 시간, 반복된 쿼리 형태를 수집합니다.
+        - 같은 형태의 쿼리가 SQL_N_PLUS_ONE_THRESHOLD 이상 반복되면 N+1로 로그를 남깁니다.
+        - prod가 아닌 환경에서는 Server-Timing, X-DB-Queries 응답 헤더를 추가합니다.
+        - 라우트별 히스토그램은 /metrics/queries 에서 확인합니다.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+        self.expose_headers = settings.MODE != "prod"
+        self.threshold = settings.SQL_N_PLUS_ONE_THRESHOLD
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_request_stats()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.expose_headers:
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", f"db;dur={stats.total_seconds * 1000:.2f}".encode()))
+                headers.append((b"x-db-queries", str(stats.count).encode()))
+                repeated = stats.repeated_shapes(self.threshold)
+                if repeated:
+                    headers.append((b"x-db-n-plus-one", str(repeated[0][1]).encode()))
+                message["headers"] = headers
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            end_request_stats(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            repeated = stats.repeated_shapes(self.threshold)
+            route_query_metrics.observe(scope["method"], route_path, stats, bool(repeated))
+            for shape, count in repeated:
+                logger.warning(f"N+1 의심 쿼리 ({scope['method']} {route_path}) {count}회: {shape[:300]}")
@@ -9,6 +9,7 @@ from app.exceptions.exceptions import ForbiddenError
 from app.middleware.jwt.jwtService import JWTDecoder, JWTService
 from app.models.users.users_model import Users
 from app.middleware.permission import UserPermission
+from app.middleware.principal_cache import Principal
 from app.enums.users import Role
 
 # users = async_session()
@@ -21,6 +22,10 @@ async def validate_token(
         users: AsyncSession = Depends(get_db)
         ):
     
+    # 미들웨어에서 이미 인증된 요청이면 다시 조회하지 않음
+    if getattr(req.state, "principal", None) is not None:
+        return
+
     try:
         
         # 스웨거를 위한 처리
@@ -91,8 +96,33 @@ async def get_current_user_id(req: Request):
 
 
 # 현재 사용자를 가져오는 함수
-async def get_current_user(req: Request):
-    return req.state.user
+# 미들웨어는 캐시된 Principal만 설정하므로, 핸들러에서 Users 엔티티가 필요할 때만 조회합니다.
+async def get_current_user(req: Request, db: AsyncSession = Depends(get_db)):
+    user = req.state.user
+    if isinstance(user, Principal):
+        user = await load_current_user(db, user.id)
+        req.state.user = user
+    return user
+
+
+async def load_current_user(db: AsyncSession, user_id: int) -> Users:
+    stmt = (
+        select(Users)
+        .options(
+            joinedload(Users.branch),
+            joinedload(Users.part)
+        )
+        .where(Users.id == user_id)
+    )
+    result = await db.execute(stmt)
+    user = result.unique().scalar_one()
+
+    # 기존처럼 세션과 분리된 상태로 사용하도록 expunge (핸들러의 rollback 영향을 받지 않음)
+    for obj in (user.branch, user.part, *user.time_offs):
+        if obj is not None:
+            db.expunge(obj)
+    db.expunge(user)
+    return user
 
 async def check_branch_access(
     req: Request,
@@ -2,11 +2,12 @@ from app.core.database import Base
 from sqlalchemy.orm import relationship
 from sqlalchemy import desc
 from app.models.closed_days.closed_days_model import ClosedDays, EarlyClockIn
-from app.models.commutes.commutes_model import Commutes
+from app.models.commutes.commutes_model import AttendanceMonthlySummary, Commutes
 from app.models.users.career_model import Career
 from app.models.users.education_model import Education
-from app.models.users.overtimes_model import Overtimes, OverTime_History
+from app.models.users.overtimes_model import Overtimes, OverTime_History, OvertimeMonthlySummary
 from app.models.users.part_timer.users_part_timer_work_contract_model import PartTimerAdditionalInfo, PartTimerHourlyWage, PartTimerWorkContract, PartTimerWorkingTime
+from app.models.users.leave_ledger_model import LeaveLedger, UserLeaveBalance
 from app.models.users.time_off_model import TimeOff
 from app.models.users.users_contract_model import Contract, ContractSendMailHistory
 from app.models.users.users_document_model import Document, DocumentSendHistory
@@ -37,6 +38,7 @@ from .branches.condition_based_annual_leave_grant_model import ConditionBasedAnn
 from .branches.account_based_annual_leave_grant_model import AccountBasedAnnualLeaveGrant
 from .branches.entry_date_based_annual_leave_grant_model import EntryDateBasedAnnualLeaveGrant
 from .branches.auto_annual_leave_approval_model import AutoAnnualLeaveApproval
+from .branches.annual_leave_grant_run_model import AnnualLeaveGrantRun
 from .branches.salary_template_model import SalaryTemplate
 from .common.minimum_wage_policies_model import MinimumWagePolicy
 from .histories.branch_histories_model import BranchHistories
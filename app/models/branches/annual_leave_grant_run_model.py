@@ -0,0 +1,22 @@
+from datetime import datetime
+
+from sqlalchemy import Column, Date, DateTime, ForeignKey, Integer, UniqueConstraint
+
+from app.core.database import Base
+
+
+class AnnualLeaveGrantRun(Base):
+    """
+    지점별 자동 연차 부여 실행 기록 (체크포인트)
+    부여와 같은 트랜잭션에서 기록하므로, 같은 날 다시 실행하면 이미 부여한 지점은 건너뜁니다.
+    """
+    __tablename__ = "annual_leave_grant_runs"
+    __table_args__ = (
+        UniqueConstraint("branch_id", "grant_date", name="uq_annual_leave_grant_runs_branch_id_grant_date"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    branch_id = Column(Integer, ForeignKey("branches.id"), nullable=False)
+    grant_date = Column(Date, nullable=False)  # 부여 기준일
+    granted_count = Column(Integer, nullable=False, default=0)  # 잔여 연차가 변경된 사용자 수
+    created_at = Column(DateTime, default=datetime.now)
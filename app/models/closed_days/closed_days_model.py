@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
+from sqlalchemy import Column, Computed, Index, Integer, String, Date, DateTime, ForeignKey, UniqueConstraint
 from app.core.database import Base
 from datetime import date, datetime
 from typing import Dict, Optional, List
@@ -6,11 +6,17 @@ from pydantic import BaseModel, Field, field_validator
 
 class ClosedDays(Base):
     __tablename__ = "closed_days"
+    __table_args__ = (
+        Index("idx_closed_days_branch_id_closed_day_date", "branch_id", "closed_day_date"),
+        UniqueConstraint("branch_id", "user_key", "closed_day_date", name="uq_closed_days_branch_id_user_key_closed_day_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     branch_id = Column(Integer, ForeignKey('branches.id'), nullable=True, index=True)
     part_id = Column(Integer, ForeignKey('parts.id'), nullable=True)
     user_id = Column(Integer,ForeignKey('users.id'), nullable=True)
+    # 지점 휴무일(user_id NULL)도 유니크 키에서 중복으로 판단되도록 NULL을 0으로 바꾼 값
+    user_key = Column(Integer, Computed("coalesce(user_id, 0)", persisted=True))
     closed_day_date = Column(Date, nullable=False, index=True)
     memo = Column(String(500))
     created_at = Column(DateTime, default=datetime.now)
@@ -41,6 +47,9 @@ class BranchClosedDay(BaseModel):
         "from_attributes": True
     }
 
+class BranchesClosedDay(BranchClosedDay):
+    branch_ids: List[int] = Field(..., min_length=1, description="휴무일을 적용할 지점 ID 목록")
+
 class UserClosedDays(BaseModel):
     user_closed_days: Dict[int, List[date]]
     
@@ -60,11 +69,16 @@ class UserClosedDays(BaseModel):
     
 class EarlyClockIn(Base):
     __tablename__ = "early_clock_in"
+    __table_args__ = (
+        UniqueConstraint("branch_id", "user_id", "early_clock_in_date", name="uq_early_clock_in_branch_id_user_id_early_clock_in_date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer,ForeignKey('users.id'), nullable=True)
     branch_id = Column(Integer,ForeignKey('branches.id'), nullable=True)
     early_clock_in = Column(DateTime, nullable=False, index=True)
+    # 직원별 하루 한 건 (유니크 키)
+    early_clock_in_date = Column(Date, Computed("date(early_clock_in)", persisted=True))
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
     deleted_yn = Column(String(1), default="N")
@@ -1,7 +1,7 @@
 from typing import Dict, List, Optional
 from datetime import UTC, datetime
 
-from sqlalchemy import Column, DateTime, Float, ForeignKey, Integer, String, func
+from sqlalchemy import Column, Computed, Date, DateTime, Float, ForeignKey, Index, Integer, String, UniqueConstraint, func
 from fastapi import HTTPException
 
 from app.core.database import Base
@@ -12,10 +12,16 @@ from pydantic import BaseModel, Field, field_validator
 
 class Commutes(Base):
     __tablename__ = "commutes"
+    __table_args__ = (
+        Index("idx_commutes_user_id_clock_in", "user_id", "clock_in", "deleted_yn"),
+        Index("idx_commutes_user_id_commute_date", "user_id", "commute_date", "deleted_yn"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     clock_in = Column(DateTime, nullable=False, default=datetime.now(UTC))
+    # 출근 날짜 (날짜 단위 조회/휴일 조인용, clock_in에서 생성되어 저장됨)
+    commute_date = Column(Date, Computed("date(clock_in)", persisted=True))
     clock_out = Column(DateTime)
     work_hours = Column(Float)
     created_at = Column(DateTime, default=datetime.now(UTC))
@@ -23,6 +29,33 @@ class Commutes(Base):
     deleted_yn = Column(String(1), default="N")
 
 
+class AttendanceMonthlySummary(Base):
+    """
+    사용자별 월간 근태 집계 (근태 현황 조회용)
+    출퇴근/연차 승인·반려/휴무일 변경을 커밋한 뒤 해당 (사용자, 월) 행을 다시 계산합니다.
+    오버타임 횟수/수당은 overtime_monthly_summaries에 있습니다.
+    """
+    __tablename__ = "attendance_monthly_summaries"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", name="uq_attendance_monthly_summaries_user_id_year_month"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+
+    work_days = Column(Integer, nullable=False, default=0)  # 출근한 날짜 수
+    regular_leave_days = Column(Integer, nullable=False, default=0)  # 일요일 + 지점/직원 휴무일 (날짜 기준 중복 제외)
+    annual_leave_days = Column(Integer, nullable=False, default=0)  # 승인된 유급 휴가 일수
+    unpaid_leave_days = Column(Integer, nullable=False, default=0)  # 승인된 무급 휴가 일수
+    holiday_work_days = Column(Integer, nullable=False, default=0)  # 공휴일 출근 날짜 수
+    weekend_work_hours = Column(Float, nullable=False, default=0)  # 주말 근무 시간 합계
+
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
 class CommuteBase(BaseModel):
     user_id: Optional[int] = Field(None, description="사용자 ID")
     clock_in: Optional[datetime] = Field(None, description="출근 시간")
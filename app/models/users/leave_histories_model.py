@@ -16,7 +16,7 @@ from sqlalchemy import (
 from sqlalchemy.orm import relationship
 
 from app.core.database import Base
-from pydantic import BaseModel
+from pydantic import BaseModel, Field, field_validator
 from app.common.dto.pagination_dto import PaginationDto
 from app.common.dto.search_dto import BaseSearchDto
 from app.enums.users import StatusKor, Status
@@ -28,6 +28,8 @@ class LeaveHistories(Base):
     __tablename__ = "leave_histories"
     __table_args__ = (
         Index("idx_leave_history_user_id", "user_id"),
+        Index("idx_leave_history_user_id_status_application_date", "user_id", "status", "application_date"),
+        Index("idx_leave_history_user_id_start_date_end_date", "user_id", "start_date", "end_date"),
     )
     
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -96,6 +98,17 @@ class LeaveHistoriesApprove(BaseModel):
     status: str
     admin_description: Optional[str]
 
+class LeaveHistoriesBulkApprove(BaseModel):
+    leave_ids: list[int] = Field(..., min_length=1, max_length=500, description="승인/반려할 연차 ID 목록")
+    status: str = Field(..., description="approved 또는 rejected")
+    admin_description: Optional[str] = Field(None, max_length=255, description="관리자 메모")
+
+    @field_validator("status")
+    def validate_status(cls, v):
+        if v not in (Status.APPROVED, Status.REJECTED):
+            raise ValueError("상태는 approved 또는 rejected 중 하나여야 합니다.")
+        return v
+
 class LeaveHistoriesSearchDto(BaseSearchDto):
     kind: Optional[str] = None
     status: Optional[str] = None
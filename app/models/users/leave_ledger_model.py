@@ -0,0 +1,53 @@
+from datetime import datetime
+
+from sqlalchemy import Column, DateTime, Enum, ForeignKey, Index, Integer, Numeric, String
+
+from app.core.database import Base
+from app.enums.users import LeaveLedgerType
+
+
+class LeaveLedger(Base):
+    """
+    연차 원장 (추가만 하며 수정/삭제하지 않습니다)
+    한 행이 사용자의 해당 연도 연차 잔여에 대한 증감 한 건이며, 합계가 user_leave_balances와 같아야 합니다.
+    """
+    __tablename__ = "leave_ledger"
+    __table_args__ = (
+        Index("idx_leave_ledger_user_id_year", "user_id", "year"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    entry_type = Column(Enum(*[e.value for e in LeaveLedgerType], name="leave_ledger_type"), nullable=False)
+    leave_history_id = Column(Integer, ForeignKey("leave_histories.id"), nullable=True)
+
+    granted_days = Column(Numeric(10, 2), nullable=False, default=0)  # 부여 일수 증감
+    used_days = Column(Numeric(10, 2), nullable=False, default=0)  # 사용(승인) 일수 증감
+    pending_days = Column(Numeric(10, 2), nullable=False, default=0)  # 승인 대기 일수 증감
+    memo = Column(String(255), nullable=True)
+
+    created_at = Column(DateTime, default=datetime.now)
+
+
+class UserLeaveBalance(Base):
+    """
+    사용자별 연도별 연차 잔여 (leave_ledger 합계의 스냅샷)
+    원장 기록과 같은 트랜잭션에서 증감하므로 조회는 (user_id, year) 기본 키 조회 한 번입니다.
+    """
+    __tablename__ = "user_leave_balances"
+
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    year = Column(Integer, primary_key=True)
+
+    granted_days = Column(Numeric(10, 2), nullable=False, default=0)  # 부여 일수
+    used_days = Column(Numeric(10, 2), nullable=False, default=0)  # 사용 일수
+    pending_days = Column(Numeric(10, 2), nullable=False, default=0)  # 승인 대기 일수
+
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+    @property
+    def remaining_days(self):
+        """잔여 연차 일수 (부여 - 사용)"""
+        return self.granted_days - self.used_days
@@ -1,7 +1,7 @@
 from datetime import UTC, datetime
 from typing import Optional
 
-from sqlalchemy import Column, Date, DateTime, Enum, Float, ForeignKey, Integer, String
+from sqlalchemy import Column, Date, DateTime, Enum, Float, ForeignKey, Index, Integer, String, UniqueConstraint
 
 from app.core.database import Base
 from app.enums.users import OverTimeHours, Status
@@ -10,6 +10,9 @@ from datetime import date
 
 class Overtimes(Base):
     __tablename__ = "overtimes"
+    __table_args__ = (
+        Index("idx_overtimes_applicant_id_application_date", "applicant_id", "application_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     applicant_id = Column(Integer, ForeignKey("users.id"), nullable=False)
@@ -22,6 +25,8 @@ class Overtimes(Base):
     manager_memo = Column(String(500), nullable=True)
     processed_date = Column(Date, nullable=True)
     is_approved = Column(String(1), default="N")
+    # 승인 시점의 정책 기준 수당 (반려 시 차감액이자 월간 재계산 기준)
+    approved_money = Column(Integer, nullable=True)
 
     created_at = Column(DateTime, default=datetime.now(UTC))
     updated_at = Column(DateTime, default=datetime.now(UTC), onupdate=datetime.now(UTC))
@@ -79,6 +84,11 @@ class OvertimeSelect(OvertimeBase):
         return v
     
 
+class OvertimeBulkSelect(BaseModel):
+    overtime_ids: list[int] = Field(..., min_length=1, max_length=500, description="처리할 초과 근무 ID 목록")
+    manager_memo: Optional[str] = Field(None, max_length=500, description="승인자 메모")
+
+
 class OvertimeUpdate(OvertimeBase):
     overtime_hours: Optional[str] = Field(None, description="초과 근무 시간")
     application_memo: Optional[str] = Field(None, max_length=500, description="신청 메모")
@@ -109,6 +119,37 @@ class OverTime_History(Base):
     deleted_at = Column(String(1), default="N")
 
 
+class OvertimeMonthlySummary(Base):
+    """
+    사용자별 월간 오버타임 집계 (승인된 초과 근무 기준, 신청일의 연/월)
+    승인/반려 시 같은 트랜잭션에서 증감하며, 수당은 승인 시 기록한 금액(overtimes.approved_money)입니다.
+    """
+    __tablename__ = "overtime_monthly_summaries"
+    __table_args__ = (
+        UniqueConstraint("user_id", "year", "month", name="uq_overtime_monthly_summaries_user_id_year_month"),
+    )
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    year = Column(Integer, nullable=False)
+    month = Column(Integer, nullable=False)
+
+    # 승인 횟수
+    ot_30_count = Column(Integer, nullable=False, default=0)
+    ot_60_count = Column(Integer, nullable=False, default=0)
+    ot_90_count = Column(Integer, nullable=False, default=0)
+    ot_120_count = Column(Integer, nullable=False, default=0)
+
+    # 수당
+    ot_30_money = Column(Integer, nullable=False, default=0)
+    ot_60_money = Column(Integer, nullable=False, default=0)
+    ot_90_money = Column(Integer, nullable=False, default=0)
+    ot_120_money = Column(Integer, nullable=False, default=0)
+
+    created_at = Column(DateTime, default=datetime.now)
+    updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
+
+
 # class OverTime_History_Create(BaseModel):
 #     ot_30_total : Optional[int] = Field(None, description="O.T 30분 신청 횟수")
 #     ot_60_total : Optional[int] = Field(None, description="O.T 60분 신청 횟수")
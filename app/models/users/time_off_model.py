@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, String, Enum as SQLAlchemyEnum, Boolean, text
+from sqlalchemy import Column, Index, Integer, ForeignKey, DateTime, String, Enum as SQLAlchemyEnum, Boolean, text
 from zoneinfo import ZoneInfo
 
 from app.enums.users import TimeOffType
@@ -8,6 +8,9 @@ from app.core.database import Base
 
 class TimeOff(Base):
     __tablename__ = 'time_offs'
+    __table_args__ = (
+        Index("idx_time_offs_user_id_start_date_end_date", "user_id", "start_date", "end_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False)
@@ -4,7 +4,7 @@ from sqlalchemy import text
 from app.models.db_monitor.connection_logs import ConnectionLogs
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
 from sqlalchemy import delete
-from app.service import branch_service
+from app.service import annual_leave_grant_service, leave_ledger_service
 from app.core.database import async_session
 
 
@@ -51,6 +51,14 @@ async def collect_connection_data():
 
 @scheduler.scheduled_job('cron', hour=0, minute=1)
 async def auto_grant_leave_days():
+    # 지점별로 커밋하며, 같은 날 다시 실행해도 이미 부여한 지점은 건너뜀
+    await annual_leave_grant_service.run_auto_annual_leave_grant()
+
+
+@scheduler.scheduled_job('cron', hour=3, minute=0)
+async def reconcile_leave_balances():
+    # 연차 원장과 잔여 스냅샷 대조 (불일치는 기록만 하고, 복구는 --fix로 확인 후 진행)
     async with async_session() as session:
-        async with session.begin():
-            await branch_service.auto_annual_leave_grant_scheduling(session=session)
+        mismatches = await leave_ledger_service.reconcile_leave_balances(session)
+        for mismatch in mismatches:
+            print(f"Leave balance mismatch: {mismatch}")
@@ -241,7 +241,8 @@ class UserListDto(BaseModel):
 class UserListResponseDTO(BaseModel):
     message: str
     data: List[UserListDto]
-    total: int
+    total: Optional[int]
     count: int
     page: int
-    record_size: int
\ No newline at end of file
+    record_size: int
+    next_cursor: Optional[str] = None
\ No newline at end of file
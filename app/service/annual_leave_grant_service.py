@@ -0,0 +1,339 @@
+"""
+자동 연차 부여 (매일 0시 1분 스케줄러)
+
+    python -m app.service.annual_leave_grant_service --dry-run                      # 오늘 부여 예정 목록만 출력
+    python -m app.service.annual_leave_grant_service --date 2025-01-01 --dry-run
+    python -m app.service.annual_leave_grant_service                                # 오늘 부여 실행
+
+지점별로 파트의 부여 방식과 (입사일, 잔여 연차) 배열에 부여 조건을 한 번에 계산하고,
+변경된 사용자만 UPDATE ... CASE로 반영합니다.
+지점마다 따로 커밋하며 annual_leave_grant_runs에 (지점, 부여일)을 함께 기록하므로 같은 날 다시 실행해도 중복 부여되지 않습니다.
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Optional
+
+import numpy as np
+from sqlalchemy import case, select, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.enums.branches import AnnualLeaveDaysByYear, DecimalRoundingPolicy, LeaveGrantOption, LeaveResetOption
+from app.enums.parts import PartAutoAnnualLeaveGrant
+from app.enums.users import LeaveLedgerType
+from app.models.branches.account_based_annual_leave_grant_model import AccountBasedAnnualLeaveGrant
+from app.models.branches.annual_leave_grant_run_model import AnnualLeaveGrantRun
+from app.models.branches.branches_model import Branches
+from app.models.branches.condition_based_annual_leave_grant_model import ConditionBasedAnnualLeaveGrant
+from app.models.branches.entry_date_based_annual_leave_grant_model import EntryDateBasedAnnualLeaveGrant
+from app.models.parts.parts_model import Parts
+from app.models.users.users_model import Users
+from app.service.leave_ledger_service import ledger_entry, record_leave_ledger
+
+MAX_CONCURRENT_BRANCHES = 4
+UPDATE_CHUNK_SIZE = 1000
+
+# 근속 년수(0~21)별 연차 일수
+LEAVE_DAYS_BY_YEAR = np.array([AnnualLeaveDaysByYear.get_leave_days(year) for year in range(22)], dtype=np.float64)
+
+
+@dataclass
+class BranchGrantPolicy:
+    """지점의 연차 부여 정책 (설정이 없으면 None/빈 목록)"""
+    branch_id: int
+    account: Optional[AccountBasedAnnualLeaveGrant] = None
+    entry_date: Optional[EntryDateBasedAnnualLeaveGrant] = None
+    conditions: list[ConditionBasedAnnualLeaveGrant] = field(default_factory=list)
+
+
+@dataclass
+class GrantTargets:
+    """지점 사용자 배열 (같은 인덱스가 같은 사용자)"""
+    user_ids: np.ndarray
+    grant_types: np.ndarray
+    hire_dates: np.ndarray  # datetime64[D]
+    total_leave_days: np.ndarray
+
+    @classmethod
+    def from_rows(cls, rows) -> "GrantTargets":
+        return cls(
+            user_ids=np.array([row.id for row in rows], dtype=np.int64),
+            grant_types=np.array([row.auto_annual_leave_grant for row in rows], dtype=object),
+            hire_dates=np.array([row.hire_date for row in rows], dtype="datetime64[D]"),
+            total_leave_days=np.array([float(row.total_leave_days or 0) for row in rows], dtype=np.float64),
+        )
+
+
+def round_leave_days(raw: np.ndarray, rounding_method: str) -> np.ndarray:
+    """소수점 처리 정책에 따른 연차 일수 (정책이 없으면 그대로)"""
+    if rounding_method == DecimalRoundingPolicy.ROUND_UP_0_5:
+        # 0.5 기준 올림 (예: 1.2 -> 1.5, 1.7 -> 2.0)
+        fraction = raw % 1
+        return np.where(fraction == 0, raw, np.where(fraction <= 0.5, np.floor(raw) + 0.5, np.ceil(raw)))
+    if rounding_method == DecimalRoundingPolicy.TRUNCATE:
+        return np.floor(raw)
+    if rounding_method == DecimalRoundingPolicy.ROUND_UP:
+        return np.ceil(raw)
+    if rounding_method == DecimalRoundingPolicy.ROUND:
+        # 15 * 근속일수 / 365는 정확히 x.5가 될 수 없으므로 +0.5 내림이 사사오입과 같습니다.
+        return np.floor(raw + 0.5)
+    return raw
+
+
+@dataclass
+class GrantPlan:
+    """지점 사용자별 부여 계획 (GrantTargets와 같은 인덱스)"""
+    granted: np.ndarray  # 실제 부여 일수
+    reset: np.ndarray  # 부여 전에 기존 잔여 연차를 소멸시키는지 여부
+
+    def new_totals(self, totals: np.ndarray) -> np.ndarray:
+        """부여 후 잔여 연차"""
+        return np.where(self.reset, 0, totals) + self.granted
+
+    def expired(self, totals: np.ndarray) -> np.ndarray:
+        """초기화로 소멸되는 잔여 연차"""
+        return np.where(self.reset, totals, 0)
+
+
+def plan_grants(today: date, policy: BranchGrantPolicy, targets: GrantTargets) -> GrantPlan:
+    """
+    사용자별 부여 일수와 잔여 초기화 여부 (부여 대상이 아니면 0 / False)
+    근속 년수/개월 수는 relativedelta(today, 입사일)와 같게 계산합니다.
+    """
+    totals = targets.total_leave_days
+    plan = GrantPlan(granted=np.zeros_like(totals), reset=np.zeros(len(totals), dtype=bool))
+    if not len(totals):
+        return plan
+    granted, reset = plan.granted, plan.reset
+
+    hire_year = targets.hire_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    hire_month = targets.hire_dates.astype("datetime64[M]").astype(np.int64) % 12 + 1
+    hire_day = (targets.hire_dates - targets.hire_dates.astype("datetime64[M]")).astype(np.int64) + 1
+    before_day = hire_day > today.day
+    before_anniversary = (hire_month > today.month) | ((hire_month == today.month) & before_day)
+    years = today.year - hire_year - before_anniversary
+    months = (today.year - hire_year) * 12 + (today.month - hire_month) - before_day
+    leave_days_by_year = LEAVE_DAYS_BY_YEAR[np.clip(years, 0, len(LEAVE_DAYS_BY_YEAR) - 1)]
+
+    # 회계 기준: 1월 1일에 근속 년수별 연차 (1년 미만은 작년 근속 일수 비례), 1년 미만은 매달 1일에 추가 부여
+    account = (targets.grant_types == PartAutoAnnualLeaveGrant.ACCOUNTING_BASED_GRANT.value) & (policy.account is not None)
+    if account.any():
+        option = policy.account
+        if today.month == 1 and today.day == 1:
+            work_days = (np.datetime64(date(today.year - 1, 12, 31)) - targets.hire_dates).astype(np.int64) + 1
+            grant = np.where(
+                years < 1,
+                round_leave_days(15 * work_days / 365, option.account_based_decimal_point),
+                leave_days_by_year,
+            )
+            granted[account] = grant[account]
+            reset[account] = option.account_based_january_1st == LeaveResetOption.RESET
+        elif today.day == 1:
+            first_year = account & (years < 1)
+            if option.account_based_less_than_year == LeaveGrantOption.ONE_PER_MONTH:
+                # 입사 첫 달은 제외하고 매월 1개씩
+                monthly = first_year & (hire_month != today.month)
+                granted[monthly] += 1
+            else:
+                # 일괄 부여: 입사 후 31일 이내의 신규 직원은 11일로 맞춤
+                new_hires = first_year & ((np.datetime64(today) - targets.hire_dates).astype(np.int64) <= 31)
+                granted[new_hires] = 11
+                reset[new_hires] = True
+
+    # 입사일 기준: 입사 기념일에 근속 년수별 연차, 1년 미만은 매월 입사일과 같은 날 1개씩
+    entry_date = (targets.grant_types == PartAutoAnnualLeaveGrant.ENTRY_DATE_BASED_GRANT.value) & (policy.entry_date is not None)
+    if entry_date.any():
+        same_day = entry_date & (hire_day == today.day)
+        anniversary = same_day & (hire_month == today.month)
+        granted[anniversary] = leave_days_by_year[anniversary]
+        reset[anniversary] = policy.entry_date.entry_date_based_remaining_leave == LeaveResetOption.RESET
+        monthly = same_day & ~anniversary & (years < 1)
+        granted[monthly] += 1
+
+    # 조건 기준: 입사일과 같은 날, 근속 개월 수가 조건 월의 배수이면 조건별 일수를 더함
+    conditional = (targets.grant_types == PartAutoAnnualLeaveGrant.CONDITIONAL_GRANT.value) & (hire_day == today.day)
+    if conditional.any():
+        for condition in policy.conditions:
+            if condition.condition_based_month > 0:
+                matched = conditional & (months % condition.condition_based_month == 0)
+                granted[matched] += condition.condition_based_cnt
+
+    return plan
+
+
+async def find_branch_grant_policies(session: AsyncSession) -> list[BranchGrantPolicy]:
+    """삭제되지 않은 지점별 연차 부여 정책"""
+    branch_ids = (await session.scalars(select(Branches.id).where(Branches.deleted_yn == "N").order_by(Branches.id))).all()
+    policies = {branch_id: BranchGrantPolicy(branch_id) for branch_id in branch_ids}
+
+    for model, attr in ((AccountBasedAnnualLeaveGrant, "account"), (EntryDateBasedAnnualLeaveGrant, "entry_date")):
+        for row in await session.scalars(select(model).where(model.deleted_yn == "N").order_by(model.id)):
+            if row.branch_id in policies and getattr(policies[row.branch_id], attr) is None:
+                setattr(policies[row.branch_id], attr, row)
+
+    conditions = await session.scalars(
+        select(ConditionBasedAnnualLeaveGrant)
+        .where(ConditionBasedAnnualLeaveGrant.deleted_yn == "N")
+        .order_by(ConditionBasedAnnualLeaveGrant.id)
+    )
+    for condition in conditions:
+        if condition.branch_id in policies:
+            policies[condition.branch_id].conditions.append(condition)
+
+    return list(policies.values())
+
+
+async def find_grant_targets(session: AsyncSession, branch_id: int, for_update: bool = False) -> GrantTargets:
+    """지점 파트에 속한 자동 부여 대상 사용자 (수동 부여 파트, 입사일이 없는 사용자 제외)"""
+    stmt = (
+        select(Users.id, Users.hire_date, Users.total_leave_days, Parts.auto_annual_leave_grant)
+        .join(Parts, Users.part_id == Parts.id)
+        .where(
+            Parts.branch_id == branch_id,
+            Parts.deleted_yn == "N",
+            Parts.auto_annual_leave_grant != PartAutoAnnualLeaveGrant.MANUAL_GRANT.value,
+            Users.deleted_yn == "N",
+            Users.hire_date.isnot(None),
+        )
+        .order_by(Users.id)
+    )
+    if for_update:
+        stmt = stmt.with_for_update(of=Users)
+    return GrantTargets.from_rows((await session.execute(stmt)).all())
+
+
+async def update_total_leave_days(session: AsyncSession, new_totals: dict[int, Decimal]) -> None:
+    """잔여 연차 일괄 변경 (UPDATE ... SET total_leave_days = CASE id WHEN ... END, 청크 단위)"""
+    user_ids = list(new_totals)
+    for start in range(0, len(user_ids), UPDATE_CHUNK_SIZE):
+        chunk = user_ids[start:start + UPDATE_CHUNK_SIZE]
+        await session.execute(
+            update(Users)
+            .where(Users.id.in_(chunk))
+            .values(
+                total_leave_days=case({user_id: new_totals[user_id] for user_id in chunk}, value=Users.id),
+                updated_at=datetime.now(),
+            )
+            .execution_options(synchronize_session=False)
+        )
+
+
+def to_days(value: float) -> Decimal:
+    return Decimal(f"{value:.2f}")
+
+
+async def grant_branch(
+    session_factory: async_sessionmaker,
+    policy: BranchGrantPolicy,
+    today: date,
+    dry_run: bool = False
+) -> list[dict]:
+    """
+    한 지점의 자동 연차 부여 (지점 단위 트랜잭션)
+    반환값은 연차가 부여(또는 초기화로 소멸)되는 사용자 목록이며, 이미 부여한 지점이면 빈 목록입니다.
+    """
+    async with session_factory() as session:
+        checkpoint = await session.scalar(
+            select(AnnualLeaveGrantRun.id).where(
+                AnnualLeaveGrantRun.branch_id == policy.branch_id,
+                AnnualLeaveGrantRun.grant_date == today,
+            )
+        )
+        if checkpoint is not None:
+            return []
+
+        targets = await find_grant_targets(session, policy.branch_id, for_update=not dry_run)
+        plan = plan_grants(today, policy, targets)
+        new_totals = plan.new_totals(targets.total_leave_days)
+        expired = plan.expired(targets.total_leave_days)
+        changed = np.flatnonzero((plan.granted != 0) | (expired != 0))
+        grants = [
+            {
+                "branch_id": policy.branch_id,
+                "user_id": int(targets.user_ids[index]),
+                "before": to_days(targets.total_leave_days[index]),
+                "after": to_days(new_totals[index]),
+                "granted": to_days(plan.granted[index]),
+                "expired": to_days(expired[index]),
+            }
+            for index in changed
+        ]
+        if dry_run:
+            return grants
+
+        try:
+            session.add(AnnualLeaveGrantRun(branch_id=policy.branch_id, grant_date=today, granted_count=len(grants)))
+            await session.flush()
+            await update_total_leave_days(session, {grant["user_id"]: grant["after"] for grant in grants})
+            # 초기화로 소멸되는 잔여와 실제 부여 일수를 따로 기록
+            await record_leave_ledger(session, [
+                entry
+                for grant in grants
+                for entry in (
+                    ledger_entry(grant["user_id"], today.year, LeaveLedgerType.EXPIRE, granted_days=-grant["expired"]),
+                    ledger_entry(grant["user_id"], today.year, LeaveLedgerType.GRANT, granted_days=grant["granted"]),
+                )
+            ])
+            await session.commit()
+        except IntegrityError:
+            # 동시에 실행된 다른 작업이 먼저 부여한 경우
+            await session.rollback()
+            return []
+
+    return grants
+
+
+async def run_auto_annual_leave_grant(
+    today: Optional[date] = None,
+    dry_run: bool = False,
+    concurrency: int = MAX_CONCURRENT_BRANCHES,
+    session_factory: Optional[async_sessionmaker] = None
+) -> dict[int, list[dict]]:
+    """
+    전체 지점 자동 연차 부여 (지점별로 최대 concurrency개씩 동시에 처리)
+    반환값은 지점별 변경 목록이며, 실패한 지점은 다른 지점에 영향 없이 다음 실행에서 다시 시도됩니다.
+    """
+    if session_factory is None:
+        from app.core.database import async_session as session_factory
+
+    today = today or date.today()
+    async with session_factory() as session:
+        policies = await find_branch_grant_policies(session)
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(policy: BranchGrantPolicy) -> list[dict]:
+        async with semaphore:
+            return await grant_branch(session_factory, policy, today, dry_run)
+
+    results = await asyncio.gather(*(run(policy) for policy in policies), return_exceptions=True)
+
+    grants: dict[int, list[dict]] = defaultdict(list)
+    for policy, result in zip(policies, results):
+        if isinstance(result, Exception):
+            print(f"Error granting annual leave for branch {policy.branch_id}: {str(result)}")
+        elif result:
+            grants[policy.branch_id] = result
+    return grants
+
+
+async def main(today: Optional[date], dry_run: bool, concurrency: int) -> None:
+    grants = await run_auto_annual_leave_grant(today, dry_run, concurrency)
+    for branch_grants in grants.values():
+        for grant in branch_grants:
+            print(f"branch_id={grant['branch_id']} user_id={grant['user_id']} {grant['before']} -> {grant['after']}")
+    count = sum(len(branch_grants) for branch_grants in grants.values())
+    print(f"annual leave grant: {count} users{' (dry run)' if dry_run else ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--date", type=date.fromisoformat, default=None)
+    parser.add_argument("--dry-run", action="store_true")
+    parser.add_argument("--concurrency", type=int, default=MAX_CONCURRENT_BRANCHES)
+    args = parser.parse_args()
+    asyncio.run(main(args.date, args.dry_run, args.concurrency))
@@ -0,0 +1,322 @@
+"""
+사용자별 월간 근태 집계 (attendance_monthly_summaries)
+
+    python -m app.service.attendance_summary_service --year 2024 --month 3   # 해당 월 재계산
+    python -m app.service.attendance_summary_service --year 2024             # 해당 연도 재계산
+    python -m app.service.attendance_summary_service                         # 전체 재계산 (최초 백필)
+
+출퇴근/연차 승인·반려/휴무일 변경 시에는 refresh_attendance_summaries로 영향받는 (사용자, 월) 행만 다시 계산하고,
+재계산은 범위 안의 모든 사용자를 다시 집계합니다. (공휴일/주말(rest_days) 변경은 재계산으로 반영)
+
+동시성: refresh_attendance_summaries는 원천 변경을 커밋한 뒤 별도의 짧은 READ COMMITTED 트랜잭션에서 실행합니다.
+    1. 대상 (user_id, year, month) 집계 행을 정렬된 순서로 한 번에 INSERT ... ON DUPLICATE KEY UPDATE 하여 배타 잠금
+       (없는 행은 0으로 만들어 잠금) - 집계 행만 잠그므로 원천 테이블 쓰기와 잠금 순서가 엇갈리지 않고,
+       갱신끼리는 같은 순서로 잠그므로 교착 상태 없이 직렬화됩니다.
+    2. 잠금을 잡은 뒤 원천을 일반 조회로 읽어 계산하고 기록, 커밋
+갱신 A, B가 각각 원천 커밋 a, b 뒤에 시작되면, 잠금을 나중에 잡은 쪽은 먼저 끝난 갱신이 시작되기 전의 커밋까지 모두 읽으므로
+마지막에 기록된 집계는 a, b를 모두 반영합니다.
+"""
+import argparse
+import asyncio
+import logging
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums.branches import RestDayType
+from app.enums.users import Status
+from app.models.branches.leave_categories_model import LeaveCategory
+from app.models.branches.rest_days_model import RestDays
+from app.models.closed_days.closed_days_model import ClosedDays
+from app.models.commutes.commutes_model import AttendanceMonthlySummary, Commutes
+from app.models.users.leave_histories_model import LeaveHistories
+from app.models.users.users_model import Users
+from app.service.closed_day_calendar_cache import weekday_dates
+from app.utils.date_intervals import month_day_mask
+from app.utils.datetime_utils import DatetimeUtil
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_COLUMNS = (
+    "work_days",
+    "regular_leave_days",
+    "annual_leave_days",
+    "unpaid_leave_days",
+    "holiday_work_days",
+    "weekend_work_hours",
+)
+
+
+def months_between(start: date, end: date) -> list[tuple[int, int]]:
+    """start ~ end(포함)에 걸친 (연, 월) 목록"""
+    months = []
+    year, month = start.year, start.month
+    while (year, month) <= (end.year, end.month):
+        months.append((year, month))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return months
+
+
+def month_keys(dates: Iterable[date]) -> set[tuple[int, int]]:
+    """날짜 목록이 속한 (연, 월) 집합"""
+    return {(day.year, day.month) for day in dates}
+
+
+async def default_regular_leave_days(db: AsyncSession, year: int, month: int, branch_ids: Iterable[int]) -> dict[int, int]:
+    """
+    집계 행이 없는 사용자의 지점별 정규 휴무일수 (일요일 + 지점 휴무일)
+    집계 이후 입사했거나 지점을 옮긴 사용자처럼 본인 휴무/출근/휴가가 없는 달의 값과 같습니다.
+    """
+    branch_ids = list(branch_ids)
+    sundays = set(weekday_dates(year, month, 6))
+    closed_days = defaultdict(set)
+    rows = await db.execute(
+        select(ClosedDays.branch_id, ClosedDays.closed_day_date).where(
+            ClosedDays.branch_id.in_(branch_ids),
+            ClosedDays.user_id.is_(None),
+            DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
+            ClosedDays.deleted_yn == "N"
+        )
+    )
+    for branch_id, closed_day_date in rows.all():
+        closed_days[branch_id].add(closed_day_date)
+    return {branch_id: len(sundays | closed_days[branch_id]) for branch_id in branch_ids}
+
+
+async def compute_attendance_summaries(
+    db: AsyncSession,
+    year: int,
+    month: int,
+    user_ids: Optional[Iterable[int]] = None,
+    branch_ids: Optional[Iterable[int]] = None
+) -> dict[int, dict]:
+    """
+    (year, month)의 사용자별 근태 집계 (user_ids/branch_ids가 없으면 삭제되지 않은 전체 사용자)
+    원천 테이블을 월 범위로 한 번씩 조회한 뒤 (사용자 x 일자) 배열에서 날짜 단위로 중복을 제거해 셉니다.
+    """
+    user_scope = [Users.deleted_yn == "N"]
+    if user_ids is not None:
+        user_scope.append(Users.id.in_(list(user_ids)))
+    if branch_ids is not None:
+        user_scope.append(Users.branch_id.in_(list(branch_ids)))
+    users = (await db.execute(select(Users.id, Users.branch_id).where(*user_scope))).all()
+    if not users:
+        return {}
+
+    user_index = {user_id: index for index, (user_id, _) in enumerate(users)}
+    branch_index = {branch_id: index for index, branch_id in enumerate(dict.fromkeys(branch_id for _, branch_id in users))}
+    user_branch = np.fromiter((branch_index[branch_id] for _, branch_id in users), dtype=np.int64, count=len(users))
+    # 전체 재계산이 아니면 원천 조회를 대상 사용자로 한정
+    scoped = user_ids is not None or branch_ids is not None
+
+    def for_users(column) -> list:
+        return [column.in_(list(user_index))] if scoped else []
+
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    days = (next_month_start - month_start).days
+    first_day = month_start.toordinal()
+
+    # 출퇴근 (날짜별 출근 여부, 주말 근무 시간)
+    commutes = [
+        row for row in (await db.execute(
+            select(Commutes.user_id, Commutes.commute_date, Commutes.work_hours).where(
+                *for_users(Commutes.user_id),
+                DatetimeUtil.in_month(Commutes.commute_date, year, month),
+                Commutes.deleted_yn == "N"
+            )
+        )).all()
+        if row.user_id in user_index
+    ]
+    commute_users = np.fromiter((user_index[row.user_id] for row in commutes), dtype=np.int64, count=len(commutes))
+    commute_days = np.fromiter((row.commute_date.toordinal() - first_day for row in commutes), dtype=np.int64, count=len(commutes))
+    worked = np.zeros((len(users), days), dtype=bool)
+    worked[commute_users, commute_days] = True
+
+    # 지점별 공휴일/주말
+    holidays = np.zeros((len(branch_index), days), dtype=bool)
+    weekends = np.zeros((len(branch_index), days), dtype=bool)
+    rest_days = await db.execute(
+        select(RestDays.branch_id, RestDays.date, RestDays.rest_type).where(
+            RestDays.branch_id.in_(list(branch_index)),
+            DatetimeUtil.in_month(RestDays.date, year, month),
+            RestDays.deleted_yn == "N"
+        )
+    )
+    for branch_id, rest_date, rest_type in rest_days.all():
+        target = holidays if rest_type == RestDayType.NATIONAL_HOLIDAY.value else weekends
+        target[branch_index[branch_id], rest_date.toordinal() - first_day] = True
+
+    weekend_work_hours = np.zeros(len(users))
+    on_weekend = weekends[user_branch[commute_users], commute_days]
+    hours = np.fromiter((row.work_hours or 0 for row in commutes), dtype=float, count=len(commutes))
+    np.add.at(weekend_work_hours, commute_users[on_weekend], hours[on_weekend])
+
+    # 정규 휴무 (일요일 + 지점 휴무일 + 소속 지점에 등록된 본인 휴무일)
+    branch_closed = np.zeros((len(branch_index), days), dtype=bool)
+    branch_closed[:, [sunday.toordinal() - first_day for sunday in weekday_dates(year, month, 6)]] = True
+    user_closed = np.zeros((len(users), days), dtype=bool)
+    closed_days = await db.execute(
+        select(ClosedDays.branch_id, ClosedDays.user_id, ClosedDays.closed_day_date).where(
+            ClosedDays.branch_id.in_(list(branch_index)),
+            DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
+            ClosedDays.deleted_yn == "N"
+        )
+    )
+    for branch_id, user_id, closed_day_date in closed_days.all():
+        if user_id is None:
+            branch_closed[branch_index[branch_id], closed_day_date.toordinal() - first_day] = True
+        elif user_id in user_index and user_branch[user_index[user_id]] == branch_index[branch_id]:
+            user_closed[user_index[user_id], closed_day_date.toordinal() - first_day] = True
+    regular_leave = branch_closed[user_branch] | user_closed
+
+    # 승인된 유급/무급 휴가 (해당 월과 겹치는 기간을 날짜 비트맵으로 펼침)
+    leaves = [
+        row for row in (await db.execute(
+            select(LeaveHistories.user_id, LeaveHistories.start_date, LeaveHistories.end_date, LeaveCategory.is_paid)
+            .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
+            .where(
+                *for_users(LeaveHistories.user_id),
+                LeaveHistories.status == Status.APPROVED,
+                LeaveHistories.deleted_yn == "N",
+                DatetimeUtil.overlaps_month(LeaveHistories.start_date, LeaveHistories.end_date, year, month)
+            )
+        )).all()
+        if row.user_id in user_index
+    ]
+    leave_mask = month_day_mask(year, month, [row.start_date for row in leaves], [row.end_date for row in leaves])
+    leave_users = np.fromiter((user_index[row.user_id] for row in leaves), dtype=np.int64, count=len(leaves))
+    is_paid = np.fromiter((bool(row.is_paid) for row in leaves), dtype=bool, count=len(leaves))
+    paid_leave = np.zeros((len(users), days), dtype=bool)
+    unpaid_leave = np.zeros((len(users), days), dtype=bool)
+    np.logical_or.at(paid_leave, leave_users[is_paid], leave_mask[is_paid])
+    np.logical_or.at(unpaid_leave, leave_users[~is_paid], leave_mask[~is_paid])
+
+    columns = {
+        "work_days": worked.sum(axis=1),
+        "regular_leave_days": regular_leave.sum(axis=1),
+        "annual_leave_days": paid_leave.sum(axis=1),
+        "unpaid_leave_days": unpaid_leave.sum(axis=1),
+        "holiday_work_days": (worked & holidays[user_branch]).sum(axis=1),
+    }
+    return {
+        user_id: {
+            **{column: int(values[index]) for column, values in columns.items()},
+            "weekend_work_hours": float(weekend_work_hours[index]),
+        }
+        for user_id, index in user_index.items()
+    }
+
+
+async def refresh_attendance_summaries(
+    db: AsyncSession,
+    months: Iterable[tuple[int, int]],
+    user_ids: Optional[Iterable[int]] = None,
+    branch_ids: Optional[Iterable[int]] = None
+) -> None:
+    """
+    변경된 (사용자 또는 지점, 월)의 집계를 다시 계산하여 반영 (원천 변경을 커밋한 뒤 호출, 자체 트랜잭션으로 커밋)
+    잠금 순서는 모듈 설명 참고. 실패해도 이미 커밋된 원천 변경은 유지되므로 기록만 남기고,
+    어긋난 집계는 다음 갱신이나 재계산으로 바로잡힙니다.
+    """
+    user_ids = None if user_ids is None else set(user_ids)
+    branch_ids = None if branch_ids is None else set(branch_ids) - {None}
+    months = sorted(set(months))
+    if not months or (user_ids is not None and not user_ids) or (branch_ids is not None and not branch_ids):
+        return
+
+    try:
+        if db.get_bind().dialect.name == "mysql":
+            await db.connection(execution_options={"isolation_level": "READ COMMITTED"})
+
+        user_scope = [Users.deleted_yn == "N"]
+        if user_ids is not None:
+            user_scope.append(Users.id.in_(user_ids))
+        if branch_ids is not None:
+            user_scope.append(Users.branch_id.in_(branch_ids))
+        target_user_ids = (await db.scalars(select(Users.id).where(*user_scope).order_by(Users.id))).all()
+        if not target_user_ids:
+            await db.commit()
+            return
+
+        # 1. 대상 집계 행을 (user_id, year, month) 순서로 배타 잠금 (없는 행은 0으로 생성)
+        lock_stmt = mysql_insert(AttendanceMonthlySummary)
+        lock_stmt = lock_stmt.on_duplicate_key_update(updated_at=AttendanceMonthlySummary.updated_at)
+        await db.execute(lock_stmt, [
+            {"user_id": user_id, "year": year, "month": month, **dict.fromkeys(SUMMARY_COLUMNS, 0)}
+            for user_id in target_user_ids
+            for year, month in months
+        ])
+
+        # 2. 잠금 이후의 최신 커밋 값으로 계산하여 기록
+        for year, month in months:
+            summaries = await compute_attendance_summaries(db, year, month, user_ids=target_user_ids)
+            stmt = mysql_insert(AttendanceMonthlySummary)
+            stmt = stmt.on_duplicate_key_update(
+                updated_at=func.now(),
+                **{column: stmt.inserted[column] for column in SUMMARY_COLUMNS}
+            )
+            await db.execute(stmt, [
+                {"user_id": user_id, "year": year, "month": month, **values}
+                for user_id, values in summaries.items()
+            ])
+        await db.commit()
+    except Exception:
+        await db.rollback()
+        logger.exception("attendance summary refresh failed: months=%s user_ids=%s branch_ids=%s", months, user_ids, branch_ids)
+
+
+async def rebuild_attendance_monthly_summaries(
+    db: AsyncSession,
+    year: Optional[int] = None,
+    month: Optional[int] = None
+) -> int:
+    """
+    원천 데이터로 월간 근태 집계를 다시 계산 (year/month가 없으면 가장 이른 출퇴근 기록의 월부터 이번 달까지)
+    반환값은 기록한 (사용자, 연, 월) 행 수
+    """
+    summary_scope = []
+    if year and month:
+        months = [(year, month)]
+        summary_scope += [AttendanceMonthlySummary.year == year, AttendanceMonthlySummary.month == month]
+    elif year:
+        months = [(year, month) for month in range(1, 13)]
+        summary_scope.append(AttendanceMonthlySummary.year == year)
+    else:
+        first_commute_date = await db.scalar(select(func.min(Commutes.commute_date)).where(Commutes.deleted_yn == "N"))
+        months = months_between(first_commute_date, date.today()) if first_commute_date else []
+
+    await db.execute(delete(AttendanceMonthlySummary).where(*summary_scope))
+    count = 0
+    for summary_year, summary_month in months:
+        summaries = await compute_attendance_summaries(db, summary_year, summary_month)
+        if summaries:
+            await db.execute(insert(AttendanceMonthlySummary), [
+                {"user_id": user_id, "year": summary_year, "month": summary_month, **values}
+                for user_id, values in summaries.items()
+            ])
+            count += len(summaries)
+    await db.commit()
+    return count
+
+
+async def main(year: Optional[int], month: Optional[int]) -> None:
+    from app.core.database import async_session
+
+    async with async_session() as session:
+        count = await rebuild_attendance_monthly_summaries(session, year, month)
+    print(f"attendance_monthly_summaries: {count} rows rebuilt")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--year", type=int, default=None)
+    parser.add_argument("--month", type=int, default=None)
+    args = parser.parse_args()
+    if args.month and not args.year:
+        parser.error("--month requires --year")
+    asyncio.run(main(args.year, args.month))
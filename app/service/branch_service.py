@@ -29,6 +29,7 @@ from app.cruds.branches.policies import allowance_crud, holiday_work_crud, overt
 from app.cruds.parts import parts_crud
 from app.cruds.branches import branches_crud, branch_histories_crud
 from app.service import parts_service
+from app.service.closed_day_calendar_cache import closed_day_calendar_cache
 from app.enums.parts import PartAutoAnnualLeaveGrant
 from app.enums.branches import BranchHistoryType
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -472,6 +473,8 @@ async def update_branch_policies(*, session: AsyncSession, branch_id: int, reque
         )
 
     await session.commit()
+    # 근무 일정의 고정 휴무 요일은 휴무 캘린더에 표시되므로 해당 지점의 캐시 무효화
+    closed_day_calendar_cache.invalidate(branch_id)
     return True
 
 
@@ -492,6 +495,7 @@ async def update_schedule_holiday(*, session: AsyncSession, branch_id: int, requ
         )
 
         await session.commit()
+        closed_day_calendar_cache.invalidate(branch_id)
         return f"{branch_id}번 지점의 고정 휴무일 업데이트 완료"
 
     except NotFoundError as e:
@@ -506,22 +510,6 @@ async def update_schedule_holiday(*, session: AsyncSession, branch_id: int, requ
         )
     
     
-# 자동 연차 부여 스케줄링
-async def auto_annual_leave_grant_scheduling(*, session: AsyncSession):
-    branches = await branches_crud.find_all_with_parts_users_auto_annual_leave_policies(session=session)
-    for branch in branches:
-        for part in branch.parts:
-            # TODO: 유저마다 주 근무일수 다른거 분기 처리 해야함 지금은 5일로 고정
-            if part.auto_annual_leave_grant == PartAutoAnnualLeaveGrant.MANUAL_GRANT:
-                continue
-            elif part.auto_annual_leave_grant == PartAutoAnnualLeaveGrant.ACCOUNTING_BASED_GRANT:
-                await parts_service.account_based_auto_annual_leave_grant(session=session, part=part, branch=branch)
-            elif part.auto_annual_leave_grant == PartAutoAnnualLeaveGrant.ENTRY_DATE_BASED_GRANT:
-                await parts_service.entry_date_based_auto_annual_leave_grant(session=session, part=part, branch=branch)
-            elif part.auto_annual_leave_grant == PartAutoAnnualLeaveGrant.CONDITIONAL_GRANT:
-                await parts_service.condition_based_auto_annual_leave_grant(session=session, part=part, branch=branch)
-
-
 async def create_personnel_record_category(
         *, session: AsyncSession, branch_id: int, request: PersonnelRecordCategoryRequest
 ) -> PersonnelRecordCategoryResponse:
@@ -0,0 +1,95 @@
+from dataclasses import dataclass
+from datetime import date
+from typing import Optional
+
+from app.core.config import settings
+from app.utils.datetime_utils import DatetimeUtil
+from app.utils.ttl_cache import TTLCache
+
+
+@dataclass(frozen=True, slots=True)
+class UserOffDays:
+    """직원 1명의 월간 휴무 (날짜 문자열, 휴무 종류) 목록. 휴무 → 연차 → 정규휴무 순서"""
+    user_name: str
+    part_name: str
+    days: tuple[tuple[str, str], ...]
+
+
+@dataclass(frozen=True, slots=True)
+class BranchMonthCalendar:
+    """지점의 (연, 월) 휴무 캘린더 스냅샷 (불변)"""
+    hospital_closed_days: tuple[str, ...]  # 병원 휴무일 (정렬)
+    user_off_days: dict[int, UserOffDays]  # user_id -> 직원 휴무
+    early_clock_ins: tuple[tuple[str, int, str, str], ...]  # (날짜, user_id, "[HH:MM]이름", 파트명)
+
+
+class ClosedDayCalendarCache(TTLCache[tuple[int, int, int], BranchMonthCalendar]):
+    """
+    (branch_id, 연, 월) 단위로 BranchMonthCalendar를 보관하는 TTL + LRU 캐시
+
+    - 휴무일/조기 출근/연차 승인/지점 고정 휴무 요일처럼 지점이 정해진 변경은 invalidate(branch_id),
+      근로계약(정기 휴무) 변경처럼 지점을 알 수 없는 변경은 invalidate_all()을 커밋 후 호출해야 합니다.
+    - 직원 이름/파트 변경 등 그 밖의 변경은 TTL이 지나면 반영됩니다.
+    - 조회 중에 무효화가 일어난 경우를 막기 위해 generation을 비교한 뒤 저장합니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        super().__init__(maxsize, ttl)
+        self._generations: dict[int, int] = {}
+        self._global_generation = 0
+        self.invalidations = 0
+
+    def get(self, branch_id: int, year: int, month: int) -> Optional[BranchMonthCalendar]:
+        return self.lookup((branch_id, year, month))
+
+    def generation(self, branch_id: int) -> tuple[int, int]:
+        return self._global_generation, self._generations.get(branch_id, 0)
+
+    def set(
+        self,
+        branch_id: int,
+        year: int,
+        month: int,
+        calendar: BranchMonthCalendar,
+        generation: Optional[tuple[int, int]] = None
+    ) -> None:
+        # 조회하는 동안 휴무 정보가 변경되었다면 오래된 스냅샷을 저장하지 않음
+        if generation is not None and generation != self.generation(branch_id):
+            return
+        self.store((branch_id, year, month), calendar)
+
+    def invalidate(self, *branch_ids: Optional[int]) -> None:
+        """지점의 모든 월 캘린더 제거"""
+        for branch_id in set(branch_ids) - {None}:
+            self._generations[branch_id] = self._generations.get(branch_id, 0) + 1
+            self.discard_where(lambda key: key[0] == branch_id)
+            self.invalidations += 1
+
+    def invalidate_all(self) -> None:
+        """모든 지점의 캘린더 제거"""
+        self._global_generation += 1
+        super().clear()
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        """항목과 지점별 generation 초기화"""
+        super().clear()
+        self._generations.clear()
+
+    def stats(self) -> dict:
+        return {**super().stats(), "invalidations": self.invalidations}
+
+
+def weekday_dates(year: int, month: int, weekday: int, first_day: Optional[date] = None) -> list[date]:
+    """해당 월에서 weekday(월요일=0)인 날짜 목록 (first_day 이전 제외). 날짜별 반복 없이 7일 간격으로 계산"""
+    start, end = DatetimeUtil.month_range(year, month)
+    first = start.toordinal() + (weekday - start.weekday()) % 7
+    if first_day is not None and first_day.toordinal() > first:
+        first += -(-(first_day.toordinal() - first) // 7) * 7
+    return [date.fromordinal(ordinal) for ordinal in range(first, end.toordinal(), 7)]
+
+
+closed_day_calendar_cache = ClosedDayCalendarCache(
+    maxsize=settings.CLOSED_DAY_CALENDAR_CACHE_MAXSIZE,
+    ttl=settings.CLOSED_DAY_CALENDAR_CACHE_TTL,
+)
@@ -4,8 +4,9 @@ from sqlalchemy import and_, func, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.api.routes.closed_days.dto.closed_days_response_dto import EarlyClockInResponseDTO, UserClosedDayDetail, UserClosedDayDetailDTO, UserClosedDaySummaryDTO
 from app.core.database import get_db
+from app.cruds.closed_days import closed_days_crud
 from app.enums.user_management import ContractStatus, ContractType
-from app.enums.users import EmploymentStatus, Status
+from app.enums.users import EmploymentStatus, Status, Weekday
 from app.exceptions.exceptions import ForbiddenError, NotFoundError
 from app.models.branches.branches_model import Branches
 from app.models.branches.leave_categories_model import LeaveCategory
@@ -17,153 +18,67 @@ from app.models.users.users_contract_info_model import ContractInfo
 from app.models.users.users_contract_model import Contract
 from app.models.users.users_model import Users
 from calendar import monthrange
+import numpy as np
 from datetime import date, datetime, timedelta
 
 from app.models.users.users_work_contract_model import FixedRestDay, WorkContract
+from app.service.closed_day_calendar_cache import BranchMonthCalendar, UserOffDays, closed_day_calendar_cache, weekday_dates
+from app.utils.date_intervals import month_date_strs, month_day_mask
+from app.utils.datetime_utils import DatetimeUtil
+
+# 요일 -> date.weekday() 값 (월요일=0)
+WEEKDAY_INDEX = {weekday: index for index, weekday in enumerate(Weekday)}
 
 class ClosedDayService:
     def __init__(self, session: AsyncSession = Depends(get_db)):
         self.session = session
 
-    async def get_all_user_closed_days_group_by_user_id(self, branch_id: int, year: int, month: int) -> List[UserClosedDayDetail]:
+    async def get_month_calendar(self, branch_id: int, year: int, month: int) -> BranchMonthCalendar:
         '''
-        특정 지점에서 모든 직원의 월간 휴무일 조회를 user_id별로 조회
+        지점의 월간 휴무 캘린더 (병원 휴무일, 직원별 휴무, 조기 출근)
+        (branch_id, 연, 월) 단위로 캐시하며, 휴무일/조기 출근/연차 승인/근로계약 변경 시 무효화됩니다.
         '''
-        # 직원의 특정 휴무일 조회
+        calendar = closed_day_calendar_cache.get(branch_id, year, month)
+        if calendar is None:
+            generation = closed_day_calendar_cache.generation(branch_id)
+            calendar = await self._build_month_calendar(branch_id, year, month)
+            closed_day_calendar_cache.set(branch_id, year, month, calendar, generation)
+        return calendar
+
+    async def _build_month_calendar(self, branch_id: int, year: int, month: int) -> BranchMonthCalendar:
+        # 병원 특정 휴무일 + 정기 휴무 요일
         query = (
-            select(ClosedDays.closed_day_date, Users.id, Users.name, Parts.name)
-            .join(Users, ClosedDays.user_id == Users.id)
-                .filter(
-                    and_(
-                        ClosedDays.branch_id == branch_id,
-                        ClosedDays.user_id != None,
-                        func.extract('year', ClosedDays.closed_day_date) == year,
-                        func.extract('month', ClosedDays.closed_day_date) == month,
-                        ClosedDays.deleted_yn == "N"
-                    )
-                )
-            .join(Parts, Users.part_id == Parts.id)
-        )
-        result = await self.session.execute(query)
-        closed_days = result.fetchall()
-
-        user_id_to_detail = {}
-        for closed_day_date, user_id, user_name, part_name in closed_days:
-            if user_id not in user_id_to_detail:
-                user_id_to_detail[user_id] = {
-                    "user_name": user_name,
-                    "part_name": part_name,
-                    "user_closed_days": []
-                }
-            user_id_to_detail[user_id]["user_closed_days"].append(UserClosedDaySummaryDTO.to_DTO(closed_day_date.strftime("%Y-%m-%d"), "휴무"))
-
-        # 연차 조회
-        user_ids = list(user_id_to_detail.keys())
-        query = (
-            select(LeaveHistories.user_id, LeaveHistories.start_date, LeaveHistories.end_date, LeaveCategory.name)
-            .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
-                .filter(LeaveHistories.status == Status.APPROVED)
-                .filter(func.extract('year', LeaveHistories.start_date) == year)
-                .filter(func.extract('month', LeaveHistories.start_date) == month)
-                .filter(LeaveHistories.user_id.in_(user_ids))
-        )
-        result = await self.session.execute(query)
-        leave_histories = result.fetchall()
-
-        for leave_history in leave_histories:
-            user_id, start_date, end_date, leave_category_name = leave_history
-            current_date = start_date
-            while current_date <= end_date:
-                user_id_to_detail[user_id]["user_closed_days"].append(UserClosedDaySummaryDTO.to_DTO(current_date.strftime("%Y-%m-%d"), leave_category_name))
-                current_date += timedelta(days=1)
-        
-        # 정기 휴무 -> fixed_closed_days 조회
-        # 날짜만 구하기
-        ## 유저별 최신 WORK 타입 계약 테이블에서 정기 휴무일 조회
-        latest_contracts = (
-            select(
-                ContractInfo.user_id,
-                func.max(Contract.created_at).label('max_date')
-            )
-            .select_from(Contract)
-            .join(ContractInfo, Contract.contract_info_id == ContractInfo.id)
-                .filter(ContractInfo.user_id.in_(user_ids))
-            .where(Contract.contract_type == ContractType.WORK)
-            .group_by(ContractInfo.user_id)
-            .subquery()
-        )
-    
-        ## 유저별 최신 WORK 타입 계약 테이블
-        current_contract_table = (
-            select(
-                ContractInfo.user_id,
-                Contract.contract_type,
-                Contract.created_at,
-                Contract.contract_id,
-                ContractInfo.hire_date
-            )
-            .select_from(Contract)
-            .join(ContractInfo, Contract.contract_info_id == ContractInfo.id)
-                .filter(ContractInfo.employ_status == EmploymentStatus.PERMANENT)
-            .where(
+            select(ClosedDays.closed_day_date)
+            .filter(
                 and_(
-                    Contract.contract_type == ContractType.WORK,
-                    Contract.contract_status == ContractStatus.APPROVE,
-                    tuple_(ContractInfo.user_id, Contract.created_at).in_(
-                        select(
-                            latest_contracts.c.user_id,
-                            latest_contracts.c.max_date
-                        ).select_from(latest_contracts)
-                    ),
+                    ClosedDays.branch_id == branch_id,
+                    ClosedDays.user_id == None,
+                    DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
+                    ClosedDays.deleted_yn == "N"
                 )
             )
-            .subquery()
         )
+        hospital_closed_days = {closed_day_date.strftime("%Y-%m-%d") for closed_day_date in (await self.session.scalars(query))}
 
         query = (
-            select(current_contract_table.c.user_id, current_contract_table.c.hire_date, FixedRestDay.rest_day, FixedRestDay.every_over_week)
-            .select_from(current_contract_table)
-            .join(WorkContract, current_contract_table.c.contract_id == WorkContract.id)
-                .filter(
-                    WorkContract.is_fixed_rest_day == True,
-                    WorkContract.deleted_yn == "n"
-                )
-            .join(FixedRestDay, WorkContract.id == FixedRestDay.work_contract_id)
+            select(BranchWorkSchedule.day_of_week)
+            .select_from(Branches)
+            .join(WorkPolicies, Branches.id == WorkPolicies.branch_id)
+                .filter(Branches.id == branch_id)
+            .join(BranchWorkSchedule, WorkPolicies.id == BranchWorkSchedule.work_policy_id)
+                .filter(BranchWorkSchedule.is_holiday == True)
         )
+        for day_of_week in set(await self.session.scalars(query)):
+            hospital_closed_days.update(day.strftime("%Y-%m-%d") for day in weekday_dates(year, month, WEEKDAY_INDEX[day_of_week]))
 
-        result = await self.session.execute(query)
-        fixed_rest_days = result.fetchall()
+        # 직원별 휴무 (휴무 → 연차 → 정규휴무 순서)
+        users: dict[int, tuple[str, str, list]] = {}
+        date_strs = month_date_strs(year, month)
 
-        for user_id, contract_start_date, rest_day, every_over_week in fixed_rest_days:
-            first_day_of_month = date(year, month, 1)
-            days_in_month = monthrange(year, month)[1]
+        def add(user_id: int, user_name: str, part_name: str, closed_date: str, category: str):
+            users.setdefault(user_id, (user_name, part_name, []))[2].append((closed_date, category))
 
-            for day in range(days_in_month):
-                current_day = first_day_of_month + timedelta(days=day)
-                if current_day.strftime('%A').upper() == rest_day.name and current_day >= contract_start_date:
-                    # 격주 휴무인 경우, 짝수 주차에만 휴무 추가 
-                    if every_over_week:
-                        # 계약 시작일로부터 몇 주차인지 계산
-                        weeks_since_start = ((current_day - contract_start_date).days // 7)
-                        if weeks_since_start % 2 == 0:
-                            user_id_to_detail[user_id]["user_closed_days"].append(UserClosedDaySummaryDTO.to_DTO(current_day.strftime('%Y-%m-%d'), "정규휴무"))
-                    else:
-                        user_id_to_detail[user_id]["user_closed_days"].append(UserClosedDaySummaryDTO.to_DTO(current_day.strftime('%Y-%m-%d'), "정규휴무"))
-
-        # 날짜별로 정렬
-        for user_id in user_id_to_detail:
-            user_id_to_detail[user_id]["user_closed_days"] = set(user_id_to_detail[user_id]["user_closed_days"])
-
-        return [
-            UserClosedDayDetailDTO.to_DTO(user_id, **detail)
-            for user_id, detail in user_id_to_detail.items()
-        ]
-    
-    async def get_all_user_closed_days_group_by_date(self, branch_id: int, year: int, month: int) -> dict[str, List[UserClosedDayDetail]]:
-        '''
-        특정 지점에서 모든 직원의 월간 휴무일 조회를 날짜별로 조회
-        '''
-        # 직원의 특정 휴무일 조회
+        ## 직원의 특정 휴무일
         query = (
             select(ClosedDays.closed_day_date, Users.id, Users.name, Parts.name)
             .join(Users, ClosedDays.user_id == Users.id)
@@ -171,30 +86,16 @@ class ClosedDayService:
                     and_(
                         ClosedDays.branch_id == branch_id,
                         ClosedDays.user_id != None,
-                        func.extract('year', ClosedDays.closed_day_date) == year,
-                        func.extract('month', ClosedDays.closed_day_date) == month,
+                        DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
                         ClosedDays.deleted_yn == "N"
                     )
                 )
             .join(Parts, Users.part_id == Parts.id)
         )
+        for closed_day_date, user_id, user_name, part_name in (await self.session.execute(query)).all():
+            add(user_id, user_name, part_name, closed_day_date.strftime("%Y-%m-%d"), "휴무")
 
-        result = await self.session.execute(query)
-        closed_days = result.fetchall()
-
-        date_to_users = {}
-        for closed_day_date, user_id, user_name, part_name in closed_days:
-            date_str = closed_day_date.strftime("%Y-%m-%d")
-            if date_str not in date_to_users:
-                date_to_users[date_str] = set()
-            date_to_users[date_str].add(UserClosedDayDetail(
-                user_id=user_id,
-                user_name=user_name,
-                part_name=part_name,
-                category="휴무"
-            ))
-
-        # 연차 조회
+        ## 승인된 연차 (해당 월과 겹치는 연차를 월 범위의 날짜 비트맵으로 펼침)
         query = (
             select(LeaveHistories.user_id, LeaveHistories.start_date, LeaveHistories.end_date, LeaveCategory.name, Users.name, Parts.name)
             .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
@@ -203,32 +104,18 @@ class ClosedDayService:
                 .filter(
                     and_(
                         LeaveHistories.status == Status.APPROVED,
-                        func.extract('year', LeaveHistories.start_date) == year,
-                        func.extract('month', LeaveHistories.start_date) == month,
+                        DatetimeUtil.overlaps_month(LeaveHistories.start_date, LeaveHistories.end_date, year, month),
                         Users.branch_id == branch_id
                     )
                 )
         )
-        result = await self.session.execute(query)
-        leave_histories = result.fetchall()
+        leave_histories = (await self.session.execute(query)).all()
+        leave_mask = month_day_mask(year, month, [row.start_date for row in leave_histories], [row.end_date for row in leave_histories])
+        for row, day in zip(*np.nonzero(leave_mask)):
+            user_id, _, _, leave_category_name, user_name, part_name = leave_histories[row]
+            add(user_id, user_name, part_name, date_strs[day], leave_category_name)
 
-        for leave_history in leave_histories:
-            user_id, start_date, end_date, leave_category_name, user_name, part_name = leave_history
-            current_date = start_date
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                if date_str not in date_to_users:
-                    date_to_users[date_str] = set()
-                date_to_users[date_str].add(UserClosedDayDetail(
-                    user_id=user_id,
-                    user_name=user_name,
-                    part_name=part_name,
-                    category=leave_category_name
-                ))
-                current_date += timedelta(days=1)
-        
-        # 정기 휴무 -> fixed_closed_days 조회
-        ## 각 user_id별 최신 created_at을 찾는 쿼리
+        ## 정기 휴무 (유저별 최신 WORK 타입 계약의 고정 휴무 요일)
         latest_contracts = (
             select(
                 ContractInfo.user_id,
@@ -240,8 +127,7 @@ class ClosedDayService:
             .group_by(ContractInfo.user_id)
             .subquery()
         )
-    
-        ## 유저별 최신 WORK 타입 계약 테이블
+
         current_contract_table = (
             select(
                 ContractInfo.user_id,
@@ -281,88 +167,81 @@ class ClosedDayService:
                 )
             .join(FixedRestDay, WorkContract.id == FixedRestDay.work_contract_id)
         )
-
-        result = await self.session.execute(query)
-        fixed_rest_days = result.fetchall()
-
-        for user_id, contract_start_date, rest_day, every_over_week, user_name, part_name in fixed_rest_days:
-            first_day_of_month = date(year, month, 1)
-            days_in_month = monthrange(year, month)[1]
-
-            for day in range(days_in_month):
-                current_day = first_day_of_month + timedelta(days=day)
-                if current_day.strftime('%A').upper() != rest_day.name or current_day < contract_start_date:
+        for user_id, contract_start_date, rest_day, every_over_week, user_name, part_name in (await self.session.execute(query)).all():
+            if contract_start_date is None:
+                continue
+            for rest_date in weekday_dates(year, month, WEEKDAY_INDEX[rest_day], contract_start_date):
+                # 격주 휴무인 경우, 계약 시작일로부터 짝수 주차에만 휴무
+                if every_over_week and (rest_date - contract_start_date).days // 7 % 2:
                     continue
-                
-                date_str = current_day.strftime('%Y-%m-%d')
-                if every_over_week:
-                    weeks_since_start = ((current_day - contract_start_date).days // 7)
-                    if weeks_since_start % 2 == 0:
-                        if date_str not in date_to_users:
-                            date_to_users[date_str] = set()
-                        date_to_users[date_str].add(UserClosedDayDetail(
-                            user_id=user_id,
-                            user_name=user_name,
-                            part_name=part_name,
-                            category="정규휴무"
-                        ))
-                else:
-                    if date_str not in date_to_users:
-                        date_to_users[date_str] = set()
-                    date_to_users[date_str].add(UserClosedDayDetail(
-                        user_id=user_id,
-                        user_name=user_name,
-                        part_name=part_name,
-                        category="정규휴무"
-                    ))
-
-        return dict(sorted(date_to_users.items()))
+                add(user_id, user_name, part_name, rest_date.strftime("%Y-%m-%d"), "정규휴무")
 
-    async def get_all_hospital_closed_days(self, branch_id: int, year: int, month: int) -> List[str]:
-        '''
-        특정 지점 월간 병원 휴무일 조회 (날짜만, 정규휴무와 특정 휴무)
-        '''
-        # 병원 특정 휴무일 조회
+        # 조기 출근
         query = (
-            select(ClosedDays.closed_day_date)
+            select(EarlyClockIn.early_clock_in, Users.id, Users.name, Parts.name)
+            .join(Users, EarlyClockIn.user_id == Users.id)
+            .join(Parts, Users.part_id == Parts.id)
             .filter(
                 and_(
-                    ClosedDays.branch_id == branch_id,
-                    ClosedDays.user_id == None,
-                    func.extract('year', ClosedDays.closed_day_date) == year,
-                    func.extract('month', ClosedDays.closed_day_date) == month,
-                    ClosedDays.deleted_yn == "N"
+                    Users.branch_id == branch_id,
+                    DatetimeUtil.in_month(EarlyClockIn.early_clock_in, year, month),
+                    EarlyClockIn.deleted_yn == "N"
                 )
             )
+            .order_by(EarlyClockIn.early_clock_in, EarlyClockIn.id)
         )
-
-        result = await self.session.execute(query)
-        closed_days = set([closed_day.closed_day_date.strftime("%Y-%m-%d") for closed_day in result.fetchall()])
-
-        # 병원 정기 휴무일 조회
-        query = (
-            select(BranchWorkSchedule.day_of_week)
-            .select_from(Branches)
-            .join(WorkPolicies, Branches.id == WorkPolicies.branch_id)
-                .filter(Branches.id == branch_id)
-            .join(BranchWorkSchedule, WorkPolicies.id == BranchWorkSchedule.work_policy_id)
-                .filter(BranchWorkSchedule.is_holiday == True)
+        early_clock_ins = tuple(
+            (clock_in_time.strftime("%Y-%m-%d"), user_id, f"[{clock_in_time.strftime('%H:%M')}]{user_name}", part_name)
+            for clock_in_time, user_id, user_name, part_name in (await self.session.execute(query)).all()
         )
 
-        result = await self.session.execute(query)
-        
-        days_of_week = [day.day_of_week for day in result.fetchall()]
+        return BranchMonthCalendar(
+            hospital_closed_days=tuple(sorted(hospital_closed_days)),
+            user_off_days={
+                user_id: UserOffDays(user_name=user_name, part_name=part_name, days=tuple(days))
+                for user_id, (user_name, part_name, days) in users.items()
+            },
+            early_clock_ins=early_clock_ins,
+        )
 
-        for day_of_week in days_of_week:
-            first_day_of_month = date(year, month, 1)
-            days_in_month = monthrange(year, month)[1]
+    async def get_all_user_closed_days_group_by_user_id(self, branch_id: int, year: int, month: int) -> List[UserClosedDayDetail]:
+        '''
+        특정 지점에서 모든 직원의 월간 휴무일 조회를 user_id별로 조회
+        '''
+        calendar = await self.get_month_calendar(branch_id, year, month)
+        return [
+            UserClosedDayDetailDTO.to_DTO(
+                user_id,
+                off_days.user_name,
+                off_days.part_name,
+                {UserClosedDaySummaryDTO.to_DTO(closed_date, category) for closed_date, category in off_days.days}
+            )
+            for user_id, off_days in calendar.user_off_days.items()
+        ]
+    
+    async def get_all_user_closed_days_group_by_date(self, branch_id: int, year: int, month: int) -> dict[str, List[UserClosedDayDetail]]:
+        '''
+        특정 지점에서 모든 직원의 월간 휴무일 조회를 날짜별로 조회
+        같은 날짜에 한 직원의 휴무가 여러 건이면 휴무 → 연차 → 정규휴무 순서로 앞선 것만 표시
+        '''
+        calendar = await self.get_month_calendar(branch_id, year, month)
+        date_to_users = {}
+        for user_id, off_days in calendar.user_off_days.items():
+            for closed_date, category in off_days.days:
+                date_to_users.setdefault(closed_date, set()).add(UserClosedDayDetail(
+                    user_id=user_id,
+                    user_name=off_days.user_name,
+                    part_name=off_days.part_name,
+                    category=category
+                ))
+        return dict(sorted(date_to_users.items()))
 
-            for day in range(days_in_month):
-                current_day = first_day_of_month + timedelta(days=day)
-                if current_day.strftime('%A').upper() == day_of_week.name:
-                    closed_days.add(current_day.strftime('%Y-%m-%d'))
-        
-        return sorted(closed_days)
+    async def get_all_hospital_closed_days(self, branch_id: int, year: int, month: int) -> List[str]:
+        '''
+        특정 지점 월간 병원 휴무일 조회 (날짜만, 정규휴무와 특정 휴무)
+        '''
+        calendar = await self.get_month_calendar(branch_id, year, month)
+        return list(calendar.hospital_closed_days)
         
     async def get_user_and_hospital_closed_days(self, branch_id: int, user_id: int, year: int, month: int) -> tuple[dict[str, List[UserClosedDayDetail]], List[str]]:
         '''
@@ -376,8 +255,7 @@ class ClosedDayService:
                 and_(
                     ClosedDays.branch_id == branch_id,
                     ClosedDays.user_id == user_id,  # 본인 것만 조회
-                    func.extract('year', ClosedDays.closed_day_date) == year,
-                    func.extract('month', ClosedDays.closed_day_date) == month,
+                    DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
                     ClosedDays.deleted_yn == "N"
                 )
             )
@@ -408,27 +286,23 @@ class ClosedDayService:
                 and_(
                     LeaveHistories.status == Status.APPROVED,
                     LeaveHistories.user_id == user_id,  # 본인 것만 조회
-                    func.extract('year', LeaveHistories.start_date) == year,
-                    func.extract('month', LeaveHistories.start_date) == month
+                    DatetimeUtil.overlaps_month(LeaveHistories.start_date, LeaveHistories.end_date, year, month)
                 )
             )
         )
         result = await self.session.execute(query)
         leave_histories = result.fetchall()
 
-        for start_date, end_date, leave_category_name, user_name, part_name in leave_histories:
-            current_date = start_date
-            while current_date <= end_date:
-                date_str = current_date.strftime("%Y-%m-%d")
-                if date_str not in date_to_users:
-                    date_to_users[date_str] = []
-                date_to_users[date_str].append(UserClosedDayDetail(
-                    user_id=user_id,
-                    user_name=user_name,
-                    part_name=part_name,
-                    category=leave_category_name
-                ))
-                current_date += timedelta(days=1)
+        date_strs = month_date_strs(year, month)
+        leave_mask = month_day_mask(year, month, [row.start_date for row in leave_histories], [row.end_date for row in leave_histories])
+        for row, day in zip(*np.nonzero(leave_mask)):
+            _, _, leave_category_name, user_name, part_name = leave_histories[row]
+            date_to_users.setdefault(date_strs[day], []).append(UserClosedDayDetail(
+                user_id=user_id,
+                user_name=user_name,
+                part_name=part_name,
+                category=leave_category_name
+            ))
 
         # 정기 휴무 조회
         query = (
@@ -483,37 +357,13 @@ class ClosedDayService:
     
     async def get_all_user_early_clock_ins_group_by_date(self, branch_id: int, year: int, month: int) -> dict[str, EarlyClockInResponseDTO]:
         """
-        특정 지점의 모든 직원의 월간 조기 출근 기록 조회
+        특정 지점의 모든 직원의 월간 조기 출근 기록 조회 (같은 날짜는 마지막 기록)
         """
-        query = (
-            select(EarlyClockIn.early_clock_in, Users.id, Users.name, Parts.name)
-            .join(Users, EarlyClockIn.user_id == Users.id)
-            .join(Parts, Users.part_id == Parts.id)
-            .filter(
-                and_(
-                    Users.branch_id == branch_id,
-                    func.extract('year', EarlyClockIn.early_clock_in) == year,
-                    func.extract('month', EarlyClockIn.early_clock_in) == month,
-                    EarlyClockIn.deleted_yn == "N"
-                )
-            )
-        )
-        
-        result = await self.session.execute(query)
-        early_clock_ins = result.fetchall()
-        
-        early_clock_in_days = {}
-        for clock_in_time, user_id, user_name, part_name in early_clock_ins:
-            date_str = clock_in_time.strftime("%Y-%m-%d")
-            time_str = clock_in_time.strftime("%H:%M")
-            
-            early_clock_in_days[date_str] = EarlyClockInResponseDTO(
-                user_id=user_id,
-                user_name=f"[{time_str}]{user_name}",
-                part_name=part_name
-            )
-        
-        return early_clock_in_days
+        calendar = await self.get_month_calendar(branch_id, year, month)
+        return {
+            date_str: EarlyClockInResponseDTO(user_id=user_id, user_name=user_name, part_name=part_name)
+            for date_str, user_id, user_name, part_name in calendar.early_clock_ins
+        }
 
     async def get_user_early_clock_in(self, branch_id: int, user_id: int, year: int, month: int) -> dict[str, EarlyClockInResponseDTO]:
         """
@@ -527,8 +377,7 @@ class ClosedDayService:
                 and_(
                     Users.branch_id == branch_id,
                     EarlyClockIn.user_id == user_id,
-                    func.extract('year', EarlyClockIn.early_clock_in) == year,
-                    func.extract('month', EarlyClockIn.early_clock_in) == month,
+                    DatetimeUtil.in_month(EarlyClockIn.early_clock_in, year, month),
                     EarlyClockIn.deleted_yn == "N"
                 )
             )
@@ -563,8 +412,7 @@ class ClosedDayService:
                 and_(
                     EarlyClockIn.branch_id == branch_id,
                     EarlyClockIn.user_id == user_id,
-                    func.extract('year', EarlyClockIn.early_clock_in) == year,
-                    func.extract('month', EarlyClockIn.early_clock_in) == month,
+                    DatetimeUtil.in_month(EarlyClockIn.early_clock_in, year, month),
                     func.date(EarlyClockIn.early_clock_in) >= today,
                     EarlyClockIn.deleted_yn == "N"
                 )
@@ -581,43 +429,21 @@ class ClosedDayService:
         직원의 조기 출근 시간을 삭제 처리
         """
         try:
-            for user_id, dates in early_clock_in.early_clock_in_users.items():
-                # 해당 직원이 이 지점 소속인지 확인
-                stmt = select(Users).where(
-                    and_(
-                        Users.id == user_id,
-                        Users.branch_id == branch_id,
-                        Users.deleted_yn == 'N'
-                    )
-                )
-                result = await self.session.execute(stmt)
-                user = result.scalar_one_or_none()
-                
-                if not user:
+            # 요청한 직원이 모두 이 지점 소속인지 확인
+            branch_user_ids = await closed_days_crud.find_branch_user_ids(
+                self.session, branch_id, list(early_clock_in.early_clock_in_users)
+            )
+            for user_id in early_clock_in.early_clock_in_users:
+                if user_id not in branch_user_ids:
                     raise ForbiddenError(
                         detail=f"사용자 ID {user_id}는 해당 지점의 직원이 아닙니다."
                     )
 
-                # 삭제할 레코드 조회
-                stmt = (
-                    select(EarlyClockIn)
-                    .where(
-                        and_(
-                            EarlyClockIn.user_id == user_id,
-                            EarlyClockIn.branch_id == branch_id,
-                            EarlyClockIn.early_clock_in.in_(dates),
-                            EarlyClockIn.deleted_yn == "N"
-                        )
-                    )
-                )
-                result = await self.session.execute(stmt)
-                records = result.scalars().all()
-                # 삭제 처리
-                for record in records:
-                    record.deleted_yn = "Y"
-                    record.updated_at = datetime.now()
+            # 삭제 처리 (한 번의 UPDATE)
+            await closed_days_crud.delete_early_clock_ins(self.session, branch_id, early_clock_in.early_clock_in_users)
 
             await self.session.commit()
+            closed_day_calendar_cache.invalidate(branch_id)
             return True
         except HTTPException as http_err:
             await self.session.rollback()
@@ -0,0 +1,88 @@
+"""
+월간 근태 달력 엔진 벤치마크
+
+    python -m app.service.commute_calendar_benchmark --year 2024 --month 3
+
+임의로 생성한 월간 데이터(출퇴근, 휴가, 휴무, 휴점, 휴직, 입사/퇴사)로 1명, 1,000명의 달력을 구성합니다.
+    - build      : build_month_calendars (배열 레이어 병합)
+    - records    : 전체 사용자의 CommuteRecord 생성 (응답 직전 단계)
+    - per-user   : 사용자마다 build_month_calendars를 따로 호출한 경우 (비교 기준)
+"""
+import argparse
+import random
+import time
+from datetime import date, datetime, timedelta
+
+from app.api.routes.commutes_manager.dto.commutes_manager_response_dto import Weekday
+from app.service.commute_calendar_engine import CalendarUser, CommuteMonthData, build_month_calendars
+from app.utils.datetime_utils import DatetimeUtil
+
+BRANCH_COUNT = 10
+
+
+def generate(year: int, month: int, user_count: int, seed: int = 0) -> tuple[list[CalendarUser], CommuteMonthData]:
+    rnd = random.Random(seed)
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    days = (next_month_start - month_start).days
+    month_data = CommuteMonthData()
+
+    for branch_id in range(1, BRANCH_COUNT + 1):
+        month_data.weekly_work_days[branch_id] = 5
+        month_data.holiday_weekdays[branch_id] = [Weekday.SUNDAY] + ([Weekday.SATURDAY] if branch_id % 2 else [])
+        month_data.branch_closed_days[branch_id] = [month_start + timedelta(days=rnd.randrange(days))]
+
+    users = []
+    for user_id in range(1, user_count + 1):
+        branch_id = rnd.randint(1, BRANCH_COUNT)
+        hire_date = month_start + timedelta(days=rnd.randrange(days)) if rnd.random() < 0.05 else date(2020, 1, 1)
+        resignation_date = month_start + timedelta(days=rnd.randrange(days)) if rnd.random() < 0.05 else None
+        users.append(CalendarUser(user_id, branch_id, hire_date, resignation_date))
+
+        for day in range(days):
+            current = month_start + timedelta(days=day)
+            r = rnd.random()
+            if r < 0.75:
+                clock_in = datetime.combine(current, datetime.min.time()) + timedelta(hours=9, seconds=rnd.randrange(1800))
+                month_data.commutes[user_id].append((clock_in, clock_in + timedelta(hours=9)))
+            elif r < 0.8:
+                month_data.user_closed_days[(user_id, branch_id)].append(current)
+            elif r < 0.83:
+                month_data.leaves[user_id].append((current, "연차"))
+        if rnd.random() < 0.02:
+            start = datetime.combine(month_start + timedelta(days=rnd.randrange(days)), datetime.min.time())
+            month_data.time_offs[user_id].append((start, start + timedelta(days=30)))
+
+    return users, month_data
+
+
+def measure(func, repeat: int) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main(year: int, month: int, repeat: int) -> None:
+    for user_count in (1, 1000):
+        users, month_data = generate(year, month, user_count)
+        calendars = build_month_calendars(year, month, users, month_data)
+        count = max(1, repeat // user_count)
+
+        build_ms = measure(lambda: build_month_calendars(year, month, users, month_data), count)
+        records_ms = measure(lambda: [calendars.records(user.user_id) for user in users], count)
+        per_user_ms = measure(
+            lambda: [build_month_calendars(year, month, [user], month_data) for user in users], count
+        )
+        print(
+            f"users {user_count:>5}  build {build_ms:8.2f} ms  records {records_ms:8.2f} ms  "
+            f"per-user build {per_user_ms:8.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--month", type=int, default=3)
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+    main(args.year, args.month, args.repeat)
@@ -0,0 +1,187 @@
+from collections import defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+import numpy as np
+
+from app.api.routes.commutes_manager.dto.commutes_manager_response_dto import AttendanceStatus, CommuteRecord, Weekday
+from app.utils.datetime_utils import DatetimeUtil
+
+NO_RECORD = 0
+NO_TIME = -1
+
+# AttendanceStatus별 상태 코드 (0은 기록 없음, 휴가 카테고리명은 그 뒤에 동적으로 배정)
+STATUS_CODES: Dict[AttendanceStatus, int] = {status: index + 1 for index, status in enumerate(AttendanceStatus)}
+
+
+@dataclass
+class CommuteMonthData:
+    """CommutesManagerService.get_month_data 결과 (user_id/branch_id별로 묶은 월간 데이터)"""
+    time_offs: Dict[int, List[Tuple[datetime, datetime]]] = field(default_factory=lambda: defaultdict(list))
+    weekly_work_days: Dict[int, int] = field(default_factory=dict)
+    holiday_weekdays: Dict[int, List[Weekday]] = field(default_factory=dict)
+    branch_closed_days: Dict[int, List[date]] = field(default_factory=lambda: defaultdict(list))
+    user_closed_days: Dict[Tuple[int, int], List[date]] = field(default_factory=lambda: defaultdict(list))
+    leaves: Dict[int, List[Tuple[date, str]]] = field(default_factory=lambda: defaultdict(list))
+    commutes: Dict[int, List[Tuple[datetime, Optional[datetime]]]] = field(default_factory=lambda: defaultdict(list))
+
+
+class CalendarUser(NamedTuple):
+    user_id: int
+    branch_id: int
+    hire_date: Optional[date]
+    resignation_date: Optional[date]
+
+
+class MonthCalendars:
+    """
+    여러 사용자의 한 달 근태 달력 (사용자 x 일자 배열)
+        - status: 상태 코드 (labels[code]가 응답의 status 값)
+        - clock_in/clock_out: 0시 기준 초 단위 정수 (없으면 -1)
+    CommuteRecord는 records()에서 응답을 만들 때만 생성합니다.
+    """
+
+    def __init__(self, year: int, month: int, user_ids: List[int]):
+        self.month_start, next_month_start = DatetimeUtil.month_range(year, month)
+        self.days = (next_month_start - self.month_start).days
+        self.index = {user_id: row for row, user_id in enumerate(user_ids)}
+        self.date_strs = [(self.month_start + timedelta(days=day)).strftime("%Y-%m-%d") for day in range(self.days)]
+
+        self.status = np.zeros((len(user_ids), self.days), dtype=np.int16)
+        self.clock_in = np.full((len(user_ids), self.days), NO_TIME, dtype=np.int32)
+        self.clock_out = np.full((len(user_ids), self.days), NO_TIME, dtype=np.int32)
+        self.labels: List[Optional[str]] = [None] + [status.value for status in AttendanceStatus]
+        self._label_codes: Dict[str, int] = {}
+
+    def label_code(self, label: str) -> int:
+        """휴가 카테고리명 등 AttendanceStatus 외의 상태값에 코드 배정"""
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self.labels)
+            self.labels.append(label)
+        return code
+
+    def records(self, user_id: int) -> Dict[str, CommuteRecord]:
+        row = self.index[user_id]
+        statuses = self.status[row].tolist()
+        clock_ins, clock_outs = self.clock_in[row].tolist(), self.clock_out[row].tolist()
+
+        return {
+            self.date_strs[day]: CommuteRecord(
+                clock_in=_seconds_to_time(clock_ins[day]),
+                clock_out=_seconds_to_time(clock_outs[day]),
+                status=self.labels[code]
+            )
+            for day, code in enumerate(statuses)
+            if code != NO_RECORD
+        }
+
+
+def build_month_calendars(year: int, month: int, users: List[CalendarUser], month_data: CommuteMonthData) -> MonthCalendars:
+    """
+    월간 데이터를 상태 레이어별로 배열에 기록하여 달력을 구성
+    우선순위(낮음 -> 높음): 출퇴근 < 휴가 < 개인 휴무 < 지점 휴점 < 고정 휴점 < 미입사 < 퇴사 < 휴직
+    """
+    calendars = MonthCalendars(year, month, [user.user_id for user in users])
+    if not users:
+        return calendars
+
+    status, days, month_start = calendars.status, calendars.days, calendars.month_start
+    day_index = np.arange(days)
+
+    # 지점별 고정 휴점 요일 / 지점 휴점일 마스크 (지점 x 일자)
+    branch_rows = {branch_id: row for row, branch_id in enumerate(dict.fromkeys(user.branch_id for user in users))}
+    weekdays = (month_start.weekday() + day_index) % 7
+    fixed_closed = np.zeros((len(branch_rows), days), dtype=bool)
+    branch_closed = np.zeros((len(branch_rows), days), dtype=bool)
+    for branch_id, row in branch_rows.items():
+        fixed_closed[row] = np.isin(weekdays, [int(weekday) for weekday in month_data.holiday_weekdays.get(branch_id, [])])
+        closed_days = [(d - month_start).days for d in month_data.branch_closed_days.get(branch_id, [])]
+        branch_closed[row, closed_days] = True
+    user_branch_rows = np.array([branch_rows[user.branch_id] for user in users])
+
+    # 사용자별 기록 (행, 일자, 값)
+    commutes, leaves, user_closed, time_offs = _Sparse(), _Sparse(), _Sparse(), _Sparse()
+    hire_offsets = np.zeros(len(users), dtype=np.int32)
+    resignation_offsets = np.full(len(users), days, dtype=np.int32)
+    time_off_start, time_off_end = STATUS_CODES[AttendanceStatus.TIME_OFF_START], STATUS_CODES[AttendanceStatus.TIME_OFF_END]
+
+    for row, user in enumerate(users):
+        for clock_in, clock_out in month_data.commutes.get(user.user_id, []):
+            commutes.add(row, clock_in.day - 1, (_time_to_seconds(clock_in), _time_to_seconds(clock_out)))
+        for application_date, category_name in month_data.leaves.get(user.user_id, []):
+            leaves.add(row, application_date.day - 1, calendars.label_code(category_name))
+        for closed_day_date in month_data.user_closed_days.get((user.user_id, user.branch_id), []):
+            user_closed.add(row, closed_day_date.day - 1, STATUS_CODES[AttendanceStatus.OFF])
+        for start_date, end_date in month_data.time_offs.get(user.user_id, []):
+            if start_date.year == year and start_date.month == month:
+                time_offs.add(row, start_date.day - 1, time_off_start)
+            if end_date.year == year and end_date.month == month:
+                time_offs.add(row, end_date.day - 1, time_off_end)
+
+        if user.hire_date:
+            hire_offsets[row] = (user.hire_date - month_start).days
+        if user.resignation_date and 0 <= (user.resignation_date - month_start).days < days:
+            resignation_offsets[row] = (user.resignation_date - month_start).days
+
+    # 출퇴근 기록 (같은 날 여러 건이면 마지막 기록)
+    rows, cols, values = commutes.last()
+    status[rows, cols] = STATUS_CODES[AttendanceStatus.WORK]
+    calendars.clock_in[rows, cols] = [value[0] for value in values]
+    calendars.clock_out[rows, cols] = [value[1] for value in values]
+
+    for rows, cols, codes in (leaves.last(), user_closed.last()):
+        status[rows, cols] = codes
+
+    status[branch_closed[user_branch_rows]] = STATUS_CODES[AttendanceStatus.CLOSED]
+    status[fixed_closed[user_branch_rows]] = STATUS_CODES[AttendanceStatus.FIXED_CLOSED]
+    status[day_index[None, :] < hire_offsets[:, None]] = STATUS_CODES[AttendanceStatus.NOT_HIRE]
+    status[day_index[None, :] > resignation_offsets[:, None]] = STATUS_CODES[AttendanceStatus.RESIGNATION]
+
+    rows, cols, codes = time_offs.last()
+    status[rows, cols] = codes
+
+    # 출근 상태가 아닌 날은 출퇴근 시간 제거
+    not_work = status != STATUS_CODES[AttendanceStatus.WORK]
+    calendars.clock_in[not_work] = NO_TIME
+    calendars.clock_out[not_work] = NO_TIME
+    return calendars
+
+
+class _Sparse:
+    """(행, 일자, 값) 목록. 같은 칸에 여러 값이 있으면 마지막 값을 사용"""
+
+    __slots__ = ("rows", "cols", "values")
+
+    def __init__(self):
+        self.rows: List[int] = []
+        self.cols: List[int] = []
+        self.values: list = []
+
+    def add(self, row: int, col: int, value) -> None:
+        self.rows.append(row)
+        self.cols.append(col)
+        self.values.append(value)
+
+    def last(self) -> Tuple[np.ndarray, np.ndarray, list]:
+        # fancy index 대입은 중복 인덱스의 적용 순서를 보장하지 않으므로 마지막 값만 남김
+        unique = {}
+        for position, key in enumerate(zip(self.rows, self.cols)):
+            unique[key] = position
+        positions = list(unique.values())
+        rows = np.array([self.rows[p] for p in positions], dtype=np.intp)
+        cols = np.array([self.cols[p] for p in positions], dtype=np.intp)
+        return rows, cols, [self.values[p] for p in positions]
+
+
+def _time_to_seconds(value: Optional[datetime]) -> int:
+    if value is None:
+        return NO_TIME
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _seconds_to_time(seconds: int) -> Optional[time]:
+    if seconds == NO_TIME:
+        return None
+    return time(seconds // 3600, seconds // 60 % 60, seconds % 60)
@@ -1,9 +1,9 @@
 from calendar import monthcalendar
-from datetime import datetime, timedelta
+from datetime import timedelta
 from datetime import date as dt
 from typing import Dict, List, Optional, Tuple
 from fastapi import Depends
-from sqlalchemy import and_, extract, func, or_, select
+from sqlalchemy import and_, func, or_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import joinedload
 
@@ -17,22 +17,23 @@ from app.models.users.time_off_model import TimeOff
 from app.models.users.users_model import Users
 from app.models.commutes.commutes_model import Commutes
 from app.models.closed_days.closed_days_model import ClosedDays
-from app.models.branches.work_policies_model import WorkPolicies
+from app.models.branches.work_policies_model import BranchWorkSchedule, WorkPolicies
 from app.models.users.users_work_contract_model import FixedRestDay
+from app.service.commute_calendar_engine import CalendarUser, CommuteMonthData, build_month_calendars
+from app.utils.datetime_utils import DatetimeUtil
 
 
 class CommutesManagerService:
     def __init__(self, session: AsyncSession = Depends(get_db)):
         self.session = session
     
-    # 휴직 기간 조회
+    # 휴직 기간 조회 (해당 월과 겹치는 휴직의 시작일/종료일)
     async def get_time_off_periods(self, user_id: int, year: int, month: int) -> Dict[str, CommuteRecord]:
         query = select(TimeOff).where(
             and_(
                 TimeOff.user_id == user_id,
                 TimeOff.deleted_yn == "N",
-                extract('year', TimeOff.start_date) == year,
-                extract('month', TimeOff.start_date) == month
+                DatetimeUtil.overlaps_month(TimeOff.start_date, TimeOff.end_date, year, month)
             )
         )
         
@@ -82,8 +83,7 @@ class CommutesManagerService:
             and_(
                 ClosedDays.branch_id == branch_id,
                 ClosedDays.user_id.is_(None),
-                extract('year', ClosedDays.closed_day_date) == year,
-                extract('month', ClosedDays.closed_day_date) == month,
+                DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
                 ClosedDays.deleted_yn == "N"
             )
         ).order_by(ClosedDays.closed_day_date)  # 날짜순 정렬 추가
@@ -97,8 +97,7 @@ class CommutesManagerService:
             and_(
                 ClosedDays.branch_id == branch_id,
                 ClosedDays.user_id == user_id,
-                extract('year', ClosedDays.closed_day_date) == year,
-                extract('month', ClosedDays.closed_day_date) == month,
+                DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
                 ClosedDays.deleted_yn == "N"
             )
         ).order_by(ClosedDays.closed_day_date)  # 날짜순 정렬 추가
@@ -122,8 +121,7 @@ class CommutesManagerService:
                 and_(
                     LeaveHistories.user_id == user_id,
                     LeaveHistories.status == "approved",
-                    extract('year', LeaveHistories.application_date) == year,
-                    extract('month', LeaveHistories.application_date) == month,
+                    DatetimeUtil.in_month(LeaveHistories.application_date, year, month),
                     LeaveHistories.deleted_yn == "N"
                 )
             )
@@ -155,135 +153,108 @@ class CommutesManagerService:
     
     
     async def get_commute_records(self, user_id: int, branch_id: int, year: int, month: int) -> Dict[str, CommuteRecord]:
-        # # 직원 고정 휴무일 조회
-        # user_fixed_rest_days = await self.get_user_fixed_rest_days(user_id, year, month)
-        # user_fixed_rest_records = {
-        #     d.strftime("%Y-%m-%d"): CommuteRecord(status=AttendanceStatus.FIXED_OFF)
-        #     for d in user_fixed_rest_days
-        # }
-        
         # 사용자 정보 조회
         user = await self.session.execute(
-            select(Users).where(Users.id == user_id)
+            select(Users.hire_date, Users.resignation_date).where(Users.id == user_id)
         )
-        user = user.scalar_one()
-        
-        not_hire_records = {}
-        
-        # 미입사 상태 처리
-        if user.hire_date:
-            current_month_start = dt(year, month, 1)
-            current_date = current_month_start
-            
-            while current_date < user.hire_date and current_date.month == month:
-                date_str = current_date.strftime("%Y-%m-%d")
-                not_hire_records[date_str] = CommuteRecord(
-                    clock_in=None,
-                    clock_out=None,
-                    status=AttendanceStatus.NOT_HIRE
+        hire_date, resignation_date = user.one()
+
+        month_data = await self.get_month_data([user_id], [branch_id], year, month)
+        calendars = build_month_calendars(year, month, [CalendarUser(user_id, branch_id, hire_date, resignation_date)], month_data)
+        return calendars.records(user_id)
+
+    async def get_month_data(self, user_ids: List[int], branch_ids: List[int], year: int, month: int) -> CommuteMonthData:
+        """
+        여러 사용자의 월간 근태 데이터를 데이터셋별로 한 번씩 조회 (IN 조건)
+        휴직, 근무 정책(고정 휴점 요일), 지점 휴점일, 개인 휴무일, 승인된 휴가, 출퇴근 기록
+        """
+        month_data = CommuteMonthData()
+        if not user_ids:
+            return month_data
+
+        # 휴직 기간 (해당 월과 겹치는 기간. 이전 달에 시작한 휴직의 종료일도 표시)
+        result = await self.session.execute(
+            select(TimeOff.user_id, TimeOff.start_date, TimeOff.end_date).where(
+                and_(
+                    TimeOff.user_id.in_(user_ids),
+                    TimeOff.deleted_yn == "N",
+                    DatetimeUtil.overlaps_month(TimeOff.start_date, TimeOff.end_date, year, month)
                 )
-                current_date += timedelta(days=1)
-        
-        
-        resignation_records = {}  # 퇴사 상태를 저장할 딕셔너리 초기화
-        
-        # 퇴사일 처리
-        if user.resignation_date:
-            current_month_start = dt(year, month, 1)
-            next_month_start = dt(year, month + 1, 1) if month < 12 else dt(year + 1, 1, 1)
-            
-            # 퇴사일이 현재 조회 월과 관련있는 경우
-            if current_month_start <= user.resignation_date < next_month_start:
-                resignation_next_day = user.resignation_date + timedelta(days=1)
-                current_date = resignation_next_day
-                
-                # 퇴사 다음날부터 월말까지 퇴사 상태로 설정
-                while current_date < next_month_start:
-                    date_str = current_date.strftime("%Y-%m-%d")
-                    resignation_records[date_str] = CommuteRecord(
-                        clock_in=None,
-                        clock_out=None,
-                        status=AttendanceStatus.RESIGNATION
-                    )
-                    current_date += timedelta(days=1)
-        
-        # 휴직 기간 처리
-        time_off_records = await self.get_time_off_periods(user_id, year, month)
-        for record_date, status in time_off_records.items():
-            resignation_records[record_date] = CommuteRecord(
-                clock_in=None,
-                clock_out=None,
-                status=AttendanceStatus.TIME_OFF_START if status == "휴직 시작" else AttendanceStatus.TIME_OFF_END
-        )
-        
-        
-        # 고정 휴점일 조회
-        fixed_closed_days = await self.get_fixed_closed_days(branch_id, year, month)
-        fixed_closed_records = {
-            d.strftime("%Y-%m-%d"): CommuteRecord(status=AttendanceStatus.FIXED_CLOSED)
-            for d in fixed_closed_days
-        }
-        
-        # 지점 휴점일 조회
-        branch_closed_days = await self.get_branch_closed_days(branch_id, year, month)
-        branch_closed_records = {
-            d.strftime("%Y-%m-%d"): CommuteRecord(status=AttendanceStatus.CLOSED)
-            for d in branch_closed_days
-        }
-        
-        # 개인 휴무일 조회
-        user_closed_days = await self.get_user_closed_days(user_id, branch_id, year, month)
-        user_closed_records = {
-            d.strftime("%Y-%m-%d"): CommuteRecord(status=AttendanceStatus.OFF)
-            for d in user_closed_days
-            if d.strftime("%Y-%m-%d") not in fixed_closed_records  # 고정 휴점일과 겹치지 않는 경우
-            and d.strftime("%Y-%m-%d") not in branch_closed_records  # 지점 휴점일과 겹치지 않는 경우
-        }
-        
-        # 승인된 휴가 기록 조회
-        leave_records = await self.get_approved_leaves(user_id, year, month)
-        leave_records_formatted = {
-            record_date: CommuteRecord(status=status)
-            for record_date, status in leave_records.items()
-        }
-        
-        # 출퇴근 기록 조회 (기존 코드와 동일)
-        commutes_query = select(Commutes).where(
-            and_(
-                Commutes.user_id == user_id,
-                Commutes.clock_in >= datetime(year, month, 1),
-                Commutes.clock_in < datetime(year, month + 1, 1) if month < 12 else datetime(year + 1, 1, 1),
-                Commutes.deleted_yn == "N"
             )
         )
-        commutes_result = await self.session.execute(commutes_query)
-        commute_records = {
-            commute.clock_in.strftime("%Y-%m-%d"): CommuteRecord(
-                clock_in=commute.clock_in.time(),
-                clock_out=commute.clock_out.time() if commute.clock_out else None,
-                status=AttendanceStatus.WORK
+        for user_id, start_date, end_date in result:
+            month_data.time_offs[user_id].append((start_date, end_date))
+
+        # 지점 근무 정책 (주 근무일수, 휴점 요일)
+        result = await self.session.execute(
+            select(WorkPolicies.branch_id, WorkPolicies.weekly_work_days, BranchWorkSchedule.day_of_week, BranchWorkSchedule.is_holiday)
+            .outerjoin(BranchWorkSchedule, WorkPolicies.id == BranchWorkSchedule.work_policy_id)
+            .where(WorkPolicies.branch_id.in_(branch_ids))
+        )
+        for branch_id, weekly_work_days, day_of_week, is_holiday in result:
+            month_data.weekly_work_days[branch_id] = weekly_work_days
+            holiday_weekdays = month_data.holiday_weekdays.setdefault(branch_id, [])
+            if is_holiday:
+                holiday_weekdays.append(Weekday[day_of_week.name])
+
+        # 지점 휴점일
+        result = await self.session.execute(
+            select(ClosedDays.branch_id, ClosedDays.closed_day_date).where(
+                and_(
+                    ClosedDays.branch_id.in_(branch_ids),
+                    ClosedDays.user_id.is_(None),
+                    DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
+                    ClosedDays.deleted_yn == "N"
+                )
+            ).order_by(ClosedDays.closed_day_date)
+        )
+        for branch_id, closed_day_date in result:
+            month_data.branch_closed_days[branch_id].append(closed_day_date)
+
+        # 개인 휴무일
+        result = await self.session.execute(
+            select(ClosedDays.user_id, ClosedDays.branch_id, ClosedDays.closed_day_date).where(
+                and_(
+                    ClosedDays.branch_id.in_(branch_ids),
+                    ClosedDays.user_id.in_(user_ids),
+                    DatetimeUtil.in_month(ClosedDays.closed_day_date, year, month),
+                    ClosedDays.deleted_yn == "N"
+                )
+            ).order_by(ClosedDays.closed_day_date)
+        )
+        for user_id, branch_id, closed_day_date in result:
+            month_data.user_closed_days[(user_id, branch_id)].append(closed_day_date)
+
+        # 승인된 휴가
+        result = await self.session.execute(
+            select(LeaveHistories.user_id, LeaveHistories.application_date, LeaveCategory.name)
+            .join(LeaveCategory, LeaveHistories.leave_category_id == LeaveCategory.id)
+            .where(
+                and_(
+                    LeaveHistories.user_id.in_(user_ids),
+                    LeaveHistories.status == "approved",
+                    DatetimeUtil.in_month(LeaveHistories.application_date, year, month),
+                    LeaveHistories.deleted_yn == "N"
+                )
             )
-            for commute in commutes_result.scalars().all()
-            if commute.clock_in.strftime("%Y-%m-%d") not in fixed_closed_records  # 고정 휴점일과 겹치지 않는 경우
-            and commute.clock_in.strftime("%Y-%m-%d") not in branch_closed_records  # 지점 휴점일과 겹치지 않는 경우
-            and commute.clock_in.strftime("%Y-%m-%d") not in user_closed_records  # 개인 휴무일과 겹치지 않는 경우
-        }
-        
-        
-        # 모든 기록 병합 (우선순위: 고정 휴점일 > 지점 휴점일 > 직원 고정 휴무일 > 개인 휴무일 > 출퇴근 기록)
-        records = {
-            **commute_records, # 최하위 우선순위
-            **leave_records_formatted,
-            **user_closed_records,
-            **branch_closed_records,
-            **fixed_closed_records,
-            **time_off_records, 
-            **not_hire_records,
-            **resignation_records, # 최우선 순위
-            # **user_fixed_rest_records,
-        }
-        sorted_records = dict(sorted(records.items(), key=lambda x: datetime.strptime(x[0], "%Y-%m-%d")))
-        return sorted_records
+        )
+        for user_id, application_date, category_name in result:
+            month_data.leaves[user_id].append((application_date, category_name))
+
+        # 출퇴근 기록
+        result = await self.session.execute(
+            select(Commutes.user_id, Commutes.clock_in, Commutes.clock_out).where(
+                and_(
+                    Commutes.user_id.in_(user_ids),
+                    DatetimeUtil.in_month(Commutes.clock_in, year, month),
+                    Commutes.deleted_yn == "N"
+                )
+            ).order_by(Commutes.user_id, Commutes.id)
+        )
+        for user_id, clock_in, clock_out in result:
+            month_data.commutes[user_id].append((clock_in, clock_out))
+
+        return month_data
 
     async def get_user_commutes(
         self,
@@ -297,11 +268,20 @@ class CommutesManagerService:
         size: int,
     ) -> Tuple[List[dict], dict]:
         
-        target_date = dt(year, month, 1)
-        last_date = dt(year, month + 1, 1) if month < 12 else dt(year + 1, 1, 1)
+        target_date, last_date = DatetimeUtil.month_range(year, month)
         
         query = (
-            select(Users, Branches, Parts)
+            select(
+                Users.id,
+                Users.name,
+                Users.gender,
+                Users.hire_date,
+                Users.resignation_date,
+                Branches.id.label("branch_id"),
+                Branches.name.label("branch_name"),
+                Parts.id.label("part_id"),
+                Parts.name.label("part_name"),
+            )
             .join(Branches, Users.branch_id == Branches.id)
             .join(Parts, Users.part_id == Parts.id)
             .where(
@@ -327,29 +307,36 @@ class CommutesManagerService:
 
         total = await self.session.scalar(select(func.count()).select_from(query.subquery()))
         result = await self.session.execute(query.offset((page - 1) * size).limit(size))
-        
+        users = result.all()
+
+        # 페이지 사용자 전체의 월간 데이터를 한 번에 조회한 뒤 배열로 달력 구성
+        month_data = await self.get_month_data(
+            user_ids=[user.id for user in users],
+            branch_ids=list({user.branch_id for user in users}),
+            year=year,
+            month=month
+        )
+
+        calendars = build_month_calendars(
+            year,
+            month,
+            [CalendarUser(user.id, user.branch_id, user.hire_date, user.resignation_date) for user in users],
+            month_data
+        )
+
         users_data = []
-        for user, branch, part in result:
-            work_policy = await self.get_work_policy(branch.id)
-            weekly_work_days = work_policy.weekly_work_days if work_policy else 5
-            
-            commute_records = await self.get_commute_records(
-                user_id=user.id,
-                branch_id=branch.id,
-                year=year,
-                month=month
-            )
-            
+        for user in users:
             users_data.append({
                 "user_id": user.id,
                 "user_name": user.name,
                 "gender": user.gender,
-                "branch_id": branch.id,
-                "branch_name": branch.name,
-                "part_id": part.id,
-                "part_name": part.name,
-                "weekly_work_days": weekly_work_days,
-                "commute_records": commute_records
+                "branch_id": user.branch_id,
+                "branch_name": user.branch_name,
+                "part_id": user.part_id,
+                "part_name": user.part_name,
+                "weekly_work_days": month_data.weekly_work_days.get(user.branch_id, 5),
+                "commute_records": calendars.records(user.id)
             })
 
-        return users_data, {"total": total, "page": page, "size": size}
\ No newline at end of file
+        return users_data, {"total": total, "page": page, "size": size}
+
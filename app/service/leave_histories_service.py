@@ -3,22 +3,26 @@ from decimal import Decimal
 from typing import Optional
 from fastapi import HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from app.enums.users import Status
+from app.enums.users import LeaveLedgerType, Status
 from app.models.branches.user_leaves_days import UserLeaveInfo
 from app.cruds.leave_histories.leave_histories_crud import (
     create_leave_history_record,
     create_user_leaves_days_record,
+    decrease_user_leaves_days,
+    decrease_users_total_leave_days,
     delete_leave_history,
     fetch_approved_leave_data,
     fetch_leave_histories,
     fetch_user_details,
+    find_leave_histories_for_update,
+    find_user_leaves_days_for_update,
     get_leave_history_by_id,
     get_leave_history_by_id_and_branch,
-    get_leave_info,
     get_user_by_id,
     get_user_info,
     get_user_leaves_days_record,
     update_leave_history,
+    update_leave_histories_status,
     update_leave_history_status,
     update_user_leaves_days,
     update_user_total_leave_days,
@@ -26,11 +30,15 @@ from app.cruds.leave_histories.leave_histories_crud import (
 from datetime import date, datetime, timedelta
 from app.models.users.leave_histories_model import (
     LeaveHistoriesApprove,
+    LeaveHistoriesBulkApprove,
     LeaveHistoriesCreate,
     LeaveHistoriesSearchDto,
     LeaveHistoriesUpdate,
 )
 from app.models.users.users_model import Users
+from app.service.attendance_summary_service import months_between, refresh_attendance_summaries
+from app.service.closed_day_calendar_cache import closed_day_calendar_cache
+from app.service.leave_ledger_service import get_leave_balance, leave_status_entry, record_leave_ledger
 
 
 
@@ -42,12 +50,11 @@ async def get_user_leaves_service(
 ) -> UserLeaveInfo:
     """현재 사용자의 연차 정보를 조회합니다."""
     year = year or date.today().year
-    
-    # 순차적으로 데이터 조회
-    user = await get_user_info(current_user_id, db)
-    leave_info = await get_leave_info(branch_id, year, current_user_id, db)
-    
-    if not leave_info:
+
+    balance = await get_leave_balance(db, current_user_id, year)
+
+    if not balance:
+        user = await get_user_info(current_user_id, db)
         return UserLeaveInfo(
             user_id=current_user_id,
             branch_id=branch_id,
@@ -57,17 +64,14 @@ async def get_user_leaves_service(
             total_leave_days=user.total_leave_days,
             message=f"{year}년도의 연차 정보가 없습니다."
         )
-    
-    increased_days = float(leave_info.increased_days or 0.0)
-    decreased_days = float(leave_info.decreased_days or 0.0)
-    
+
     return UserLeaveInfo(
         user_id=current_user_id,
         branch_id=branch_id,
         year=year,
-        increased_days=increased_days,
-        decreased_days=decreased_days,
-        total_leave_days=increased_days - decreased_days
+        increased_days=float(balance.granted_days),
+        decreased_days=float(balance.used_days),
+        total_leave_days=float(balance.remaining_days)
     )
 
 
@@ -82,10 +86,13 @@ async def get_leave_histories_service(
     search_phone: Optional[str],
     page: int,
     size: int,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ):
     """
     연차 신청 목록을 조회합니다.
     현재 로그인 한 회원의 권한이 사원 이상의 권한인 경우 조회할 수 있습니다.
+    cursor(이전 응답의 next_cursor)를 전달하면 page 대신 커서 이후부터 조회합니다.
     """
     if current_user.role not in [
         "MSO 최고권한",
@@ -107,7 +114,7 @@ async def get_leave_histories_service(
         date_start_day = date_obj - timedelta(days=current_weekday)
         date_end_day = date_start_day + timedelta(days=6)
 
-    leave_histories, total_count = await fetch_leave_histories(
+    leave_histories, total_count, next_cursor = await fetch_leave_histories(
         current_user,
         db,
         search,
@@ -119,24 +126,28 @@ async def get_leave_histories_service(
         search_phone,
         page,
         size,
+        cursor,
+        include_total,
     )
 
+    user_details, leave_category_names = await fetch_user_details(db, leave_histories)
+
     formatted_data = []
     for leave_history in leave_histories:
-        user, branch, part, leave_category = await fetch_user_details(db, leave_history)
+        user = user_details[leave_history.user_id]
         leave_history_data = {
             "id": leave_history.id,
-            "search_branch_id": branch.id,
-            "branch_name": branch.name,
-            "user_id": user.id,
-            "user_name": user.name,
-            "part_id": part.id,
-            "part_name": part.name,
+            "search_branch_id": user.branch_id,
+            "branch_name": user.branch_name,
+            "user_id": user.user_id,
+            "user_name": user.user_name,
+            "part_id": user.part_id,
+            "part_name": user.part_name,
             "application_date": leave_history.application_date,
             "start_date": leave_history.start_date,
             "end_date": leave_history.end_date,
             "leave_category_id": leave_history.leave_category_id,
-            "leave_category_name": leave_category.name,
+            "leave_category_name": leave_category_names[leave_history.leave_category_id],
             "decreased_days": (
                 float(leave_history.decreased_days)
                 if leave_history.decreased_days is not None
@@ -157,7 +168,8 @@ async def get_leave_histories_service(
             "total": total_count,
             "page": page,
             "size": size,
-            "total_pages": (total_count + size - 1) // size,
+            "total_pages": (total_count + size - 1) // size if total_count is not None else None,
+            "next_cursor": next_cursor,
         },
         "message": "연차 신청 목록을 정상적으로 조회하였습니다.",
     }
@@ -212,15 +224,12 @@ async def get_approve_leave_service(
         part_id,
         search_name,
         search_phone,
+        page,
+        size,
     )
 
-    # 페이지네이션 적용
-    start_idx = (page - 1) * size
-    end_idx = start_idx + size
-    paginated_data = formatted_data[start_idx:end_idx]
-
     return {
-        "list": paginated_data,
+        "list": formatted_data,
         "pagination": {
             "total": total_count,
             "page": page,
@@ -257,9 +266,12 @@ async def create_leave_history_service(
     if current_user.role not in ["MSO 최고권한", "최고관리자", "통합관리자", "사원"]:
         raise HTTPException(status_code=403, detail="권한이 없습니다.")
 
-    leave_history_id = await create_leave_history_record(
+    leave_history = await create_leave_history_record(
         leave_create, branch_id, decreased_days, start_date, end_date, current_user, db
     )
+    await record_leave_ledger(db, [
+        leave_status_entry(leave_history, None, Status.PENDING, LeaveLedgerType.REQUEST)
+    ])
 
     user_leaves_days_record = await get_user_leaves_days_record(current_user_id, db)
 
@@ -272,7 +284,7 @@ async def create_leave_history_service(
 
     return {
         "message": "연차 생성에 성공하였습니다.",
-        "leave_history_id": leave_history_id,
+        "leave_history_id": leave_history.id,
     }
 
 
@@ -294,15 +306,18 @@ async def approve_leave_service(
     if not leave_history:
         raise HTTPException(status_code=404, detail="해당 연차를 찾을 수 없습니다.")
 
-    now = datetime.now().date()
+    before_status = leave_history.status
+    decreased_days = Decimal(str(leave_history.decreased_days))
     if leave_approve.status == Status.APPROVED:
+        if before_status == Status.APPROVED:
+            raise HTTPException(status_code=400, detail="이미 승인된 연차입니다.")
+
         leave_days_record = await get_user_leaves_days_record(leave_history.user_id, db)
         if not leave_days_record:
             raise HTTPException(
                 status_code=404, detail="사용자의 연차 정보를 찾을 수 없습니다."
             )
 
-        decreased_days = Decimal(str(leave_history.decreased_days))
         if leave_days_record.total_leave_days < decreased_days:
             raise HTTPException(
                 status_code=400,
@@ -315,11 +330,16 @@ async def approve_leave_service(
         await update_leave_history_status(
             leave_history, leave_approve, current_user, Status.APPROVED, db
         )
+        await record_leave_ledger(db, [
+            leave_status_entry(leave_history, before_status, Status.APPROVED, LeaveLedgerType.APPROVE)
+        ])
         message = "연차 승인에 성공하였습니다."
 
     elif leave_approve.status == Status.REJECTED:
-        if leave_history.status == Status.APPROVED:
-            await update_user_leaves_days(leave_days_record, -decreased_days, db)
+        if before_status == Status.APPROVED:
+            leave_days_record = await get_user_leaves_days_record(leave_history.user_id, db)
+            if leave_days_record:
+                await update_user_leaves_days(leave_days_record, -decreased_days, db)
             await update_user_total_leave_days(
                 leave_history.user_id, -decreased_days, db
             )
@@ -327,14 +347,128 @@ async def approve_leave_service(
         await update_leave_history_status(
             leave_history, leave_approve, current_user, Status.REJECTED, db
         )
+        await record_leave_ledger(db, [
+            leave_status_entry(leave_history, before_status, Status.REJECTED, LeaveLedgerType.REJECT)
+        ])
         message = "연차 반려에 성공하였습니다."
 
     await db.flush()
     await db.commit()
+    await refresh_attendance_summaries(
+        db,
+        months_between(leave_history.start_date, leave_history.end_date or leave_history.start_date),
+        user_ids=[leave_history.user_id]
+    )
+    # 승인된 연차는 휴무 캘린더에 표시되므로 해당 지점의 캐시 무효화
+    closed_day_calendar_cache.invalidate(leave_history.branch_id, branch_id)
 
     return {"message": message}
 
 
+async def bulk_approve_leaves_service(
+    leave_bulk_approve: LeaveHistoriesBulkApprove,
+    branch_id: int,
+    current_user_id: int,
+    db: AsyncSession,
+):
+    """
+    연차를 일괄 승인/반려합니다.
+    건별 검사는 단건 승인/반려와 같으며, 실패한 건은 건너뛰고 건별 결과를 반환합니다.
+    대상 연차와 사용자들의 연차 일수 행을 한 번에 잠그고, 연차 일수 차감/복원은 테이블당 한 번의 UPDATE로 반영합니다.
+    """
+    current_user = await get_user_by_id(current_user_id, db)
+    status = leave_bulk_approve.status
+    leave_ids = list(dict.fromkeys(leave_bulk_approve.leave_ids))
+
+    leave_histories = await find_leave_histories_for_update(db, leave_ids, branch_id)
+    leave_days_records = await find_user_leaves_days_for_update(
+        db, {leave_history.user_id for leave_history in leave_histories.values()}
+    )
+    # 같은 사용자의 여러 건을 승인하면 앞선 건을 차감한 잔여로 검사
+    remaining_days = {
+        user_id: Decimal(str(record.total_leave_days or 0)) for user_id, record in leave_days_records.items()
+    }
+
+    results, processed_ids, ledger_entries = [], [], []
+    leaves_days_deltas: dict[int, Decimal] = {}
+    users_deltas: dict[int, Decimal] = {}
+
+    def fail(leave_id: int, message: str):
+        results.append({"leave_id": leave_id, "success": False, "message": message})
+
+    for leave_id in leave_ids:
+        leave_history = leave_histories.get(leave_id)
+        if not leave_history:
+            fail(leave_id, "해당 연차를 찾을 수 없습니다.")
+            continue
+
+        user_id = leave_history.user_id
+        before_status = leave_history.status
+        decreased_days = Decimal(str(leave_history.decreased_days))
+        leave_days_record = leave_days_records.get(user_id)
+
+        if status == Status.APPROVED:
+            if before_status == Status.APPROVED:
+                fail(leave_id, "이미 승인된 연차입니다.")
+                continue
+            if not leave_days_record:
+                fail(leave_id, "사용자의 연차 정보를 찾을 수 없습니다.")
+                continue
+            if remaining_days[user_id] < decreased_days:
+                fail(
+                    leave_id,
+                    f"승인 불가: 신청 일수({decreased_days}일)가 남은 연차 일수({remaining_days[user_id]}일)보다 많습니다.",
+                )
+                continue
+            delta = decreased_days
+            entry_type = LeaveLedgerType.APPROVE
+            message = "연차 승인에 성공하였습니다."
+        else:
+            # 승인되었던 연차를 반려하면 연차 일수 복원
+            delta = -decreased_days if before_status == Status.APPROVED else Decimal("0")
+            entry_type = LeaveLedgerType.REJECT
+            message = "연차 반려에 성공하였습니다."
+
+        if delta:
+            if leave_days_record:
+                remaining_days[user_id] -= delta
+                leaves_days_deltas[leave_days_record.id] = leaves_days_deltas.get(leave_days_record.id, 0) + delta
+            users_deltas[user_id] = users_deltas.get(user_id, 0) + delta
+
+        processed_ids.append(leave_id)
+        ledger_entries.append(leave_status_entry(leave_history, before_status, status, entry_type))
+        results.append({"leave_id": leave_id, "success": True, "message": message})
+
+    if processed_ids:
+        await update_leave_histories_status(
+            db, processed_ids, status, leave_bulk_approve.admin_description, current_user
+        )
+        await decrease_user_leaves_days(db, leaves_days_deltas)
+        await decrease_users_total_leave_days(db, users_deltas)
+        await record_leave_ledger(db, ledger_entries)
+    await db.commit()
+    if processed_ids:
+        processed = [leave_histories[leave_id] for leave_id in processed_ids]
+        await refresh_attendance_summaries(
+            db,
+            {
+                month
+                for leave_history in processed
+                for month in months_between(leave_history.start_date, leave_history.end_date or leave_history.start_date)
+            },
+            user_ids={leave_history.user_id for leave_history in processed}
+        )
+        closed_day_calendar_cache.invalidate(branch_id)
+
+    action = "승인" if status == Status.APPROVED else "반려"
+    return {
+        "message": f"연차 {len(processed_ids)}건이 {action}되었습니다.",
+        "succeeded": len(processed_ids),
+        "failed": len(leave_ids) - len(processed_ids),
+        "results": results,
+    }
+
+
 async def update_leave_service(
     leave_update: LeaveHistoriesUpdate,
     branch_id: int,
@@ -398,26 +532,30 @@ async def delete_leave_service(
         raise HTTPException(
             status_code=403, detail="다른 지점의 정보에 접근할 수 없습니다."
         )
-    if current_user.id != leave_history.user_id:
-        raise HTTPException(status_code=403, detail="본인이 신청한 연차 이외의 연차는 삭제할 수 없습니다.")
 
     leave_history = await get_leave_history_by_id_and_branch(leave_id, branch_id, db)
     if not leave_history:
         raise HTTPException(status_code=404, detail="해당 연차를 찾을 수 없습니다.")
 
+    if current_user.id != leave_history.user_id:
+        raise HTTPException(status_code=403, detail="본인이 신청한 연차 이외의 연차는 삭제할 수 없습니다.")
+
     if (
-        leave_history.request_user_id != current_user.id
+        leave_history.user_id != current_user.id
         and current_user.role.strip()
         not in ["MSO 최고권한", "최고관리자", "통합관리자"]
     ):
         raise HTTPException(status_code=403, detail="연차를 삭제할 권한이 없습니다.")
 
-    if leave_history.status.strip() != "확인중":
+    if leave_history.status != Status.PENDING:
         raise HTTPException(
             status_code=400, detail="승인/반려된 연차는 삭제할 수 없습니다."
         )
 
     await delete_leave_history(leave_history, db)
+    await record_leave_ledger(db, [
+        leave_status_entry(leave_history, Status.PENDING, None, LeaveLedgerType.CANCEL)
+    ])
     await db.commit()
 
     return {"message": "연차 삭제에 성공하였습니다."}
@@ -0,0 +1,232 @@
+"""
+연차 원장 (leave_ledger)과 사용자별 연도별 잔여 (user_leave_balances)
+
+    python -m app.service.leave_ledger_service --year 2024          # 해당 연도 원장/잔여 대조
+    python -m app.service.leave_ledger_service                      # 전체 대조
+    python -m app.service.leave_ledger_service --year 2024 --fix    # 불일치 잔여를 원장 합계로 복구
+
+연차 신청/승인/반려/삭제와 연차 부여는 record_leave_ledger로 원장 기록과 잔여 증감을
+호출하는 쪽의 같은 트랜잭션에서 반영합니다.
+원장의 연도는 기록하는 날의 연도이며, (사용자, 연도)의 첫 기록 때 이월 잔여를 기초(opening)로 함께 기록하므로
+올해 잔여(부여 - 사용)는 Users.total_leave_days와 같습니다.
+"""
+import argparse
+import asyncio
+from datetime import date
+from decimal import Decimal
+from typing import Iterable, Optional
+
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import set_committed_value
+
+from app.cruds.users import users_crud
+from app.enums.users import LeaveLedgerType, Status
+from app.models.users.leave_histories_model import LeaveHistories
+from app.models.users.leave_ledger_model import LeaveLedger, UserLeaveBalance
+from app.models.users.users_model import Users
+
+BALANCE_COLUMNS = ("granted_days", "used_days", "pending_days")
+
+
+def ledger_entry(
+    user_id: int,
+    year: int,
+    entry_type: LeaveLedgerType,
+    granted_days=0,
+    used_days=0,
+    pending_days=0,
+    leave_history_id: Optional[int] = None,
+    memo: Optional[str] = None
+) -> dict:
+    """원장 1건"""
+    return {
+        "user_id": user_id,
+        "year": year,
+        "entry_type": entry_type.value,
+        "leave_history_id": leave_history_id,
+        "granted_days": Decimal(str(granted_days)),
+        "used_days": Decimal(str(used_days)),
+        "pending_days": Decimal(str(pending_days)),
+        "memo": memo,
+    }
+
+
+def leave_status_entry(
+    leave_history: LeaveHistories,
+    before_status: Optional[str],
+    after_status: Optional[str],
+    entry_type: LeaveLedgerType
+) -> dict:
+    """
+    연차 신청의 상태 변경에 따른 원장 1건 (연도는 부여와 같이 기록하는 날 기준)
+    신청 전/삭제 후는 None이며, 대기 중이면 pending_days, 승인이면 used_days에 신청 일수가 포함됩니다.
+    """
+    days = Decimal(str(leave_history.decreased_days or 0))
+
+    def effect(status):
+        return (
+            days if status == Status.APPROVED else 0,
+            days if status == Status.PENDING else 0,
+        )
+
+    used_before, pending_before = effect(before_status)
+    used_after, pending_after = effect(after_status)
+    return ledger_entry(
+        leave_history.user_id,
+        date.today().year,
+        entry_type,
+        used_days=used_after - used_before,
+        pending_days=pending_after - pending_before,
+        leave_history_id=leave_history.id,
+    )
+
+
+def sum_entries(entries: Iterable[dict]) -> dict[tuple[int, int], dict]:
+    """(user_id, year)별 원장 증감 합계"""
+    deltas: dict[tuple[int, int], dict] = {}
+    for entry in entries:
+        key = (entry["user_id"], entry["year"])
+        delta = deltas.setdefault(key, {"user_id": key[0], "year": key[1], **dict.fromkeys(BALANCE_COLUMNS, 0)})
+        for column in BALANCE_COLUMNS:
+            delta[column] += entry[column]
+    return deltas
+
+
+async def opening_entries(db: AsyncSession, deltas: dict[tuple[int, int], dict]) -> list[dict]:
+    """
+    잔여 행이 아직 없는 (사용자, 연도)의 기초 원장 (이월 잔여)
+    - granted_days: 이번 기록 전의 Users.total_leave_days (호출하는 쪽이 이미 변경했으므로 이번 증감을 되돌린 값)
+    - pending_days: 직전 연도 잔여 행의 승인 대기 일수 (대기 중인 신청이 해가 바뀐 뒤 승인/삭제되는 경우)
+    같은 사용자의 잔여 행을 잠금 조회(FOR UPDATE)하여 동시에 기초가 두 번 기록되지 않게 합니다.
+    """
+    user_ids = {user_id for user_id, _ in deltas}
+    balances = (await db.execute(
+        select(UserLeaveBalance.user_id, UserLeaveBalance.year, UserLeaveBalance.pending_days)
+        .where(UserLeaveBalance.user_id.in_(user_ids), UserLeaveBalance.year <= max(year for _, year in deltas))
+        .order_by(UserLeaveBalance.user_id, UserLeaveBalance.year)
+        .with_for_update()
+    )).all()
+    existing = {(row.user_id, row.year) for row in balances}
+    missing = [key for key in deltas if key not in existing]
+    if not missing:
+        return []
+
+    totals = dict((await db.execute(
+        select(Users.id, Users.total_leave_days).where(Users.id.in_({user_id for user_id, _ in missing}))
+    )).all())
+    entries = []
+    for user_id, year in missing:
+        delta = deltas[(user_id, year)]
+        carried_pending = next(
+            (row.pending_days for row in reversed(balances) if row.user_id == user_id and row.year < year), 0
+        )
+        entries.append(ledger_entry(
+            user_id,
+            year,
+            LeaveLedgerType.OPENING,
+            granted_days=Decimal(str(totals.get(user_id) or 0)) - delta["granted_days"] + delta["used_days"],
+            pending_days=carried_pending,
+            memo="이월 잔여",
+        ))
+    return entries
+
+
+async def record_leave_ledger(db: AsyncSession, entries: Iterable[dict]) -> None:
+    """
+    원장 기록과 잔여 증감 (커밋은 호출하는 쪽의 트랜잭션에서, Users.total_leave_days 변경 후에 호출)
+    증감이 없는 건은 제외하며, 잔여는 INSERT ... ON DUPLICATE KEY UPDATE col = col + VALUES(col) 한 번으로 반영합니다.
+    """
+    entries = [entry for entry in entries if any(entry[column] for column in BALANCE_COLUMNS)]
+    if not entries:
+        return
+    entries = await opening_entries(db, sum_entries(entries)) + entries
+    await db.execute(insert(LeaveLedger), entries)
+    deltas = sum_entries(entries)
+
+    stmt = mysql_insert(UserLeaveBalance)
+    stmt = stmt.on_duplicate_key_update(
+        updated_at=func.now(),
+        **{column: getattr(UserLeaveBalance, column) + stmt.inserted[column] for column in BALANCE_COLUMNS}
+    )
+    await db.execute(stmt, list(deltas.values()))
+
+
+async def get_leave_balance(db: AsyncSession, user_id: int, year: int) -> Optional[UserLeaveBalance]:
+    """사용자의 해당 연도 연차 잔여 (기본 키 조회)"""
+    return await db.get(UserLeaveBalance, (user_id, year))
+
+
+async def set_total_leave_days(
+    session: AsyncSession,
+    user: Users,
+    count,
+    entry_type: LeaveLedgerType,
+    memo: Optional[str] = None
+) -> None:
+    """잔여 연차 수(Users.total_leave_days)를 count로 변경하고, 변경분을 올해 부여 일수로 원장에 기록"""
+    granted_days = Decimal(str(count)) - Decimal(str(user.total_leave_days or 0))
+    await users_crud.update_total_leave_days(session=session, user_id=user.id, count=count)
+    # 같은 날 한 사용자를 여러 번 변경해도 변경분이 이어지도록 현재 값을 맞춰 둡니다.
+    set_committed_value(user, "total_leave_days", count)
+    await record_leave_ledger(session, [
+        ledger_entry(user.id, date.today().year, entry_type, granted_days=granted_days, memo=memo)
+    ])
+
+
+async def reconcile_leave_balances(db: AsyncSession, year: Optional[int] = None, fix: bool = False) -> list[dict]:
+    """
+    원장 합계와 잔여 스냅샷을 (사용자, 연도)별로 대조하여 불일치 목록을 반환
+    fix이면 불일치한 잔여를 원장 합계로 덮어씁니다.
+    """
+    sums = [func.sum(getattr(LeaveLedger, column)).label(column) for column in BALANCE_COLUMNS]
+    ledger_query = select(LeaveLedger.user_id, LeaveLedger.year, *sums).group_by(LeaveLedger.user_id, LeaveLedger.year)
+    balance_query = select(UserLeaveBalance.user_id, UserLeaveBalance.year, *(getattr(UserLeaveBalance, column) for column in BALANCE_COLUMNS))
+    if year:
+        ledger_query = ledger_query.where(LeaveLedger.year == year)
+        balance_query = balance_query.where(UserLeaveBalance.year == year)
+
+    def days(row) -> dict:
+        return {column: Decimal(str(row._mapping[column] or 0)) for column in BALANCE_COLUMNS}
+
+    ledger = {(row.user_id, row.year): days(row) for row in (await db.execute(ledger_query)).all()}
+    balances = {(row.user_id, row.year): days(row) for row in (await db.execute(balance_query)).all()}
+    zero = dict.fromkeys(BALANCE_COLUMNS, Decimal("0"))
+
+    mismatches = []
+    for key in sorted(ledger.keys() | balances.keys()):
+        expected, actual = ledger.get(key, zero), balances.get(key)
+        if actual != expected:
+            mismatches.append({"user_id": key[0], "year": key[1], "ledger": expected, "balance": actual})
+
+    if fix and mismatches:
+        stmt = mysql_insert(UserLeaveBalance)
+        stmt = stmt.on_duplicate_key_update(
+            updated_at=func.now(),
+            **{column: stmt.inserted[column] for column in BALANCE_COLUMNS}
+        )
+        await db.execute(stmt, [
+            {"user_id": mismatch["user_id"], "year": mismatch["year"], **mismatch["ledger"]} for mismatch in mismatches
+        ])
+        await db.commit()
+
+    return mismatches
+
+
+async def main(year: Optional[int], fix: bool) -> None:
+    from app.core.database import async_session
+
+    async with async_session() as session:
+        mismatches = await reconcile_leave_balances(session, year, fix)
+    for mismatch in mismatches:
+        print(f"user_id={mismatch['user_id']} year={mismatch['year']} ledger={mismatch['ledger']} balance={mismatch['balance']}")
+    print(f"user_leave_balances: {len(mismatches)} mismatches{' fixed' if fix else ''}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--year", type=int, default=None)
+    parser.add_argument("--fix", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(main(args.year, args.fix))
@@ -5,7 +5,9 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.mysql import insert as mysql_insert
 
 from app.core.permissions.auth_utils import can_manage_user_permissions
+from app.core.permissions.menu_permission_cache import has_menu, menu_permission_cache
 from app.enums.users import MenuPermissions, Role
+from app.middleware.principal_cache import principal_cache
 from app.models.users.users_model import Users, user_menus, user_parts
 from app.models.parts.parts_model import Parts
 from app.schemas.menu_management_schemas import MenuPermissionUpdate
@@ -101,31 +103,22 @@ class MenuService:
             )
             parts = manageable_parts.all()
 
-            response["part_permissions"] = []
-            for part in parts:
-                menu_perms = await self.db.execute(
-                    select(user_menus).where(
-                        and_(
-                            user_menus.c.user_id == user_id,
-                            user_menus.c.part_id == part.id
-                        )
-                    )
-                )
-                menu_perms = menu_perms.fetchall()
+            # 파트별 메뉴 권한은 한 번에 비트셋으로 컴파일하여 사용
+            part_bitsets = await menu_permission_cache.get_part_bitsets(self.db, user_id)
 
-                response["part_permissions"].append({
+            response["part_permissions"] = [
+                {
                     "part_id": part.id,
                     "part_name": part.name,
                     "menu_permissions": [
                         {
                             "menu_name": menu.value,
-                            "is_permitted": next(
-                                (p.is_permitted for p in menu_perms if p.menu_name == menu),
-                                False
-                            )
+                            "is_permitted": has_menu(part_bitsets.get(part.id, 0), menu)
                         } for menu in MenuPermissions
                     ]
-                })
+                }
+                for part in parts
+            ]
             return response
 
         # 일반 사원 이하 등급
@@ -196,6 +189,10 @@ class MenuService:
                 await self.update_part_admin_permissions(target_user, permissions)
 
             await self.db.commit()
+
+            # 변경된 메뉴 권한/역할이 다음 요청부터 반영되도록 캐시 무효화
+            menu_permission_cache.invalidate(target_user.id)
+            principal_cache.invalidate(target_user.id)
             return {"message": "권한이 업데이트되었습니다"}
 
         # HTTP 예외는 그대로 전달
@@ -0,0 +1,119 @@
+from datetime import UTC, datetime
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cruds.overtimes.overtimes_crud import (
+    add_overtime_histories,
+    find_applicants,
+    find_overtime_policies,
+    find_overtimes_for_update,
+    update_overtimes_approved_money,
+    update_overtimes_status,
+)
+from app.enums.users import OverTimeHours, Status
+from app.models.users.users_model import Users
+from app.service.overtime_summary_service import apply_overtime_summary_deltas, overtime_money, summary_delta
+
+# 오버타임 이력에 집계하는 시간 구분 (120분은 이력 집계 대상 아님)
+HISTORY_HOURS = (
+    OverTimeHours.THIRTY_MINUTES.value,
+    OverTimeHours.SIXTY_MINUTES.value,
+    OverTimeHours.NINETY_MINUTES.value,
+)
+
+
+def overtime_history_row(user_id: int, overtime_hours: str, money: int, sign: int = 1) -> dict:
+    """
+    오버타임 1건에 대한 이력 행
+    sign이 -1이면 승인 시 추가한 이력을 상쇄하는 행 (승인된 건을 반려한 경우)
+    """
+    row = {"user_id": user_id}
+    for hours in HISTORY_HOURS:
+        row[f"ot_{hours}_total"] = 0
+        row[f"ot_{hours}_money"] = 0
+    if overtime_hours in HISTORY_HOURS:
+        row[f"ot_{overtime_hours}_total"] = sign
+        row[f"ot_{overtime_hours}_money"] = sign * money
+    return row
+
+
+async def bulk_process_overtimes_service(
+    db: AsyncSession,
+    overtime_ids: list[int],
+    approve: bool,
+    manager_memo: Optional[str],
+    current_user: Users,
+) -> dict:
+    """
+    초과 근무 일괄 승인/반려
+        - 초과 근무, 신청자/파트, 지점별 정책을 각각 한 번에 조회하고 수당은 메모리에서 계산합니다.
+        - 처리 가능한 건만 상태 변경(UPDATE 1회), 이력 추가(INSERT 1회), 월간 집계 증감(UPSERT 1회)을 한 트랜잭션으로 반영합니다.
+        - 처리할 수 없는 건은 단건 API와 같은 사유로 결과에 남기고 건너뜁니다.
+        - 승인 시 계산한 수당은 approved_money에 기록하고, 승인된 건을 반려하면 그 금액만큼 이력/집계에서 차감합니다.
+    """
+    overtime_ids = list(dict.fromkeys(overtime_ids))
+    overtimes = await find_overtimes_for_update(db, overtime_ids)
+    applicants = await find_applicants(db, {overtime.applicant_id for overtime in overtimes.values()})
+    # 반려는 승인 시 기록한 금액을 차감하므로 정책 조회 불필요
+    policies = await find_overtime_policies(db, {applicant.branch_id for applicant in applicants.values()}) if approve else {}
+
+    results, processed_ids, histories, summary_deltas, approved_money = [], [], [], [], {}
+    for overtime_id in overtime_ids:
+        overtime = overtimes.get(overtime_id)
+        applicant = applicants.get(overtime.applicant_id) if overtime else None
+        policy = policies.get(applicant.branch_id) if applicant else None
+
+        if overtime is None or (approve and overtime.status != Status.PENDING):
+            error = "초과 근무 기록을 찾을 수 없습니다."
+        elif not approve and overtime.status == Status.REJECTED:
+            error = "이미 거절된 오버타임 정보 입니다."
+        elif applicant is None:
+            error = "사용자 정보를 찾을 수 없습니다."
+        elif approve and applicant.is_doctor is None:
+            error = "사용자 또는 파트 정보를 찾을 수 없습니다."
+        elif approve and policy is None:
+            error = "오버타임 정책을 찾을 수 없습니다."
+        else:
+            error = None
+
+        if error:
+            results.append({"overtime_id": overtime_id, "success": False, "message": error})
+            continue
+
+        if approve:
+            money = approved_money[overtime_id] = overtime_money(policy, applicant.is_doctor, overtime.overtime_hours)
+            histories.append(overtime_history_row(applicant.id, overtime.overtime_hours, money))
+            summary_deltas.append(summary_delta(applicant.id, overtime.application_date, overtime.overtime_hours, money))
+        elif overtime.status == Status.APPROVED:
+            money = overtime.approved_money or 0
+            histories.append(overtime_history_row(applicant.id, overtime.overtime_hours, money, -1))
+            summary_deltas.append(summary_delta(applicant.id, overtime.application_date, overtime.overtime_hours, money, -1))
+        processed_ids.append(overtime_id)
+        results.append({
+            "overtime_id": overtime_id,
+            "success": True,
+            "message": "초과 근무 기록이 승인되었습니다." if approve else "초과 근무 기록이 거절되었습니다.",
+        })
+
+    if processed_ids:
+        await update_overtimes_status(
+            db,
+            processed_ids,
+            status=Status.APPROVED.value if approve else Status.REJECTED.value,
+            is_approved="Y" if approve else "N",
+            manager=current_user,
+            manager_memo=manager_memo,
+            processed_date=datetime.now(UTC).date(),
+        )
+        await update_overtimes_approved_money(db, approved_money)
+        await add_overtime_histories(db, histories)
+        await apply_overtime_summary_deltas(db, summary_deltas)
+    await db.commit()
+
+    return {
+        "message": f"초과 근무 {len(processed_ids)}건이 {'승인' if approve else '거절'}되었습니다.",
+        "succeeded": len(processed_ids),
+        "failed": len(overtime_ids) - len(processed_ids),
+        "results": results,
+    }
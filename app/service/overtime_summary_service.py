@@ -0,0 +1,166 @@
+"""
+사용자별 월간 오버타임 집계 (overtime_monthly_summaries)
+
+    python -m app.service.overtime_summary_service --year 2024 --month 3   # 해당 월 재계산
+    python -m app.service.overtime_summary_service --year 2024             # 해당 연도 재계산
+    python -m app.service.overtime_summary_service                         # 전체 재계산 (최초 백필)
+
+승인/반려 시에는 apply_overtime_summary_deltas로 증감만 반영하고,
+재계산은 승인된 초과 근무를 다시 집계합니다.
+수당은 승인 시점의 정책 금액을 overtimes.approved_money에 기록해 두고, 반려 시 차감과 재계산 모두 이 금액을 씁니다.
+(승인 후 정책이 바뀌어도 승인 당시 더한 금액만큼만 빠지고, 재계산 결과도 증감 반영 결과와 같음)
+"""
+import argparse
+import asyncio
+from collections import defaultdict
+from datetime import date
+from typing import Iterable, Optional
+
+from sqlalchemy import delete, func, insert, select
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cruds.overtimes.overtimes_crud import find_applicants, find_overtime_policies
+from app.enums.users import OverTimeHours, Status
+from app.models.branches.overtime_policies_model import OverTimePolicies
+from app.models.users.overtimes_model import OvertimeMonthlySummary, Overtimes
+from app.utils.datetime_utils import DatetimeUtil
+
+SUMMARY_HOURS = tuple(hours.value for hours in OverTimeHours)
+SUMMARY_COLUMNS = tuple(
+    f"ot_{hours}_{kind}" for kind in ("count", "money") for hours in SUMMARY_HOURS
+)
+
+
+def overtime_money(policy: Optional[OverTimePolicies], is_doctor: bool, overtime_hours: str) -> int:
+    """정책 기준 오버타임 1회 수당 (의사 파트면 doctor_ot_*, 아니면 common_ot_*. 정책이 없으면 0)"""
+    if policy is None or overtime_hours not in SUMMARY_HOURS:
+        return 0
+    prefix = "doctor" if is_doctor else "common"
+    return getattr(policy, f"{prefix}_ot_{overtime_hours}") or 0
+
+
+def summary_delta(user_id: int, application_date: date, overtime_hours: str, money: int, sign: int = 1) -> dict:
+    """오버타임 1건의 월간 집계 증감 (sign이 -1이면 승인 취소)"""
+    row = {"user_id": user_id, "year": application_date.year, "month": application_date.month}
+    row.update(dict.fromkeys(SUMMARY_COLUMNS, 0))
+    if overtime_hours in SUMMARY_HOURS:
+        row[f"ot_{overtime_hours}_count"] = sign
+        row[f"ot_{overtime_hours}_money"] = sign * money
+    return row
+
+
+def merge_deltas(deltas: Iterable[dict]) -> list[dict]:
+    """같은 (user_id, year, month)의 증감을 합산"""
+    merged: dict[tuple, dict] = {}
+    for delta in deltas:
+        key = (delta["user_id"], delta["year"], delta["month"])
+        row = merged.get(key)
+        if row is None:
+            merged[key] = dict(delta)
+        else:
+            for column in SUMMARY_COLUMNS:
+                row[column] += delta[column]
+    return list(merged.values())
+
+
+async def apply_overtime_summary_deltas(db: AsyncSession, deltas: Iterable[dict]) -> None:
+    """
+    월간 집계에 증감 반영 (커밋은 호출하는 쪽의 트랜잭션에서)
+    INSERT ... ON DUPLICATE KEY UPDATE col = col + VALUES(col) 한 번으로 처리하므로 동시 승인에도 값이 유실되지 않습니다.
+    """
+    rows = merge_deltas(deltas)
+    if not rows:
+        return
+
+    stmt = mysql_insert(OvertimeMonthlySummary)
+    stmt = stmt.on_duplicate_key_update(
+        updated_at=func.now(),
+        **{column: getattr(OvertimeMonthlySummary, column) + stmt.inserted[column] for column in SUMMARY_COLUMNS}
+    )
+    await db.execute(stmt, rows)
+
+
+async def record_overtime_summary(db: AsyncSession, overtimes: list[Overtimes], sign: int = 1) -> None:
+    """
+    단건 승인/반려용
+    승인(sign=1)이면 신청자 파트와 지점 정책으로 수당을 계산하여 approved_money에 기록하고,
+    반려(sign=-1)면 승인 시 기록한 approved_money만큼 차감합니다.
+    """
+    if sign > 0:
+        applicants = await find_applicants(db, {overtime.applicant_id for overtime in overtimes})
+        policies = await find_overtime_policies(db, {applicant.branch_id for applicant in applicants.values()})
+        for overtime in overtimes:
+            applicant = applicants.get(overtime.applicant_id)
+            policy = policies.get(applicant.branch_id) if applicant else None
+            overtime.approved_money = overtime_money(policy, bool(applicant and applicant.is_doctor), overtime.overtime_hours)
+
+    await apply_overtime_summary_deltas(db, [
+        summary_delta(overtime.applicant_id, overtime.application_date, overtime.overtime_hours, overtime.approved_money or 0, sign)
+        for overtime in overtimes
+    ])
+
+
+async def rebuild_overtime_monthly_summaries(
+    db: AsyncSession,
+    year: Optional[int] = None,
+    month: Optional[int] = None
+) -> int:
+    """
+    승인된 초과 근무로 월간 집계를 다시 계산 (year/month가 없으면 전체, month만 없으면 해당 연도)
+    반환값은 기록한 (사용자, 연, 월) 행 수
+    """
+    overtime_scope = [Overtimes.status == Status.APPROVED.value, Overtimes.deleted_yn == "N"]
+    summary_scope = []
+    if year and month:
+        overtime_scope.append(DatetimeUtil.in_month(Overtimes.application_date, year, month))
+        summary_scope += [OvertimeMonthlySummary.year == year, OvertimeMonthlySummary.month == month]
+    elif year:
+        overtime_scope.append(DatetimeUtil.in_year(Overtimes.application_date, year))
+        summary_scope.append(OvertimeMonthlySummary.year == year)
+
+    # (신청자, 신청일, 시간)별 건수와 승인 시 기록한 수당 합계 (연/월은 메모리에서 계산)
+    result = await db.execute(
+        select(
+            Overtimes.applicant_id,
+            Overtimes.application_date,
+            Overtimes.overtime_hours,
+            func.count().label("count"),
+            func.coalesce(func.sum(Overtimes.approved_money), 0).label("money")
+        )
+        .where(*overtime_scope)
+        .group_by(Overtimes.applicant_id, Overtimes.application_date, Overtimes.overtime_hours)
+    )
+
+    summaries: dict[tuple, dict] = defaultdict(lambda: dict.fromkeys(SUMMARY_COLUMNS, 0))
+    for row in result.all():
+        summary = summaries[(row.applicant_id, row.application_date.year, row.application_date.month)]
+        summary[f"ot_{row.overtime_hours}_count"] += row.count
+        summary[f"ot_{row.overtime_hours}_money"] += int(row.money)
+
+    await db.execute(delete(OvertimeMonthlySummary).where(*summary_scope))
+    if summaries:
+        await db.execute(insert(OvertimeMonthlySummary), [
+            {"user_id": user_id, "year": summary_year, "month": summary_month, **values}
+            for (user_id, summary_year, summary_month), values in summaries.items()
+        ])
+    await db.commit()
+    return len(summaries)
+
+
+async def main(year: Optional[int], month: Optional[int]) -> None:
+    from app.core.database import async_session
+
+    async with async_session() as session:
+        count = await rebuild_overtime_monthly_summaries(session, year, month)
+    print(f"overtime_monthly_summaries: {count} rows rebuilt")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--year", type=int, default=None)
+    parser.add_argument("--month", type=int, default=None)
+    args = parser.parse_args()
+    if args.month and not args.year:
+        parser.error("--month requires --year")
+    asyncio.run(main(args.year, args.month))
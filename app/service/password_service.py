@@ -0,0 +1,95 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, TypeVar
+
+import bcrypt
+
+from app.core.config import settings
+
+T = TypeVar("T")
+
+# bcrypt 해시 prefix (이 형식이 아니면 평문으로 저장된 기존 비밀번호로 간주)
+BCRYPT_PREFIXES = ("$2a$", "$2b$", "$2y$")
+
+
+class PasswordService:
+    """
+    bcrypt 해시/검증을 이벤트 루프 밖의 스레드풀에서 실행하는 서비스
+
+    - bcrypt는 연산 중 GIL을 해제하므로 스레드풀에서 병렬로 실행됩니다.
+    - semaphore로 동시에 실행되는 작업 수를 워커 수로 제한하고, 대기 중인 요청 수를 기록합니다.
+    """
+
+    def __init__(self, max_workers: int = 4, rounds: int = 12):
+        self.max_workers = max_workers
+        self.rounds = rounds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="password")
+        self._semaphore = asyncio.Semaphore(max_workers)
+
+        self.queue_depth = 0  # 워커를 기다리는 요청 수
+        self.max_queue_depth = 0
+        self.running = 0
+        self.completed = 0
+        self.total_wait_seconds = 0.0
+        self.total_run_seconds = 0.0
+
+    async def hash_password(self, password: str) -> str:
+        hashed = await self._run(
+            bcrypt.hashpw, password.encode("utf-8"), bcrypt.gensalt(rounds=self.rounds)
+        )
+        return hashed.decode("utf-8")
+
+    async def verify_password(self, password: str, hashed_password: str) -> bool:
+        # 기존 평문 비밀번호는 그대로 비교 (로그인 성공 시 해시로 교체)
+        if not self.is_hashed(hashed_password):
+            return password == hashed_password
+
+        return await self._run(
+            bcrypt.checkpw, password.encode("utf-8"), hashed_password.encode("utf-8")
+        )
+
+    @staticmethod
+    def is_hashed(password: str) -> bool:
+        return password.startswith(BCRYPT_PREFIXES)
+
+    async def _run(self, func: Callable[..., T], *args) -> T:
+        queued_at = time.perf_counter()
+        self.queue_depth += 1
+        self.max_queue_depth = max(self.max_queue_depth, self.queue_depth)
+        try:
+            await self._semaphore.acquire()
+        finally:
+            self.queue_depth -= 1
+
+        started_at = time.perf_counter()
+        self.total_wait_seconds += started_at - queued_at
+        self.running += 1
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, func, *args)
+        finally:
+            self.running -= 1
+            self.completed += 1
+            self.total_run_seconds += time.perf_counter() - started_at
+            self._semaphore.release()
+
+    def stats(self) -> dict:
+        return {
+            "max_workers": self.max_workers,
+            "queue_depth": self.queue_depth,
+            "max_queue_depth": self.max_queue_depth,
+            "running": self.running,
+            "completed": self.completed,
+            "avg_wait_ms": round(self.total_wait_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+            "avg_run_ms": round(self.total_run_seconds / self.completed * 1000, 2) if self.completed else 0.0,
+        }
+
+    def shutdown(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+
+password_service = PasswordService(
+    max_workers=settings.PASSWORD_HASH_WORKERS,
+    rounds=settings.PASSWORD_HASH_ROUNDS,
+)
@@ -16,6 +16,7 @@ from app.schemas.modusign_schemas import TemplateResponse
 from app.schemas.user_management.part_timers_contract_schemas import PartTimerWorkContractDto
 from app.schemas.user_management.salary_contract import SalaryContractDto
 from app.schemas.user_work_contract_schemas import WorkContractDto
+from app.service.closed_day_calendar_cache import closed_day_calendar_cache
 from app.service.template_service import TemplateService as ModusignTemplateService
 from app.service.document_service import DocumentService as ModusignDocumentService
 from app.service.user_management.part_time_contract_service import UserManagementPartTimeContractService
@@ -169,7 +170,10 @@ class UserManagementContractService:
     async def get_contract_by_modusign_id(self, modusign_id: str) -> Contract:
         return await self.contract_repository.find_contract_by_modusign_id(modusign_id=modusign_id)
     async def create_contract(self, contract: Contract) -> int:
-        return await self.contract_repository.add_contract(contract=contract)
+        contract_id = await self.contract_repository.add_contract(contract=contract)
+        # 최신 근로계약이 바뀌면 정기 휴무도 바뀌므로 휴무 캘린더 캐시 무효화
+        closed_day_calendar_cache.invalidate_all()
+        return contract_id
 
     # Contract History
     async def get_contract_histories_by_user_id(self, user_id: int) -> list[ContractHistory]:
@@ -261,10 +265,12 @@ class UserManagementContractService:
             "contract_status": contract_status
         }
 
-        return await self.contract_repository.update_contract(
+        updated = await self.contract_repository.update_contract(
             contract_id=contract_id,
             update_params=update_params
         )
+        closed_day_calendar_cache.invalidate_all()
+        return updated
 
 
     # async def approve_contract(
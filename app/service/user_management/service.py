@@ -1,4 +1,5 @@
 import logging
+from datetime import date
 from typing import Optional, List, Tuple
 
 from fastapi import Depends, HTTPException
@@ -13,6 +14,9 @@ from app.cruds.users.career_crud import add_bulk_career
 from app.cruds.users.education_crud import add_bulk_education
 from app.cruds.users.users_crud import find_by_email, add_user
 from app.enums.users import Role, UserStatus
+from app.middleware.principal_cache import principal_cache
+from app.service.attendance_summary_service import refresh_attendance_summaries
+from app.service.password_service import password_service
 from app.models.commutes.commutes_model import Commutes
 from app.models.parts.parts_model import Parts
 from app.models.parts.user_salary import UserSalary
@@ -23,6 +27,7 @@ from app.schemas.user_management.user_management_schemas import UserListDto, Use
 from app.models.users.time_off_model import TimeOff
 from sqlalchemy.orm import load_only
 from sqlalchemy import desc
+from app.utils.keyset_pagination import Keyset
 
 logger = logging.getLogger(__name__)
 
@@ -48,7 +53,8 @@ class UserManagementService:
         if existing_user:
             raise HTTPException(status_code=400, detail="User already exists")
 
-        # 4. 사용자 생성
+        # 4. 사용자 생성 (비밀번호는 스레드풀에서 bcrypt 해시)
+        user_data['password'] = await password_service.hash_password(user_data['password'])
         user = Users(**user_data)
         created_user = await add_user(session=session, user=user)
 
@@ -107,7 +113,9 @@ class UserManagementService:
 
 
     async def update_user_role(self, user_id: int, role: Role = Role.EMPLOYEE) -> bool:
-        return await self.repository.update_user_role(user_id=user_id, role=role)
+        updated = await self.repository.update_user_role(user_id=user_id, role=role)
+        principal_cache.invalidate(user_id)
+        return updated
 
     async def get_user_detail(
         self,
@@ -195,6 +203,7 @@ class UserManagementService:
             careers_data = update_dict.pop('careers', None)
 
             # 기본 사용자 정보 업데이트
+            previous_branch_id = user.branch_id
             for field, value in update_dict.items():
                 if hasattr(user, field) and not isinstance(value, (list, dict)):
                     setattr(user, field, value)
@@ -246,6 +255,11 @@ class UserManagementService:
 
             await session.commit()
 
+            # 지점을 옮긴 경우 이번 달 근태 집계를 새 지점 기준으로 다시 계산
+            if user.branch_id != previous_branch_id:
+                today = date.today()
+                await refresh_attendance_summaries(session, [(today.year, today.month)], user_ids=[user_id])
+
             # 업데이트된 사용자 정보 다시 조회
             updated_user = await self.get_user_detail(
                 db=session,
@@ -345,8 +359,14 @@ class UserQueryService:
         phone: Optional[str] = None,
         branch_id: Optional[int] = None,
         part_id: Optional[int] = None,
-    ) -> Tuple[List[UserDTO], int]:
-        """사용자 목록을 조회하는 서비스 메서드"""
+        cursor: Optional[str] = None,
+        include_total: bool = False,
+    ) -> Tuple[List[UserDTO], Optional[int], Optional[str]]:
+        """
+        사용자 목록을 조회하는 서비스 메서드
+        cursor(이전 응답의 next_cursor)가 있으면 page 대신 커서 이후부터 조회하고,
+        전체 개수는 include_total인 경우만 계산합니다. (없으면 None)
+        """
 
         try:
             # 기본 쿼리 구성
@@ -363,21 +383,30 @@ class UserQueryService:
             )
 
             # 총 개수 계산 - 필터링된 쿼리 사용
-            total_count = await self._get_total_count(db=db, query=filtered_query)
+            total_count = None
+            if not cursor or include_total:
+                total_count = await self._get_total_count(db=db, query=filtered_query)
 
             # 정렬 및 페이지네이션 적용
+            keyset = self._user_keyset(current_user_id=current_user.id)
             final_query = self._apply_sorting_and_pagination(
                 query=filtered_query,
-                current_user_id=current_user.id,
+                keyset=keyset,
                 page=page,
-                record_size=record_size
+                record_size=record_size,
+                cursor=cursor
             )
 
             # 쿼리 실행 및 결과 처리
             users_data = await self._execute_query(db=db, query=final_query)
+            users_data, next_cursor = keyset.split(
+                users_data, record_size, lambda user: (0 if user.id == current_user.id else 1, user.id)
+            )
 
-            return users_data, total_count
+            return users_data, total_count, next_cursor
 
+        except HTTPException:
+            raise
         except Exception as e:
             logger.error(f"사용자 목록 조회 중 에러 발생: {str(e)}", exc_info=True)
             raise HTTPException(
@@ -481,18 +510,27 @@ class UserQueryService:
             logger.error(f"총 레코드 수 계산 중 에러 발생: {str(e)}")
             raise
 
+    def _user_keyset(self, current_user_id: int) -> Keyset:
+        """정렬 기준 (현재 사용자를 가장 앞에, 나머지는 id 순)"""
+        return Keyset(
+            case((self.UserAlias.id == current_user_id, literal_column("0")), else_=literal_column("1")),
+            self.UserAlias.id,
+            descending=False
+        )
+
     def _apply_sorting_and_pagination(
         self,
         query,
-        current_user_id: int,
+        keyset: Keyset,
         page: int,
-        record_size: int
+        record_size: int,
+        cursor: Optional[str] = None
     ):
-        """정렬 및 페이지네이션 적용"""
-        return query.order_by(
-            case((self.UserAlias.id == current_user_id, literal_column("0")), else_=literal_column("1")),
-            self.UserAlias.id
-        ).offset((page - 1) * record_size).limit(record_size)
+        """정렬 및 페이지네이션 적용 (커서가 없으면 page 기준 OFFSET)"""
+        query = keyset.paginate(query, cursor, record_size)
+        if not cursor:
+            query = query.offset((page - 1) * record_size)
+        return query
 
     async def _execute_query(self, db: AsyncSession, query) -> List[UserDTO]:
         """쿼리 실행 및 DTO 변환"""
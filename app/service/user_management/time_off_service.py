@@ -8,6 +8,7 @@ from app.schemas.user_management.time_off_schemas import TimeOffCreateRequestDto
 from app.schemas.user_management.time_off_schemas import TimeOffReadAllResponseDto
 from app.cruds.users import time_off_crud, users_crud
 from app.exceptions.exceptions import NotFoundError
+from app.middleware.principal_cache import principal_cache
 
 
 logger = logging.getLogger(__name__)
@@ -57,6 +58,7 @@ async def time_off_create(
             session = session,
             time_off_create_request = TimeOff(**time_off_create_request.model_dump())
         )
+        principal_cache.invalidate(time_off_create_result.user_id)
         return time_off_create_result
     
     except Exception as error:
@@ -91,6 +93,7 @@ async def time_off_update(
             raise NotFoundError(
                 detail = "업데이트할 휴직 데이터를 찾을 수 없습니다."
             )
+        principal_cache.invalidate(time_off_update_result.user_id)
         return time_off_update_result
     
     except Exception as error:
@@ -119,6 +122,7 @@ async def time_off_delete(
             raise NotFoundError(
                 detail = "삭제할 휴직 데이터를 찾을 수 없습니다."
             )
+        principal_cache.invalidate(time_off_delete_result.user_id)
         return True
 
     except Exception as error:
@@ -1,6 +1,7 @@
 from app.cruds.user_management.work_contract_crud import UserManagementWorkContractRepository
 from app.models.users.users_work_contract_model import WorkContract
 from app.schemas.user_work_contract_schemas import WorkContractDto
+from app.service.closed_day_calendar_cache import closed_day_calendar_cache
 from app.service.user_management.work_contract_history_service import UserManagementContractHistoryService
 
 class UserManagementWorkContractService:
@@ -22,6 +23,8 @@ class UserManagementWorkContractService:
             work_contract: WorkContract,
     ):
         created_work_contract_id = await self.work_contract_repository.add_work_contract(work_contract=work_contract)
+        # 정기 휴무가 바뀔 수 있으므로 휴무 캘린더 캐시 무효화
+        closed_day_calendar_cache.invalidate_all()
         return created_work_contract_id
 
 
@@ -34,4 +37,5 @@ class UserManagementWorkContractService:
             contract_id=work_contract_id,
             update_params=update_params,
         )
+        closed_day_calendar_cache.invalidate_all()
         return updated_work_contract
\ No newline at end of file
@@ -1,5 +1,7 @@
 from app.cruds.users import users_crud
 from app.cruds.branches import branches_crud
+from app.enums.users import LeaveLedgerType
+from app.service.leave_ledger_service import set_total_leave_days
 from app.schemas.users_schemas import (
     UserLeaveResponse, UsersLeaveResponse, PersonnelRecordHistoryResponse, 
     PersonnelRecordHistoriesResponse, PersonnelRecordHistoryCreateRequest, PersonnelRecordHistoryUpdateRequest,
@@ -45,7 +47,7 @@ async def plus_total_leave_days(
             updated_total_leave_days = user.total_leave_days + request.count
             if updated_total_leave_days > MAX_ANNUAL_LEAVE_DAYS:
                 raise BadRequestError(detail=f"{user.name}의 최대 연차 수를 초과했습니다.")
-            await users_crud.update_total_leave_days(session=session, user_id=user_id, count=updated_total_leave_days)
+            await set_total_leave_days(session, user, updated_total_leave_days, LeaveLedgerType.MANUAL, request.memo)
     return True
 
 
@@ -61,7 +63,7 @@ async def minus_total_leave_days(
             updated_total_leave_days = user.total_leave_days - request.count
             if updated_total_leave_days < 0:
                 raise BadRequestError(detail="잔여 연차가 부족합니다.")
-            await users_crud.update_total_leave_days(session=session, user_id=user_id, count=updated_total_leave_days)
+            await set_total_leave_days(session, user, updated_total_leave_days, LeaveLedgerType.MANUAL, request.memo)
     return True
 
 
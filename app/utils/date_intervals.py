@@ -0,0 +1,32 @@
+from datetime import date, timedelta
+from typing import Optional, Sequence
+
+import numpy as np
+
+from app.utils.datetime_utils import DatetimeUtil
+
+
+def month_date_strs(year: int, month: int) -> list[str]:
+    """해당 월의 날짜 문자열 (YYYY-MM-DD) 목록"""
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    return [(month_start + timedelta(days=day)).strftime("%Y-%m-%d") for day in range((next_month_start - month_start).days)]
+
+
+def month_day_mask(year: int, month: int, starts: Sequence[date], ends: Sequence[Optional[date]]) -> np.ndarray:
+    """
+    기간 목록을 해당 월의 (기간 x 일자) 비트맵으로 펼침
+    월초 기준 시작/종료 오프셋을 일자 배열과 한 번에 비교하므로 월 밖의 날짜는 자연히 잘리고,
+    기간 길이와 관계없이 O(기간 수 x 월 일수)입니다.
+    date와 datetime을 모두 받으며, 종료일이 없으면 시작일 하루로 봅니다.
+    """
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    days = (next_month_start - month_start).days
+    start_offsets = np.fromiter((start.toordinal() for start in starts), dtype=np.int64, count=len(starts))
+    end_offsets = np.fromiter(
+        ((end or start).toordinal() for start, end in zip(starts, ends)), dtype=np.int64, count=len(starts)
+    )
+    start_offsets -= month_start.toordinal()
+    end_offsets -= month_start.toordinal()
+
+    day_index = np.arange(days)
+    return (day_index[None, :] >= start_offsets[:, None]) & (day_index[None, :] <= end_offsets[:, None])
@@ -0,0 +1,81 @@
+"""
+긴 휴가/휴직 기간의 월간 펼치기 마이크로 벤치마크
+
+    python -m app.utils.date_intervals_benchmark --intervals 2000 --max-days 365
+
+한 달(기본 2024-03)과 겹치는 기간 목록을 날짜별로 펼치는 방식을 비교합니다.
+    - before: 기간마다 start_date부터 end_date까지 timedelta로 하루씩 반복 (월 밖의 날짜까지 순회)
+    - after : month_day_mask로 (기간 x 일자) 비트맵을 만든 뒤 np.nonzero로 한 번에 추출
+DB 조회는 배제하며, 두 방식이 같은 (기간, 날짜) 목록을 만드는지 먼저 확인합니다.
+"""
+import argparse
+import random
+import time
+from datetime import date, timedelta
+
+import numpy as np
+
+from app.utils.date_intervals import month_date_strs, month_day_mask
+from app.utils.datetime_utils import DatetimeUtil
+
+
+def make_intervals(year: int, month: int, count: int, max_days: int, seed: int) -> list[tuple[date, date]]:
+    """해당 월과 겹치는 기간 목록 (이전 달에 시작하거나 다음 달에 끝나는 긴 기간 포함)"""
+    rnd = random.Random(seed)
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    intervals = []
+    while len(intervals) < count:
+        start = month_start + timedelta(days=rnd.randint(-max_days, (next_month_start - month_start).days - 1))
+        end = start + timedelta(days=rnd.randint(0, max_days))
+        if end >= month_start:
+            intervals.append((start, end))
+    return intervals
+
+
+def expand_by_loop(year: int, month: int, intervals: list[tuple[date, date]]) -> list[tuple[int, str]]:
+    month_start, next_month_start = DatetimeUtil.month_range(year, month)
+    expanded = []
+    for index, (start_date, end_date) in enumerate(intervals):
+        current_date = start_date
+        while current_date <= end_date:
+            if month_start <= current_date < next_month_start:
+                expanded.append((index, current_date.strftime("%Y-%m-%d")))
+            current_date += timedelta(days=1)
+    return expanded
+
+
+def expand_by_mask(year: int, month: int, intervals: list[tuple[date, date]]) -> list[tuple[int, str]]:
+    date_strs = month_date_strs(year, month)
+    mask = month_day_mask(year, month, [start for start, _ in intervals], [end for _, end in intervals])
+    return [(int(row), date_strs[day]) for row, day in zip(*np.nonzero(mask))]
+
+
+def measure(function, repeat: int, *args) -> float:
+    started = time.perf_counter()
+    for _ in range(repeat):
+        function(*args)
+    return (time.perf_counter() - started) / repeat * 1000
+
+
+def main(year: int, month: int, count: int, max_days: int, repeat: int, seed: int) -> None:
+    intervals = make_intervals(year, month, count, max_days, seed)
+    assert expand_by_loop(year, month, intervals) == expand_by_mask(year, month, intervals)
+
+    total_days = sum((end - start).days + 1 for start, end in intervals)
+    before = measure(expand_by_loop, repeat, year, month, intervals)
+    after = measure(expand_by_mask, repeat, year, month, intervals)
+    print(f"intervals={count} max_days={max_days} total_days={total_days} month={year}-{month:02d}")
+    print(f"before (timedelta loop): {before:8.2f} ms")
+    print(f"after  (day bitmap)    : {after:8.2f} ms  (x{before / after:.1f})")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--year", type=int, default=2024)
+    parser.add_argument("--month", type=int, default=3)
+    parser.add_argument("--intervals", type=int, default=2000)
+    parser.add_argument("--max-days", type=int, default=365)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+    main(args.year, args.month, args.intervals, args.max_days, args.repeat, args.seed)
@@ -1,5 +1,7 @@
 from datetime import datetime, date, time
 
+from sqlalchemy import DateTime, and_, func
+
 class DatetimeUtil:
     @staticmethod
     def datetime_to_str(dt: datetime) -> str:
@@ -29,4 +31,55 @@ class DatetimeUtil:
     @staticmethod
     def str_to_time(s: str) -> time:
         """Convert string in HH:MM:SS format to time."""
-        return datetime.strptime(s, "%H:%M:%S").time()
\ No newline at end of file
+        return datetime.strptime(s, "%H:%M:%S").time()
+
+    @staticmethod
+    def month_range(year: int, month: int) -> tuple[date, date]:
+        """(year, month)를 반열린 구간 [해당 월 1일, 다음 달 1일)로 변환"""
+        start = date(year, month, 1)
+        end = date(year + 1, 1, 1) if month == 12 else date(year, month + 1, 1)
+        return start, end
+
+    @staticmethod
+    def year_range(year: int) -> tuple[date, date]:
+        """year를 반열린 구간 [해당 연도 1월 1일, 다음 연도 1월 1일)로 변환"""
+        return date(year, 1, 1), date(year + 1, 1, 1)
+
+    @staticmethod
+    def in_month(column, year: int, month: int):
+        """
+        column이 해당 월에 속하는지 비교하는 조건 (column >= 월초 AND column < 다음 달 월초)
+        extract('year'/'month', column)와 달리 column의 인덱스를 사용할 수 있습니다.
+        """
+        start, end = DatetimeUtil.month_range(year, month)
+        return DatetimeUtil._in_range(column, start, end)
+
+    @staticmethod
+    def in_year(column, year: int):
+        """column이 해당 연도에 속하는지 비교하는 조건 (인덱스 사용 가능)"""
+        start, end = DatetimeUtil.year_range(year)
+        return DatetimeUtil._in_range(column, start, end)
+
+    @staticmethod
+    def overlaps_month(start_column, end_column, year: int, month: int):
+        """
+        [start_column, end_column] 기간이 해당 월과 겹치는지 비교하는 조건 (start_column < 다음 달 월초 AND end_column >= 월초)
+        시작일만 비교하면 이전 달에 시작한 휴가/휴직이 빠지므로 기간 조회에는 이 조건을 사용합니다.
+        종료일이 없으면(NULL) month_day_mask와 같이 시작일 하루로 봅니다.
+        """
+        start, end = DatetimeUtil.month_range(year, month)
+        return and_(
+            start_column < DatetimeUtil._boundary(start_column, end),
+            func.coalesce(end_column, start_column) >= DatetimeUtil._boundary(end_column, start)
+        )
+
+    @staticmethod
+    def _in_range(column, start: date, end: date):
+        return and_(column >= DatetimeUtil._boundary(column, start), column < DatetimeUtil._boundary(column, end))
+
+    @staticmethod
+    def _boundary(column, value: date):
+        # DateTime 컬럼은 datetime 경계값으로 비교
+        if isinstance(column.type, DateTime):
+            return datetime.combine(value, time.min)
+        return value
@@ -0,0 +1,83 @@
+import base64
+import json
+from datetime import date, datetime
+from typing import Any, Callable, Optional, Sequence
+
+from fastapi import HTTPException
+from sqlalchemy import and_, or_
+
+
+class Keyset:
+    """
+    키셋(커서) 페이지네이션
+        - 정렬 컬럼 목록(마지막은 id 등 유일한 컬럼)으로 정렬하고, 이전 페이지 마지막 행 이후부터 조회합니다.
+        - OFFSET과 달리 페이지가 깊어져도 앞 페이지를 건너뛰기 위해 읽는 행이 없습니다.
+        - 커서는 마지막 행의 정렬 값을 base64url(JSON)로 감싼 문자열이며, 클라이언트는 그대로 다음 요청에 전달합니다.
+    """
+
+    def __init__(self, *columns, descending: bool = True):
+        self.columns = columns
+        self.descending = descending
+
+    def order_by(self) -> list:
+        return [column.desc() if self.descending else column.asc() for column in self.columns]
+
+    def after(self, values: Sequence[Any]):
+        """
+        커서 이후 행 조건
+        (c1, c2) < (v1, v2) 대신 c1 < v1 OR (c1 = v1 AND c2 < v2)로 풀어서 작성합니다. (MySQL 인덱스 범위 탐색 가능)
+        values에는 값 또는 bindparam을 전달할 수 있습니다.
+        """
+        conditions = []
+        for index, (column, value) in enumerate(zip(self.columns, values)):
+            compare = column < value if self.descending else column > value
+            equals = [prev_column == prev_value for prev_column, prev_value in zip(self.columns[:index], values[:index])]
+            conditions.append(and_(*equals, compare))
+        return or_(*conditions)
+
+    def paginate(self, stmt, cursor: Optional[str], size: int):
+        """정렬 + 커서 조건 + size + 1건 조회 (다음 페이지 존재 여부 확인용)"""
+        stmt = stmt.order_by(*self.order_by())
+        if cursor:
+            stmt = stmt.where(self.after(self.decode(cursor)))
+        return stmt.limit(size + 1)
+
+    def encode(self, values: Sequence[Any]) -> str:
+        payload = json.dumps([_to_json(value) for value in values], separators=(",", ":"))
+        return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+    def decode(self, cursor: str) -> list:
+        try:
+            payload = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            values = json.loads(payload)
+            if not isinstance(values, list) or len(values) != len(self.columns):
+                raise ValueError(cursor)
+            return [_from_json(column, value) for column, value in zip(self.columns, values)]
+        except ValueError:
+            raise HTTPException(status_code=400, detail="유효하지 않은 커서입니다.")
+
+    def split(self, rows: Sequence, size: int, key: Callable[[Any], Sequence[Any]]) -> tuple[list, Optional[str]]:
+        """size + 1건 조회 결과를 (현재 페이지, 다음 페이지 커서)로 분리 (마지막 페이지면 커서는 None)"""
+        rows = list(rows)
+        if len(rows) <= size:
+            return rows, None
+        rows = rows[:size]
+        return rows, self.encode(key(rows[-1]))
+
+
+def _to_json(value: Any) -> Any:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return value
+
+
+def _from_json(column, value: Any) -> Any:
+    if not isinstance(value, str):
+        return value
+    try:
+        python_type = column.type.python_type
+    except NotImplementedError:
+        return value
+    if python_type in (date, datetime):
+        return python_type.fromisoformat(value)
+    return value
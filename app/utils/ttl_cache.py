@@ -0,0 +1,79 @@
+import time
+from collections import OrderedDict
+from typing import Callable, Generic, Hashable, Optional, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    maxsize와 만료 시각이 있는 LRU 캐시 (프로세스 내 캐시들의 공통 저장소)
+
+    - store한 항목은 ttl초 뒤(또는 지정한 expires_at)에 만료되며, 만료된 항목은 lookup 시 제거됩니다.
+    - maxsize를 넘으면 가장 오래 사용하지 않은 항목부터 제거합니다.
+    - 무효화 규칙(generation/version 비교 등)과 동기화(lock)는 상속하는 캐시가 정합니다.
+    - 만료 시각은 clock 기준이며 기본은 time.monotonic입니다. (토큰 exp처럼 epoch 시각이면 time.time)
+    """
+
+    def __init__(self, maxsize: int, ttl: Optional[float] = None, clock: Callable[[], float] = time.monotonic):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.clock = clock
+        self._entries: OrderedDict[K, tuple[float, V]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, key: K, now: Optional[float] = None) -> Optional[V]:
+        """만료되지 않은 값 (없으면 None). 조회한 항목은 가장 최근 사용으로 옮깁니다."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires_at, value = entry
+            if expires_at > (self.clock() if now is None else now):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            self._drop(key)
+        self.misses += 1
+        return None
+
+    def store(self, key: K, value: V, expires_at: Optional[float] = None) -> None:
+        """값 저장 (expires_at이 없으면 지금부터 ttl초 뒤 만료)"""
+        if expires_at is None:
+            expires_at = self.clock() + self.ttl
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._drop(next(iter(self._entries)))
+            self.evictions += 1
+
+    def discard(self, key: K) -> None:
+        self._entries.pop(key, None)
+
+    def discard_where(self, predicate: Callable[[K], bool]) -> None:
+        """predicate가 참인 key의 항목 제거"""
+        for key in [key for key in self._entries if predicate(key)]:
+            del self._entries[key]
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "maxsize": self.maxsize,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": round(self.hits / total, 4) if total else 0.0,
+            "evictions": self.evictions,
+        }
+
+    def _drop(self, key: K) -> None:
+        """만료/LRU로 항목 제거 (key별 색인을 함께 관리하는 캐시는 재정의)"""
+        del self._entries[key]
@@ -0,0 +1,94 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.query_metrics import end_request_stats, instrument_engine, start_request_stats
+from app.models.branches.branches_model import Branches
+from app.models.branches.leave_categories_model import LeaveCategory
+from app.models.parts.parts_model import Parts
+from app.models.users.leave_histories_model import LeaveHistories, LeaveHistoriesSearchDto
+from app.models.users.users_model import Users
+from app.service.leave_histories_service import get_leave_histories_service
+
+WEEK_START = date(2024, 3, 4)  # 월요일
+
+
+async def seed(db: AsyncSession):
+    # 지점 2곳, 사원 10명, 일주일 동안 사원별 연차 신청 3건 (연차 종류 2가지)
+    await db.execute(insert(Branches), [
+        {"id": branch_id, "name": f"지점{branch_id}", "code": "C", "representative_name": "대표", "registration_number": "1",
+         "call_number": "1", "address": "주소", "mail_address": "mail"}
+        for branch_id in (1, 2)
+    ])
+    await db.execute(insert(Parts), [{"id": part_id, "branch_id": part_id, "name": f"파트{part_id}"} for part_id in (1, 2)])
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"사원{user_id}", "email": f"user{user_id}@test.com", "password": "pw", "gender": "남자",
+         "branch_id": user_id % 2 + 1, "part_id": user_id % 2 + 1, "deleted_yn": "N"}
+        for user_id in range(1, 11)
+    ])
+    await db.execute(insert(LeaveCategory), [
+        {"id": category_id, "branch_id": category_id, "name": f"연차{category_id}", "leave_count": 1, "is_paid": True}
+        for category_id in (1, 2)
+    ])
+    await db.execute(insert(LeaveHistories), [
+        {"user_id": user_id, "branch_id": user_id % 2 + 1, "part_id": user_id % 2 + 1, "leave_category_id": index % 2 + 1,
+         "application_date": WEEK_START + timedelta(days=(user_id + index) % 7), "decreased_days": 1,
+         "status": "pending", "deleted_yn": "N"}
+        for user_id in range(1, 11)
+        for index in range(3)
+    ])
+    await db.commit()
+
+
+async def count_statements(call) -> tuple[dict, int]:
+    stats, token = start_request_stats()
+    try:
+        response = await call()
+    finally:
+        end_request_stats(token)
+    return response, stats.count
+
+
+def list_leave_histories(db: AsyncSession, current_user, size: int, **filters):
+    return lambda: get_leave_histories_service(
+        current_user, db, LeaveHistoriesSearchDto(), WEEK_START, filters.get("branch_id"), None,
+        filters.get("search_name"), None, 1, size
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_leave_histories_statement_count_is_constant(db: AsyncSession):
+    await seed(db)
+    instrument_engine(db.bind.sync_engine)
+    admin = SimpleNamespace(id=1, role="MSO 최고권한")
+
+    counts = {}
+    for size in (1, 5, 30):
+        response, counts[size] = await count_statements(list_leave_histories(db, admin, size))
+        assert len(response["list"]) == size
+        assert response["pagination"]["total"] == 30
+        assert all(row["branch_name"] == f"지점{row['search_branch_id']}" for row in response["list"])
+        assert {row["leave_category_name"] for row in response["list"]} <= {"연차1", "연차2"}
+
+    # 목록 1회 + 개수 1회 + 회원/지점/파트 1회 + 연차 종류 1회 (페이지의 회원 수와 무관)
+    assert counts[1] == counts[5] == counts[30] == 4
+
+    # 검색 조건이 있어도 같은 횟수
+    response, count = await count_statements(list_leave_histories(db, admin, 30, branch_id=2, search_name="사원1"))
+    assert count == 4
+    assert {row["user_name"] for row in response["list"]} == {"사원1"}
+
+
+@pytest.mark.asyncio
+async def test_employee_sees_only_own_leave_histories(db: AsyncSession):
+    await seed(db)
+    instrument_engine(db.bind.sync_engine)
+    employee = SimpleNamespace(id=3, role="사원")
+
+    response, count = await count_statements(list_leave_histories(db, employee, 10))
+    assert count == 4
+    assert len(response["list"]) == 3
+    assert all(row["user_id"] == 3 and row["part_name"] == "파트2" for row in response["list"])
@@ -0,0 +1,128 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.overtimes.overtimes import bulk_approve_overtimes, bulk_reject_overtimes
+from app.models.branches.branches_model import Branches
+from app.models.branches.overtime_policies_model import OverTimePolicies
+from app.models.parts.parts_model import Parts
+from app.models.users.overtimes_model import OverTime_History, OvertimeBulkSelect, OvertimeMonthlySummary, Overtimes
+from app.models.users.users_model import Users
+from app.service import overtime_summary_service
+
+MANAGER = SimpleNamespace(id=99, name="관리자")
+MARCH = date(2024, 3, 4)
+
+
+class SQLiteUpsert(SQLiteInsert):
+    """테스트용 INSERT ... ON DUPLICATE KEY UPDATE (집계 행의 (user_id, year, month) 유니크 키 기준)"""
+    inherit_cache = True
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **values):
+        return self.on_conflict_do_update(index_elements=["user_id", "year", "month"], set_=values)
+
+
+async def seed(db: AsyncSession):
+    # 지점 1(일반 파트), 지점 2(의사 파트, 다른 정책), 지점 3(정책 없음)
+    await db.execute(insert(Branches), [
+        {"id": branch_id, "name": f"지점{branch_id}", "code": "C", "representative_name": "대표", "registration_number": "1",
+         "call_number": "1", "address": "주소", "mail_address": "mail"}
+        for branch_id in (1, 2, 3)
+    ])
+    await db.execute(insert(Parts), [
+        {"id": part_id, "branch_id": part_id, "name": f"파트{part_id}", "is_doctor": part_id == 2} for part_id in (1, 2, 3)
+    ])
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"사원{user_id}", "email": f"user{user_id}@test.com", "password": "pw", "gender": "남자",
+         "branch_id": user_id, "part_id": user_id, "deleted_yn": "N"}
+        for user_id in (1, 2, 3)
+    ])
+    await db.execute(insert(OverTimePolicies), [
+        {"branch_id": 1, "common_ot_30": 10000, "common_ot_60": 20000, "doctor_ot_30": 1, "doctor_ot_60": 1},
+        {"branch_id": 2, "common_ot_30": 1, "common_ot_60": 1, "doctor_ot_30": 30000, "doctor_ot_60": 50000},
+    ])
+
+    def overtime(overtime_id, applicant_id, hours, status, approved_money=None):
+        return {"id": overtime_id, "applicant_id": applicant_id, "overtime_hours": hours, "status": status,
+                "application_date": MARCH, "approved_money": approved_money, "deleted_yn": "N"}
+
+    await db.execute(insert(Overtimes), [
+        overtime(1, 1, "30", "pending"),
+        overtime(2, 1, "60", "approved", approved_money=20000),  # 이미 승인 (집계에 반영된 상태)
+        overtime(3, 2, "60", "pending"),                          # 다른 지점 (의사 정책)
+        overtime(4, 3, "30", "pending"),                          # 정책 없는 지점
+        overtime(5, 2, "30", "pending"),
+        overtime(6, 1, "30", "rejected"),
+    ])
+    await db.execute(insert(OvertimeMonthlySummary), [
+        {"user_id": 1, "year": 2024, "month": 3, "ot_60_count": 1, "ot_60_money": 20000}
+    ])
+    await db.commit()
+
+
+async def summaries(db: AsyncSession) -> dict:
+    result = await db.execute(select(
+        OvertimeMonthlySummary.user_id, OvertimeMonthlySummary.ot_30_count, OvertimeMonthlySummary.ot_30_money,
+        OvertimeMonthlySummary.ot_60_count, OvertimeMonthlySummary.ot_60_money
+    ))
+    return {row.user_id: tuple(row[1:]) for row in result.all()}
+
+
+async def histories(db: AsyncSession) -> list[tuple]:
+    result = await db.execute(select(
+        OverTime_History.user_id, OverTime_History.ot_30_total, OverTime_History.ot_30_money,
+        OverTime_History.ot_60_total, OverTime_History.ot_60_money
+    ).order_by(OverTime_History.id))
+    return [tuple(row) for row in result.all()]
+
+
+async def statuses(db: AsyncSession) -> dict:
+    return dict((await db.execute(select(Overtimes.id, Overtimes.status))).all())
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_and_reject_mixed_batch(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(overtime_summary_service, "mysql_insert", SQLiteUpsert)
+    await seed(db)
+
+    response = await bulk_approve_overtimes(
+        OvertimeBulkSelect(overtime_ids=[1, 2, 404, 3, 4, 1], manager_memo="일괄"), current_user=MANAGER, db=db
+    )
+    assert response["message"] == "초과 근무 2건이 승인되었습니다."
+    assert (response["succeeded"], response["failed"]) == (2, 3)
+    assert [(item["overtime_id"], item["success"], item["message"]) for item in response["results"]] == [
+        (1, True, "초과 근무 기록이 승인되었습니다."),
+        (2, False, "초과 근무 기록을 찾을 수 없습니다."),
+        (404, False, "초과 근무 기록을 찾을 수 없습니다."),
+        (3, True, "초과 근무 기록이 승인되었습니다."),
+        (4, False, "오버타임 정책을 찾을 수 없습니다."),
+    ]
+    assert await statuses(db) == {1: "approved", 2: "approved", 3: "approved", 4: "pending", 5: "pending", 6: "rejected"}
+    # 신청자 지점의 정책으로 계산 (지점 2는 의사 수당)
+    assert await histories(db) == [(1, 1, 10000, 0, 0), (2, 0, 0, 1, 50000)]
+    assert await summaries(db) == {1: (1, 10000, 1, 20000), 2: (0, 0, 1, 50000)}
+    manager = (await db.execute(select(Overtimes.manager_id, Overtimes.manager_memo).where(Overtimes.id == 3))).one()
+    assert tuple(manager) == (99, "일괄")
+
+    response = await bulk_reject_overtimes(
+        OvertimeBulkSelect(overtime_ids=[2, 5, 6, 404]), current_user=MANAGER, db=db
+    )
+    assert (response["succeeded"], response["failed"]) == (2, 2)
+    assert [(item["overtime_id"], item["success"], item["message"]) for item in response["results"]] == [
+        (2, True, "초과 근무 기록이 거절되었습니다."),
+        (5, True, "초과 근무 기록이 거절되었습니다."),
+        (6, False, "이미 거절된 오버타임 정보 입니다."),
+        (404, False, "초과 근무 기록을 찾을 수 없습니다."),
+    ]
+    assert await statuses(db) == {1: "approved", 2: "rejected", 3: "approved", 4: "pending", 5: "rejected", 6: "rejected"}
+    # 승인됐던 건만 상쇄 이력/집계 차감, 대기 건은 상태만 변경
+    assert (await histories(db))[2:] == [(1, 0, 0, -1, -20000)]
+    assert await summaries(db) == {1: (1, 10000, 0, 0), 2: (0, 0, 1, 50000)}
@@ -0,0 +1,91 @@
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.employee.overtimes.employee_overtimes import get_employee_overtimes
+from app.api.routes.overtimes.overtimes import get_overtimes
+from app.core.query_metrics import end_request_stats, instrument_engine, start_request_stats
+from app.models.branches.branches_model import Branches
+from app.models.parts.parts_model import Parts
+from app.models.users.overtimes_model import Overtimes
+from app.models.users.users_model import Users
+
+WEEK_START = date(2024, 3, 3)  # 일요일
+
+
+async def seed(db: AsyncSession):
+    # 지점 2곳, 사원 10명, 일주일 동안 사원별 초과 근무 3건
+    await db.execute(insert(Branches), [
+        {"id": branch_id, "name": f"지점{branch_id}", "code": "C", "representative_name": "대표", "registration_number": "1",
+         "call_number": "1", "address": "주소", "mail_address": "mail"}
+        for branch_id in (1, 2)
+    ])
+    await db.execute(insert(Parts), [{"id": part_id, "branch_id": part_id, "name": f"파트{part_id}"} for part_id in (1, 2)])
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"사원{user_id}", "email": f"user{user_id}@test.com", "password": "pw", "gender": "남자",
+         "branch_id": user_id % 2 + 1, "part_id": user_id % 2 + 1, "deleted_yn": "N"}
+        for user_id in range(1, 11)
+    ])
+    await db.execute(insert(Overtimes), [
+        {"applicant_id": user_id, "overtime_hours": "30", "status": "pending", "deleted_yn": "N",
+         "application_date": WEEK_START + timedelta(days=(user_id + index) % 7)}
+        for user_id in range(1, 11)
+        for index in range(3)
+    ])
+    await db.commit()
+
+
+async def count_statements(call) -> tuple[dict, int]:
+    stats, token = start_request_stats()
+    try:
+        response = await call()
+    finally:
+        end_request_stats(token)
+    return response, stats.count
+
+
+@pytest.mark.asyncio
+async def test_get_overtimes_statement_count_is_constant(db: AsyncSession):
+    await seed(db)
+    instrument_engine(db.bind.sync_engine)
+    admin = SimpleNamespace(id=1, role="MSO 최고권한")
+
+    counts = {}
+    for size in (1, 5, 30):
+        response, counts[size] = await count_statements(lambda: get_overtimes(
+            date=WEEK_START, name=None, phone_number=None, branch_id=None, part_id=None, status=None,
+            page=1, size=size, cursor=None, include_total=False, current_user=admin, db=db
+        ))
+        assert len(response["data"]) == size
+        assert response["pagination"]["total"] == 30
+        assert response["data"][0]["branch_name"].startswith("지점")
+
+    assert counts[1] == counts[5] == counts[30] == 2  # 목록 1회 + 개수 1회
+
+    # 검색 조건이 있어도 같은 조인 쿼리에 조건만 추가
+    response, count = await count_statements(lambda: get_overtimes(
+        date=WEEK_START, name="사원1", phone_number=None, branch_id=2, part_id=2, status="pend",
+        page=1, size=30, cursor=None, include_total=False, current_user=admin, db=db
+    ))
+    assert count == 2
+    assert {row["user_name"] for row in response["data"]} == {"사원1"}
+
+
+@pytest.mark.asyncio
+async def test_get_employee_overtimes_statement_count_is_constant(db: AsyncSession):
+    await seed(db)
+    instrument_engine(db.bind.sync_engine)
+    employee = SimpleNamespace(id=3, role="사원")
+
+    counts = {}
+    for size in (1, 3):
+        response, counts[size] = await count_statements(
+            lambda: get_employee_overtimes(date=WEEK_START, page=1, size=size, current_user=employee, db=db)
+        )
+        assert len(response["data"]) == size
+        assert all(row["applicant_id"] == 3 and row["part_name"] == "파트2" for row in response["data"])
+
+    assert counts[1] == counts[3] == 2
@@ -6,14 +6,14 @@ from fastapi.testclient import TestClient
 from app.middleware.jwt.jwtService import JWTService
 from app.middleware.jwt.jwtEncoder import JWTEncoder
 from app.middleware.jwt.jwtDecoder import JWTDecoder
-from sqlalchemy.pool import NullPool
+from sqlalchemy.pool import StaticPool
 
 
 @pytest.fixture(scope="function")
 async def db():
     engine = create_async_engine(
         "sqlite+aiosqlite://",
-        poolclass=NullPool,
+        poolclass=StaticPool,  # 메모리 DB는 커넥션마다 새로 생성되므로 하나의 커넥션을 공유
         pool_pre_ping=True,
         pool_recycle=3600,
         connect_args={"check_same_thread": False}
@@ -0,0 +1,35 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import insert
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.closed_days.closed_days_model import ClosedDays, EarlyClockIn
+
+
+@pytest.mark.asyncio
+async def test_branch_closed_day_is_unique_per_date(db: AsyncSession):
+    # 직원별 휴무일은 직원마다 따로, 지점 휴무일(user_id NULL)은 지점마다 하루 한 건
+    await db.execute(insert(ClosedDays), [
+        {"branch_id": 1, "user_id": None, "closed_day_date": date(2024, 3, 1)},
+        {"branch_id": 1, "user_id": 1, "closed_day_date": date(2024, 3, 1)},
+        {"branch_id": 1, "user_id": 2, "closed_day_date": date(2024, 3, 1)},
+        {"branch_id": 2, "user_id": None, "closed_day_date": date(2024, 3, 1)},
+    ])
+
+    with pytest.raises(IntegrityError):
+        await db.execute(insert(ClosedDays).values(branch_id=1, user_id=None, closed_day_date=date(2024, 3, 1)))
+
+
+@pytest.mark.asyncio
+async def test_early_clock_in_is_unique_per_user_date(db: AsyncSession):
+    await db.execute(insert(EarlyClockIn), [
+        {"branch_id": 1, "user_id": 1, "early_clock_in": datetime(2024, 3, 1, 9, 0)},
+        {"branch_id": 1, "user_id": 1, "early_clock_in": datetime(2024, 3, 2, 9, 0)},
+        {"branch_id": 1, "user_id": 2, "early_clock_in": datetime(2024, 3, 1, 9, 0)},
+    ])
+
+    # 같은 날 다른 시간도 중복
+    with pytest.raises(IntegrityError):
+        await db.execute(insert(EarlyClockIn).values(branch_id=1, user_id=1, early_clock_in=datetime(2024, 3, 1, 9, 30)))
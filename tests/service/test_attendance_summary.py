@@ -0,0 +1,156 @@
+from datetime import date, datetime
+
+import pytest
+from sqlalchemy import event, insert, select
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.branches.leave_categories_model import LeaveCategory
+from app.models.branches.rest_days_model import RestDays
+from app.models.closed_days.closed_days_model import ClosedDays
+from app.models.commutes.commutes_model import AttendanceMonthlySummary, Commutes
+from app.models.users.leave_histories_model import LeaveHistories
+from app.models.users.users_model import Users
+from app.service import attendance_summary_service
+from app.service.attendance_summary_service import (
+    compute_attendance_summaries, default_regular_leave_days, months_between, refresh_attendance_summaries
+)
+
+
+class SQLiteUpsert(SQLiteInsert):
+    """테스트용 INSERT ... ON DUPLICATE KEY UPDATE (집계 행의 (user_id, year, month) 유니크 키 기준)"""
+    inherit_cache = True
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **values):
+        return self.on_conflict_do_update(index_elements=["user_id", "year", "month"], set_=values)
+
+
+def test_months_between():
+    assert months_between(date(2024, 11, 20), date(2025, 2, 1)) == [(2024, 11), (2024, 12), (2025, 1), (2025, 2)]
+    assert months_between(date(2024, 3, 1), date(2024, 3, 31)) == [(2024, 3)]
+
+
+@pytest.mark.asyncio
+async def test_compute_attendance_summaries(db: AsyncSession):
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"u{user_id}", "email": f"u{user_id}", "password": "p", "gender": "남자", "branch_id": 1, "deleted_yn": "N"}
+        for user_id in (1, 2)
+    ])
+    await db.execute(insert(Commutes), [
+        # 같은 날 두 번 출근해도 하루, 다음 달 1일은 제외
+        {"user_id": 1, "clock_in": datetime(2024, 3, 4, 9), "work_hours": 4, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 3, 4, 14), "work_hours": 4, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 3, 1, 9), "work_hours": 8, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 3, 9, 9), "work_hours": 5, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 4, 1, 9), "work_hours": 8, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 3, 5, 9), "work_hours": 8, "deleted_yn": "Y"},
+    ])
+    await db.execute(insert(RestDays), [
+        {"branch_id": 1, "date": date(2024, 3, 1), "rest_type": "공휴일", "deleted_yn": "N"},
+        {"branch_id": 1, "date": date(2024, 3, 9), "rest_type": "주말", "deleted_yn": "N"},
+    ])
+    await db.execute(insert(ClosedDays), [
+        # 지점 휴무 하루 + 일요일과 겹치는 본인 휴무 하루
+        {"branch_id": 1, "user_id": None, "closed_day_date": date(2024, 3, 12), "deleted_yn": "N"},
+        {"branch_id": 1, "user_id": 2, "closed_day_date": date(2024, 3, 13), "deleted_yn": "N"},
+        {"branch_id": 1, "user_id": 2, "closed_day_date": date(2024, 3, 17), "deleted_yn": "N"},
+    ])
+    await db.execute(insert(LeaveCategory), [
+        {"id": 1, "branch_id": 1, "name": "연차", "leave_count": 1, "is_paid": True},
+        {"id": 2, "branch_id": 1, "name": "무급", "leave_count": 1, "is_paid": False},
+    ])
+    await db.execute(insert(LeaveHistories), [
+        # 이전 달부터 이어지는 연차는 3월분만, 겹치는 날짜는 한 번만
+        {"part_id": 1, "branch_id": 1, "user_id": 2, "leave_category_id": 1, "application_date": date(2024, 2, 27), "start_date": date(2024, 2, 27), "end_date": date(2024, 3, 2), "status": "approved", "deleted_yn": "N"},
+        {"part_id": 1, "branch_id": 1, "user_id": 2, "leave_category_id": 1, "application_date": date(2024, 3, 2), "start_date": date(2024, 3, 2), "end_date": date(2024, 3, 3), "status": "approved", "deleted_yn": "N"},
+        {"part_id": 1, "branch_id": 1, "user_id": 2, "leave_category_id": 2, "application_date": date(2024, 3, 20), "start_date": date(2024, 3, 20), "end_date": date(2024, 3, 21), "status": "approved", "deleted_yn": "N"},
+        {"part_id": 1, "branch_id": 1, "user_id": 2, "leave_category_id": 2, "application_date": date(2024, 3, 25), "start_date": date(2024, 3, 25), "end_date": date(2024, 3, 25), "status": "pending", "deleted_yn": "N"},
+        # 종료일이 없는 연차는 시작일 하루
+        {"part_id": 1, "branch_id": 1, "user_id": 2, "leave_category_id": 1, "application_date": date(2024, 3, 28), "start_date": date(2024, 3, 28), "end_date": None, "status": "approved", "deleted_yn": "N"},
+    ])
+
+    summaries = await compute_attendance_summaries(db, 2024, 3)
+
+    assert summaries[1] == {
+        "work_days": 3,
+        "regular_leave_days": 6,
+        "annual_leave_days": 0,
+        "unpaid_leave_days": 0,
+        "holiday_work_days": 1,
+        "weekend_work_hours": 5.0,
+    }
+    assert summaries[2] == {
+        "work_days": 0,
+        "regular_leave_days": 7,
+        "annual_leave_days": 4,
+        "unpaid_leave_days": 2,
+        "holiday_work_days": 0,
+        "weekend_work_hours": 0.0,
+    }
+    assert await compute_attendance_summaries(db, 2024, 3, user_ids=[2]) == {2: summaries[2]}
+
+    # 집계 행이 없는 사용자: 일요일 5일 + 지점 휴무 하루 (본인 휴무는 제외)
+    assert await default_regular_leave_days(db, 2024, 3, [1, 2]) == {1: 6, 2: 5}
+
+
+@pytest.mark.asyncio
+async def test_refresh_locks_summary_rows_in_order_and_commits(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(attendance_summary_service, "mysql_insert", SQLiteUpsert)
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"u{user_id}", "email": f"u{user_id}", "password": "p", "gender": "남자", "branch_id": branch_id, "deleted_yn": "N"}
+        for user_id, branch_id in ((3, 1), (1, 1), (2, 2))
+    ])
+    await db.execute(insert(Commutes), [
+        {"user_id": 3, "clock_in": datetime(2024, 3, 4, 9), "work_hours": 8, "deleted_yn": "N"},
+        {"user_id": 1, "clock_in": datetime(2024, 4, 2, 9), "work_hours": 8, "deleted_yn": "N"},
+    ])
+    await db.execute(insert(AttendanceMonthlySummary), [
+        {"user_id": 3, "year": 2024, "month": 3, "work_days": 9},
+        {"user_id": 2, "year": 2024, "month": 3, "work_days": 9},
+    ])
+    # 원천 변경은 호출 전에 커밋
+    await db.commit()
+
+    statements = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.startswith("INSERT INTO attendance_monthly_summaries"):
+            statements.append([tuple(row[:3]) for row in parameters] if executemany else [tuple(parameters[:3])])
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        await refresh_attendance_summaries(db, [(2024, 4), (2024, 3), (2024, 4)], branch_ids=[1])
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+    # 첫 문장은 대상 집계 행 전체를 (user_id, year, month) 순서로 잠그는 upsert, 이후 월별 기록
+    assert statements[0] == [(1, 2024, 3), (1, 2024, 4), (3, 2024, 3), (3, 2024, 4)]
+    assert len(statements) == 3
+    # 자체 트랜잭션으로 커밋하고 끝남
+    assert not db.in_transaction()
+
+    rows = (await db.execute(
+        select(AttendanceMonthlySummary.user_id, AttendanceMonthlySummary.year, AttendanceMonthlySummary.month, AttendanceMonthlySummary.work_days)
+        .order_by(AttendanceMonthlySummary.user_id, AttendanceMonthlySummary.month)
+    )).all()
+    assert rows == [(1, 2024, 3, 0), (1, 2024, 4, 1), (2, 2024, 3, 9), (3, 2024, 3, 1), (3, 2024, 4, 0)]
+
+
+@pytest.mark.asyncio
+async def test_refresh_failure_is_logged_not_raised(db: AsyncSession, caplog):
+    await db.execute(insert(Users), [
+        {"id": 1, "name": "u1", "email": "u1", "password": "p", "gender": "남자", "branch_id": 1, "deleted_yn": "N"}
+    ])
+    await db.commit()
+
+    # sqlite에서는 ON DUPLICATE KEY UPDATE를 실행할 수 없어 실패 - 원천 커밋은 이미 끝났으므로 예외 대신 기록만 남김
+    await refresh_attendance_summaries(db, [(2024, 3)], user_ids=[1])
+
+    assert "attendance summary refresh failed" in caplog.text
+    assert not db.in_transaction()
+    assert await db.scalar(select(Users.name).where(Users.id == 1)) == "u1"
@@ -0,0 +1,46 @@
+from datetime import date
+
+from app.service.closed_day_calendar_cache import BranchMonthCalendar, ClosedDayCalendarCache, weekday_dates
+
+EMPTY = BranchMonthCalendar(hospital_closed_days=(), user_off_days={}, early_clock_ins=())
+
+
+def test_weekday_dates():
+    # 2024년 3월 일요일 (3, 10, 17, 24, 31일)
+    assert weekday_dates(2024, 3, 6) == [date(2024, 3, day) for day in (3, 10, 17, 24, 31)]
+    # 시작일 이전은 제외
+    assert weekday_dates(2024, 3, 6, date(2024, 3, 11)) == [date(2024, 3, day) for day in (17, 24, 31)]
+    assert weekday_dates(2024, 12, 0, date(2025, 1, 1)) == []
+
+
+def test_invalidate_removes_only_branch_months():
+    cache = ClosedDayCalendarCache()
+    for branch_id in (1, 2):
+        for month in (1, 2):
+            cache.set(branch_id, 2024, month, EMPTY)
+
+    cache.invalidate(1)
+    assert cache.get(1, 2024, 1) is None and cache.get(1, 2024, 2) is None
+    assert cache.get(2, 2024, 1) is EMPTY
+
+    cache.invalidate_all()
+    assert cache.get(2, 2024, 1) is None
+
+
+def test_stale_snapshot_is_not_stored():
+    cache = ClosedDayCalendarCache()
+
+    # 조회 중에 지점 휴무가 변경된 경우
+    generation = cache.generation(1)
+    cache.invalidate(1)
+    cache.set(1, 2024, 3, EMPTY, generation)
+    assert cache.get(1, 2024, 3) is None
+
+    # 조회 중에 근로계약이 변경된 경우
+    generation = cache.generation(1)
+    cache.invalidate_all()
+    cache.set(1, 2024, 3, EMPTY, generation)
+    assert cache.get(1, 2024, 3) is None
+
+    cache.set(1, 2024, 3, EMPTY, cache.generation(1))
+    assert cache.get(1, 2024, 3) is EMPTY
@@ -0,0 +1,141 @@
+from datetime import date
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import PrimaryKeyConstraint, UniqueConstraint, insert, select
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.enums.users import LeaveLedgerType, Status
+from app.models.branches.user_leaves_days import UserLeavesDays
+from app.models.users.leave_histories_model import LeaveHistories, LeaveHistoriesBulkApprove
+from app.models.users.leave_ledger_model import LeaveLedger
+from app.models.users.users_model import Users
+from app.service import attendance_summary_service, leave_ledger_service
+from app.service.leave_histories_service import bulk_approve_leaves_service
+from app.service.leave_ledger_service import get_leave_balance, leave_status_entry, reconcile_leave_balances
+
+YEAR = date.today().year
+MANAGER_ID = 9
+
+
+class SQLiteUpsert(SQLiteInsert):
+    """테스트용 INSERT ... ON DUPLICATE KEY UPDATE (유니크 키가 있으면 유니크 키, 없으면 기본 키 기준)"""
+    inherit_cache = True
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **values):
+        unique = next(
+            (constraint for constraint in self.table.constraints
+             if isinstance(constraint, UniqueConstraint) and not isinstance(constraint, PrimaryKeyConstraint)),
+            self.table.primary_key
+        )
+        return self.on_conflict_do_update(index_elements=[column.name for column in unique.columns], set_=values)
+
+
+def leave(leave_id: int, user_id: int, days: int, status: str, branch_id: int = 1) -> dict:
+    return {
+        "id": leave_id, "part_id": 1, "branch_id": branch_id, "user_id": user_id, "leave_category_id": 1,
+        "decreased_days": days, "application_date": date(YEAR, 3, 4), "start_date": date(YEAR, 3, 4 + leave_id),
+        "end_date": date(YEAR, 3, 4 + leave_id), "status": status, "deleted_yn": "N",
+    }
+
+
+async def seed(db: AsyncSession):
+    # 지점 1의 사원 1(15일), 사원 2(10일, 1일 승인 사용), 지점 2의 사원 3, 관리자
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"u{user_id}", "email": f"u{user_id}", "password": "p", "gender": "남자",
+         "branch_id": branch_id, "part_id": 1, "total_leave_days": 0, "deleted_yn": "N"}
+        for user_id, branch_id in ((1, 1), (2, 1), (3, 2), (MANAGER_ID, 1))
+    ])
+    for user_id, days in ((1, 15), (2, 10), (3, 5)):
+        await leave_ledger_service.set_total_leave_days(db, await db.get(Users, user_id), days, LeaveLedgerType.MANUAL)
+    await db.execute(insert(UserLeavesDays), [
+        {"id": user_id, "user_id": user_id, "part_id": 1, "branch_id": branch_id, "total_leave_days": days}
+        for user_id, branch_id, days in ((1, 1, 15), (2, 1, 9), (3, 2, 5))
+    ])
+
+    leaves = [
+        leave(1, 1, 2, "pending"),
+        leave(2, 1, 1, "pending"),
+        leave(3, 2, 3, "pending"),
+        leave(4, 2, 1, "approved"),              # 이미 승인
+        leave(5, 3, 1, "pending", branch_id=2),  # 다른 지점
+        leave(6, 2, 20, "pending"),             # 잔여 부족
+    ]
+    await db.execute(insert(LeaveHistories), leaves)
+    # 신청/승인 당시의 원장과 잔여 연차
+    await db.execute(Users.__table__.update().where(Users.id == 2).values(total_leave_days=9))
+    await leave_ledger_service.record_leave_ledger(db, [
+        leave_status_entry(LeaveHistories(**row), None, Status.PENDING, LeaveLedgerType.REQUEST) for row in leaves
+    ] + [
+        leave_status_entry(LeaveHistories(**leaves[3]), Status.PENDING, Status.APPROVED, LeaveLedgerType.APPROVE)
+    ])
+    await db.commit()
+
+
+async def leave_days(db: AsyncSession) -> dict:
+    users = dict((await db.execute(select(Users.id, Users.total_leave_days).where(Users.id.in_([1, 2, 3])))).all())
+    records = dict((await db.execute(select(UserLeavesDays.user_id, UserLeavesDays.total_leave_days))).all())
+    return {user_id: (users[user_id], records[user_id]) for user_id in users}
+
+
+async def balance(db: AsyncSession, user_id: int) -> tuple:
+    row = await get_leave_balance(db, user_id, YEAR)
+    await db.refresh(row)
+    return row.granted_days, row.used_days, row.pending_days
+
+
+@pytest.mark.asyncio
+async def test_bulk_approve_and_reject_leaves(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(leave_ledger_service, "mysql_insert", SQLiteUpsert)
+    monkeypatch.setattr(attendance_summary_service, "mysql_insert", SQLiteUpsert)
+    await seed(db)
+    assert await reconcile_leave_balances(db) == []
+
+    response = await bulk_approve_leaves_service(
+        LeaveHistoriesBulkApprove(leave_ids=[1, 2, 3, 4, 5, 404, 6], status=Status.APPROVED), 1, MANAGER_ID, db
+    )
+    assert response["message"] == "연차 3건이 승인되었습니다."
+    assert (response["succeeded"], response["failed"]) == (3, 4)
+    assert [(item["leave_id"], item["success"], item["message"]) for item in response["results"]] == [
+        (1, True, "연차 승인에 성공하였습니다."),
+        (2, True, "연차 승인에 성공하였습니다."),
+        (3, True, "연차 승인에 성공하였습니다."),
+        (4, False, "이미 승인된 연차입니다."),
+        (5, False, "해당 연차를 찾을 수 없습니다."),
+        (404, False, "해당 연차를 찾을 수 없습니다."),
+        # 같은 사용자의 앞선 승인(3일)을 차감한 잔여로 검사
+        (6, False, "승인 불가: 신청 일수(20.00일)가 남은 연차 일수(6.00일)보다 많습니다."),
+    ]
+
+    statuses = dict((await db.execute(select(LeaveHistories.id, LeaveHistories.status))).all())
+    assert statuses == {1: "approved", 2: "approved", 3: "approved", 4: "approved", 5: "pending", 6: "pending"}
+    # 두 사용자 모두 잔여 연차와 연차 일수 정보가 함께 차감되고, 다른 지점 사용자는 그대로
+    assert await leave_days(db) == {1: (12, 12), 2: (6, 6), 3: (5, 5)}
+
+    # 처리한 건마다 승인 원장 1건 (대기 -> 사용)
+    approvals = (await db.execute(
+        select(LeaveLedger.leave_history_id, LeaveLedger.used_days, LeaveLedger.pending_days)
+        .where(LeaveLedger.entry_type == LeaveLedgerType.APPROVE.value, LeaveLedger.leave_history_id != 4)
+        .order_by(LeaveLedger.leave_history_id)
+    )).all()
+    assert approvals == [(1, 2, -2), (2, 1, -1), (3, 3, -3)]
+    assert await balance(db, 1) == (15, 3, 0)
+    assert await balance(db, 2) == (10, 4, 20)
+    assert await reconcile_leave_balances(db) == []
+
+    # 승인된 건 반려 시 연차 일수 복원, 다른 지점 건은 실패
+    response = await bulk_approve_leaves_service(
+        LeaveHistoriesBulkApprove(leave_ids=[4, 3, 5], status=Status.REJECTED), 1, MANAGER_ID, db
+    )
+    assert [(item["leave_id"], item["success"]) for item in response["results"]] == [(4, True), (3, True), (5, False)]
+    assert await leave_days(db) == {1: (12, 12), 2: (10, 10), 3: (5, 5)}
+    assert await balance(db, 2) == (10, 0, 20)
+    assert await reconcile_leave_balances(db) == []
+    assert await db.scalar(
+        select(LeaveLedger.used_days).where(LeaveLedger.entry_type == LeaveLedgerType.REJECT.value, LeaveLedger.leave_history_id == 3)
+    ) == Decimal("-3")
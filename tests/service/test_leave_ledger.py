@@ -0,0 +1,81 @@
+from datetime import date
+from decimal import Decimal
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.cruds.leave_histories.leave_histories_crud import update_user_total_leave_days
+from app.enums.users import LeaveLedgerType, Status
+from app.models.users.leave_ledger_model import LeaveLedger
+from app.models.users.users_model import Users
+from app.service import leave_ledger_service
+from app.service.annual_leave_grant_service import GrantPlan
+
+
+class SQLiteUpsert(SQLiteInsert):
+    """테스트용 INSERT ... ON DUPLICATE KEY UPDATE (sqlite ON CONFLICT DO UPDATE)"""
+    inherit_cache = True
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **values):
+        return self.on_conflict_do_update(index_elements=[column.name for column in self.table.primary_key], set_=values)
+
+
+def on(day: date):
+    return type("Today", (date,), {"today": classmethod(lambda cls: day)})
+
+
+@pytest.mark.asyncio
+async def test_balance_carries_over_year_boundary(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(leave_ledger_service, "mysql_insert", SQLiteUpsert)
+    await db.execute(insert(Users), [
+        {"id": 1, "name": "u1", "email": "u1", "password": "p", "gender": "남자", "branch_id": 1, "total_leave_days": 3, "deleted_yn": "N"}
+    ])
+    user = await db.get(Users, 1)
+    leave = SimpleNamespace(id=None, user_id=1, decreased_days=2)
+
+    # 2025년: 15일 수동 부여, 12월에 2일 신청 (대기)
+    monkeypatch.setattr(leave_ledger_service, "date", on(date(2025, 12, 30)))
+    await leave_ledger_service.set_total_leave_days(db, user, 18, LeaveLedgerType.MANUAL)
+    await leave_ledger_service.record_leave_ledger(db, [
+        leave_ledger_service.leave_status_entry(leave, None, Status.PENDING, LeaveLedgerType.REQUEST)
+    ])
+    balance_2025 = await leave_ledger_service.get_leave_balance(db, 1, 2025)
+    assert (balance_2025.granted_days, balance_2025.pending_days, balance_2025.remaining_days) == (18, 2, 18)
+
+    # 2026년: 승인 (잔여 연차 차감 후 원장 기록)
+    monkeypatch.setattr(leave_ledger_service, "date", on(date(2026, 1, 2)))
+    await update_user_total_leave_days(1, Decimal("2"), db)
+    await leave_ledger_service.record_leave_ledger(db, [
+        leave_ledger_service.leave_status_entry(leave, Status.PENDING, Status.APPROVED, LeaveLedgerType.APPROVE)
+    ])
+
+    total_leave_days = await db.scalar(select(Users.total_leave_days).where(Users.id == 1))
+    balance_2026 = await leave_ledger_service.get_leave_balance(db, 1, 2026)
+    assert total_leave_days == 16
+    assert balance_2026.remaining_days == total_leave_days
+    assert (balance_2026.granted_days, balance_2026.used_days, balance_2026.pending_days) == (18, 2, 0)
+
+    # 이월 잔여는 기초 원장으로 남고, 원장 합계와 잔여가 일치
+    openings = (await db.execute(
+        select(LeaveLedger.year, LeaveLedger.granted_days, LeaveLedger.pending_days)
+        .where(LeaveLedger.entry_type == LeaveLedgerType.OPENING.value)
+        .order_by(LeaveLedger.year)
+    )).all()
+    assert openings == [(2025, 3, 0), (2026, 18, 2)]
+    assert await leave_ledger_service.reconcile_leave_balances(db) == []
+
+
+def test_reset_grant_records_grant_and_expired_separately():
+    totals = np.array([4.0, 4.0, 0.0])
+    plan = GrantPlan(granted=np.array([15.0, 1.0, 0.0]), reset=np.array([True, False, False]))
+
+    assert plan.new_totals(totals).tolist() == [15.0, 5.0, 0.0]
+    assert plan.expired(totals).tolist() == [4.0, 0.0, 0.0]
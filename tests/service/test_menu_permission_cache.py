@@ -0,0 +1,40 @@
+import pytest
+
+from app.core.permissions.menu_permission_cache import MenuPermissionCache
+
+
+class CountingCache(MenuPermissionCache):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.compiled = []
+
+    async def _compile(self, db, user_id):
+        self.compiled.append(user_id)
+        return {1: user_id}
+
+
+@pytest.mark.asyncio
+async def test_entries_are_bounded_by_lru():
+    cache = CountingCache(maxsize=2)
+    for user_id in (1, 2, 1, 3):
+        await cache.get_part_bitsets(None, user_id)
+
+    # 2번이 가장 오래 사용되지 않아 제거됨
+    assert cache.stats()["size"] == 2 and cache.evictions == 1
+    await cache.get_part_bitsets(None, 1)
+    await cache.get_part_bitsets(None, 2)
+    assert cache.compiled == [1, 2, 3, 2]
+
+
+@pytest.mark.asyncio
+async def test_expired_or_invalidated_entries_are_recompiled():
+    cache = CountingCache(ttl=0)
+    await cache.get_part_bitsets(None, 1)
+    await cache.get_part_bitsets(None, 1)
+    assert cache.compiled == [1, 1]
+
+    cache = CountingCache()
+    assert await cache.get_bitset(None, 1, 1) == 1
+    cache.invalidate(1)
+    await cache.get_bitset(None, 1, 1)
+    assert cache.compiled == [1, 1] and cache.hits == 0
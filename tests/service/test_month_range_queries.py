@@ -0,0 +1,136 @@
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import and_, extract, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.closed_days.closed_days_model import ClosedDays
+from app.models.commutes.commutes_model import Commutes
+from app.enums.users import TimeOffType
+from app.models.users.time_off_model import TimeOff
+from app.utils.datetime_utils import DatetimeUtil
+
+
+async def seed(db: AsyncSession):
+    # 사용자 20명 x 1년치 출퇴근 기록, 지점 5곳 x 1년치 휴무일
+    start = datetime(2024, 1, 1, 9, 0)
+    await db.execute(insert(Commutes), [
+        {"user_id": user_id, "clock_in": start + timedelta(days=day), "deleted_yn": "N"}
+        for user_id in range(1, 21)
+        for day in range(366)
+    ])
+    await db.execute(insert(ClosedDays), [
+        {"branch_id": branch_id, "closed_day_date": date(2024, 1, 1) + timedelta(days=day), "deleted_yn": "N"}
+        for branch_id in range(1, 6)
+        for day in range(0, 366, 3)
+    ])
+    await db.execute(text("ANALYZE"))
+
+
+async def explain(db: AsyncSession, stmt) -> str:
+    compiled = stmt.compile(db.bind, compile_kwargs={"literal_binds": True})
+    result = await db.execute(text(f"EXPLAIN QUERY PLAN {compiled}"))
+    return " ".join(row[-1] for row in result.fetchall())
+
+
+def test_month_range_is_half_open():
+    assert DatetimeUtil.month_range(2024, 2) == (date(2024, 2, 1), date(2024, 3, 1))
+    assert DatetimeUtil.month_range(2024, 12) == (date(2024, 12, 1), date(2025, 1, 1))
+    assert DatetimeUtil.year_range(2024) == (date(2024, 1, 1), date(2025, 1, 1))
+
+
+@pytest.mark.asyncio
+async def test_commutes_month_filter_uses_composite_index(db: AsyncSession):
+    await seed(db)
+
+    stmt = select(Commutes.id).where(
+        Commutes.user_id == 3,
+        DatetimeUtil.in_month(Commutes.clock_in, 2024, 2),
+        Commutes.deleted_yn == "N",
+    )
+    plan = await explain(db, stmt)
+    assert "idx_commutes_user_id_clock_in" in plan
+    assert "clock_in>" in plan and "clock_in<" in plan  # 범위 조건이 인덱스 키로 사용됨
+
+    # extract()는 인덱스에서 user_id까지만 사용 가능
+    legacy_stmt = select(Commutes.id).where(
+        Commutes.user_id == 3,
+        extract('year', Commutes.clock_in) == 2024,
+        extract('month', Commutes.clock_in) == 2,
+    )
+    assert "clock_in>" not in await explain(db, legacy_stmt)
+
+    result = await db.execute(stmt)
+    assert len(result.all()) == 29
+
+
+@pytest.mark.asyncio
+async def test_commute_date_lookup_uses_composite_index(db: AsyncSession):
+    await seed(db)
+
+    # 출근 당일 중복 확인/퇴근 대상 조회
+    stmt = select(Commutes.id).where(
+        Commutes.user_id == 3,
+        Commutes.commute_date == date(2024, 2, 29),
+        Commutes.deleted_yn == "N",
+    )
+    plan = await explain(db, stmt)
+    assert "idx_commutes_user_id_commute_date" in plan
+    assert "commute_date=" in plan
+    assert len((await db.execute(stmt)).all()) == 1
+
+    # 월 단위 집계도 저장된 날짜 컬럼으로 범위 조회
+    month_stmt = select(Commutes.commute_date).where(
+        Commutes.user_id == 3,
+        DatetimeUtil.in_month(Commutes.commute_date, 2024, 2),
+        Commutes.deleted_yn == "N",
+    )
+    assert "commute_date>" in await explain(db, month_stmt)
+    assert (await db.scalars(month_stmt)).all() == [date(2024, 2, 1) + timedelta(days=day) for day in range(29)]
+
+
+@pytest.mark.asyncio
+async def test_closed_days_month_filter_uses_composite_index(db: AsyncSession):
+    await seed(db)
+
+    stmt = select(ClosedDays.closed_day_date).where(
+        and_(
+            ClosedDays.branch_id == 2,
+            DatetimeUtil.in_month(ClosedDays.closed_day_date, 2024, 12),
+            ClosedDays.deleted_yn == "N",
+        )
+    )
+    plan = await explain(db, stmt)
+    assert "idx_closed_days_branch_id_closed_day_date" in plan
+    assert "closed_day_date>" in plan and "closed_day_date<" in plan
+
+    result = await db.execute(stmt)
+    assert all(row.closed_day_date.month == 12 for row in result.all())
+
+
+@pytest.mark.asyncio
+async def test_time_off_month_overlap_uses_interval_index(db: AsyncSession):
+    # 사용자별로 2주마다 시작하는 40일짜리 휴직 (이전 달에 시작해 해당 월에 걸치는 기간 포함)
+    await db.execute(insert(TimeOff), [
+        {"user_id": user_id, "time_off_type": TimeOffType.PARENTAL, "start_date": datetime(2023, 12, 1) + timedelta(days=day),
+         "end_date": datetime(2023, 12, 1) + timedelta(days=day + 40), "deleted_yn": "N"}
+        for user_id in range(1, 21)
+        for day in range(0, 366, 14)
+    ])
+    await db.execute(text("ANALYZE"))
+
+    stmt = select(TimeOff.start_date, TimeOff.end_date).where(
+        TimeOff.user_id == 3,
+        DatetimeUtil.overlaps_month(TimeOff.start_date, TimeOff.end_date, 2024, 3),
+    )
+    plan = await explain(db, stmt)
+    assert "idx_time_offs_user_id_start_date_end_date" in plan
+    assert "start_date<" in plan
+
+    result = await db.execute(stmt)
+    periods = result.all()
+    month_start, next_month_start = datetime(2024, 3, 1), datetime(2024, 4, 1)
+    assert all(start < next_month_start and end >= month_start for start, end in periods)
+    # 시작일 기준 조회로는 빠지는, 이전 달에 시작한 휴직도 포함
+    assert any(start < month_start for start, _ in periods)
+    assert len(periods) == 5
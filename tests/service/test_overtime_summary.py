@@ -0,0 +1,99 @@
+from datetime import date
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, insert, select, update
+from sqlalchemy.dialects.sqlite import Insert as SQLiteInsert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.routes.overtimes.overtimes import approve_overtime, reject_overtime
+from app.models.branches.branches_model import Branches
+from app.models.branches.overtime_policies_model import OverTimePolicies
+from app.models.parts.parts_model import Parts
+from app.models.users.overtimes_model import OverTime_History, OvertimeMonthlySummary, OvertimeSelect, Overtimes
+from app.models.users.users_model import Users
+from app.service import overtime_summary_service
+from app.service.overtime_service import bulk_process_overtimes_service
+from app.service.overtime_summary_service import rebuild_overtime_monthly_summaries
+
+MANAGER = SimpleNamespace(id=99, name="관리자")
+
+
+class SQLiteUpsert(SQLiteInsert):
+    """테스트용 INSERT ... ON DUPLICATE KEY UPDATE (집계 행의 (user_id, year, month) 유니크 키 기준)"""
+    inherit_cache = True
+
+    @property
+    def inserted(self):
+        return self.excluded
+
+    def on_duplicate_key_update(self, **values):
+        return self.on_conflict_do_update(index_elements=["user_id", "year", "month"], set_=values)
+
+
+async def seed(db: AsyncSession):
+    await db.execute(insert(Branches), [
+        {"id": 1, "name": "지점1", "code": "C", "representative_name": "대표", "registration_number": "1",
+         "call_number": "1", "address": "주소", "mail_address": "mail"}
+    ])
+    await db.execute(insert(Parts), [{"id": 1, "branch_id": 1, "name": "파트1", "is_doctor": False}])
+    await db.execute(insert(Users), [
+        {"id": user_id, "name": f"사원{user_id}", "email": f"user{user_id}@test.com", "password": "pw", "gender": "남자",
+         "branch_id": 1, "part_id": 1, "deleted_yn": "N"}
+        for user_id in (1, 2)
+    ])
+    await db.execute(insert(OverTimePolicies), [
+        {"id": 1, "branch_id": 1, "common_ot_30": 10000, "common_ot_60": 20000, "doctor_ot_30": 1, "doctor_ot_60": 1}
+    ])
+    await db.execute(insert(Overtimes), [
+        {"id": 1, "applicant_id": 1, "overtime_hours": "30", "status": "pending", "application_date": date(2024, 3, 4), "deleted_yn": "N"},
+        {"id": 2, "applicant_id": 2, "overtime_hours": "60", "status": "pending", "application_date": date(2024, 3, 5), "deleted_yn": "N"},
+        {"id": 3, "applicant_id": 1, "overtime_hours": "30", "status": "pending", "application_date": date(2024, 3, 6), "deleted_yn": "N"},
+    ])
+    await db.commit()
+
+
+async def summaries(db: AsyncSession) -> dict:
+    result = await db.execute(select(
+        OvertimeMonthlySummary.user_id, OvertimeMonthlySummary.ot_30_count, OvertimeMonthlySummary.ot_30_money,
+        OvertimeMonthlySummary.ot_60_count, OvertimeMonthlySummary.ot_60_money
+    ))
+    return {row.user_id: tuple(row[1:]) for row in result.all()}
+
+
+async def history_money(db: AsyncSession) -> dict:
+    result = await db.execute(
+        select(OverTime_History.user_id, func.sum(OverTime_History.ot_30_money + OverTime_History.ot_60_money))
+        .group_by(OverTime_History.user_id)
+    )
+    return dict(result.all())
+
+
+@pytest.mark.asyncio
+async def test_reject_subtracts_money_recorded_at_approval(db: AsyncSession, monkeypatch):
+    monkeypatch.setattr(overtime_summary_service, "mysql_insert", SQLiteUpsert)
+    await seed(db)
+
+    # 단건 승인과 일괄 승인 모두 승인 시점 수당을 기록
+    await approve_overtime(1, OvertimeSelect(), current_user=MANAGER, db=db)
+    await bulk_process_overtimes_service(db, [2], True, None, MANAGER)
+    assert await summaries(db) == {1: (1, 10000, 0, 0), 2: (0, 0, 1, 20000)}
+    assert dict((await db.execute(select(Overtimes.id, Overtimes.approved_money).where(Overtimes.id.in_([1, 2])))).all()) == {1: 10000, 2: 20000}
+
+    # 승인 이후 정책 금액 변경
+    await db.execute(update(OverTimePolicies).values(common_ot_30=15000, common_ot_60=30000))
+    await db.commit()
+
+    # 반려하면 현재 정책이 아니라 승인 시 더한 금액만큼 차감 (단건/일괄 교차)
+    await bulk_process_overtimes_service(db, [1], False, None, MANAGER)
+    await reject_overtime(2, OvertimeSelect(), current_user=MANAGER, db=db)
+    assert await summaries(db) == {1: (0, 0, 0, 0), 2: (0, 0, 0, 0)}
+    assert await history_money(db) == {1: 0, 2: 0}
+
+    # 정책 변경 이후 승인은 새 금액, 재계산도 승인 시 기록한 금액 기준이라 증감 반영 결과와 같음
+    await bulk_process_overtimes_service(db, [3], True, None, MANAGER)
+    incremental = await summaries(db)
+    assert incremental[1] == (1, 15000, 0, 0)
+
+    await rebuild_overtime_monthly_summaries(db, 2024, 3)
+    assert await summaries(db) == {1: incremental[1]}
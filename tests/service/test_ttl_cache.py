@@ -0,0 +1,70 @@
+from app.middleware.jwt.jwtCache import JWTVerificationCache
+from app.middleware.principal_cache import Principal, PrincipalCache
+from app.service.closed_day_calendar_cache import BranchMonthCalendar, ClosedDayCalendarCache
+from app.utils.ttl_cache import TTLCache
+
+EMPTY = BranchMonthCalendar(hospital_closed_days=(), user_off_days={}, early_clock_ins=())
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_entries_expire_and_are_bounded_by_lru():
+    clock = Clock()
+    cache = TTLCache(maxsize=2, ttl=10, clock=clock)
+    cache.store("a", 1)
+    cache.store("b", 2)
+    assert cache.lookup("a") == 1
+    cache.store("c", 3)  # b가 가장 오래 사용되지 않아 제거됨
+
+    assert cache.lookup("b") is None and cache.evictions == 1
+    clock.now = 10
+    assert cache.lookup("a") is None and len(cache) == 1
+    # 만료 시각을 직접 지정
+    cache.store("d", 4, expires_at=20)
+    assert cache.lookup("d", now=19.9) == 4 and cache.lookup("d", now=20) is None
+    assert cache.stats() | {"hit_ratio": None} == {
+        "size": 1, "maxsize": 2, "ttl": 10, "hits": 2, "misses": 3, "hit_ratio": None, "evictions": 1
+    }
+
+
+def test_principal_index_follows_expiry_and_eviction():
+    cache = PrincipalCache(maxsize=1, ttl=60)
+    principal = Principal.from_row(1, "사원", 1, None, "N")
+    cache.set(1, 100, principal)
+    cache.set(2, 100, principal)
+
+    # LRU로 제거된 항목은 사용자별 색인에서도 빠짐
+    assert cache.get(1, 100) is None and cache.get(2, 100) is principal
+    assert cache._keys_by_user == {2: {(2, 100)}}
+    cache.invalidate(2)
+    assert cache.get(2, 100) is None and cache._keys_by_user == {}
+    assert cache.stats()["invalidations"] == 1
+
+
+def test_clear_semantics():
+    # 휴무 캘린더: clear는 generation도 초기화, invalidate_all은 항목만 비우고 generation 증가
+    cache = ClosedDayCalendarCache()
+    cache.invalidate(1)
+    generation = cache.generation(1)
+    cache.invalidate_all()
+    assert cache.generation(1) != generation
+    cache.clear()
+    assert cache.generation(1) == (1, 0)
+
+    # JWT: 저장/조회 모두 payload 사본
+    jwt_cache = JWTVerificationCache(maxsize=2)
+    payload = {"id": 1, "exp": 200}
+    jwt_cache.set(b"token", payload, payload["exp"])
+    payload["id"] = 2
+    cached = jwt_cache.get(b"token", 100)
+    cached["id"] = 3
+    assert jwt_cache.get(b"token", 100) == {"id": 1, "exp": 200}
+    assert jwt_cache.get(b"token", 200) is None
+    jwt_cache.clear()
+    assert jwt_cache.stats()["size"] == 0